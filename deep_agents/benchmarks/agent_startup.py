@@ -0,0 +1,59 @@
+"""Benchmark cold and warm construction of the task tool and its sub-agents.
+
+Services that build agents per request call _create_task_tool every time. The
+first (cold) call compiles each sub-agent graph; later (warm) calls with the same
+model and tools hit the process-wide sub-agent cache.
+
+Run from the deep_agents directory:
+    python -m benchmarks.agent_startup
+"""
+
+import os
+import time
+
+# Dummy credentials so the research tools module can be imported offline
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from benchmarks.task_concurrency import StubChatModel  # noqa: E402
+from src.deep_agents_from_scratch.file_tools import grep, ls, read_file, search_files, write_file  # noqa: E402
+from src.deep_agents_from_scratch.research_tools import tavily_search, think_tool  # noqa: E402
+from src.deep_agents_from_scratch.state import DeepAgentState  # noqa: E402
+from src.deep_agents_from_scratch.task_tool import _create_task_tool, clear_subagent_cache  # noqa: E402
+
+ROUNDS = 20
+TOOLS = [ls, read_file, write_file, grep, search_files, tavily_search, think_tool]
+SUBAGENTS = [
+    {"name": "research-agent", "description": "Web research", "prompt": "Research.", "tools": ["tavily_search", "think_tool"]},
+    {"name": "files-agent", "description": "File work", "prompt": "Organize files.", "tools": ["ls", "read_file", "write_file"]},
+    {"name": "general-agent", "description": "Anything else", "prompt": "Help."},
+]
+
+
+def build(model) -> float:
+    """Return seconds taken to build the task tool once."""
+    start = time.perf_counter()
+    _create_task_tool(TOOLS, SUBAGENTS, model, DeepAgentState)
+    return time.perf_counter() - start
+
+
+def main():
+    model = StubChatModel()
+
+    cold = 0.0
+    for _ in range(ROUNDS):
+        clear_subagent_cache()
+        cold += build(model)
+    cold /= ROUNDS
+
+    build(model)
+    warm = sum(build(model) for _ in range(ROUNDS)) / ROUNDS
+
+    print(f"sub-agents: {len(SUBAGENTS)}")
+    print(f"cold: {cold * 1000:.2f} ms")
+    print(f"warm: {warm * 1000:.2f} ms")
+    print(f"speedup: {cold / warm:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
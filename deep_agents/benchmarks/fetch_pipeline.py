@@ -0,0 +1,119 @@
+"""Benchmark the fetch-and-summarize pipeline behind tavily_search.
+
+Serves stub pages from a local HTTP server with injected latency and replaces the
+summarization model with a stub that sleeps, then compares the old serial loop
+against the concurrent process_search_results, with and without a warm page cache.
+
+Run from the deep_agents directory:
+    python -m benchmarks.fetch_pipeline
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+from markdownify import markdownify
+
+# Dummy credentials so the research tools module can be imported offline
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from src.deep_agents_from_scratch import research_tools  # noqa: E402
+from src.deep_agents_from_scratch.page_cache import PageCache  # noqa: E402
+from src.deep_agents_from_scratch.research_tools import Summary  # noqa: E402
+
+FETCH_LATENCY = 0.3
+SUMMARY_LATENCY = 0.5
+MAX_RESULTS = 5
+PAGE = "<html><body><h1>Stub page</h1>" + "<p>Lorem ipsum dolor sit amet.</p>" * 200 + "</body></html>"
+
+
+class StubPageHandler(BaseHTTPRequestHandler):
+    """Serve the same HTML page after a fixed delay."""
+
+    def do_GET(self):
+        time.sleep(FETCH_LATENCY)
+        body = PAGE.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def stub_summarize(webpage_content: str) -> Summary:
+    time.sleep(SUMMARY_LATENCY)
+    return Summary(filename="stub.md", summary=webpage_content[:100])
+
+
+async def stub_asummarize(webpage_content: str) -> Summary:
+    await asyncio.sleep(SUMMARY_LATENCY)
+    return Summary(filename="stub.md", summary=webpage_content[:100])
+
+
+def serial_process_search_results(results: dict) -> list[dict]:
+    """The original implementation: fresh client, serial fetch, serial summaries."""
+    processed_results = []
+    client = httpx.Client()
+    for result in results.get("results", []):
+        response = client.get(result["url"])
+        raw_content = markdownify(response.text)
+        summary_obj = stub_summarize(raw_content)
+        processed_results.append({"url": result["url"], "summary": summary_obj.summary})
+    return processed_results
+
+
+def main():
+    server = ThreadingHTTPServer(("0.0.0.0", 0), StubPageHandler)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # Distinct loopback addresses stand in for distinct hosts (Linux routes all of 127/8)
+    results = {
+        "results": [
+            {"url": f"http://127.0.0.{i + 1}:{port}/page", "title": f"Page {i}", "content": ""}
+            for i in range(MAX_RESULTS)
+        ]
+    }
+    research_tools._asummarize_webpage_content = stub_asummarize
+    research_tools.page_cache = None
+
+    start = time.perf_counter()
+    serial_process_search_results(results)
+    serial = time.perf_counter() - start
+
+    # Warm the pooled client once, then measure steady-state calls
+    research_tools.process_search_results(results)
+    start = time.perf_counter()
+    processed = research_tools.process_search_results(results)
+    concurrent = time.perf_counter() - start
+
+    # Repeat the same search against a warm on-disk cache
+    with tempfile.TemporaryDirectory() as cache_dir:
+        research_tools.page_cache = PageCache(os.path.join(cache_dir, "pages.sqlite"))
+        research_tools.process_search_results(results)
+        start = time.perf_counter()
+        research_tools.process_search_results(results)
+        cached = time.perf_counter() - start
+        cache_stats = research_tools.page_cache.stats()
+
+    server.shutdown()
+    assert [r["url"] for r in processed] == [r["url"] for r in results["results"]]
+
+    print(f"results per search: {MAX_RESULTS}")
+    print(f"fetch latency: {FETCH_LATENCY:.2f}s, summary latency: {SUMMARY_LATENCY:.2f}s")
+    print(f"serial:     {serial:.2f}s")
+    print(f"concurrent: {concurrent:.2f}s")
+    print(f"speedup:    {serial / concurrent:.1f}x")
+    print(f"cached:     {cached:.3f}s (hits={cache_stats['hits']}, misses={cache_stats['misses']})")
+
+
+if __name__ == "__main__":
+    main()
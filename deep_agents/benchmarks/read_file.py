@@ -0,0 +1,49 @@
+"""Benchmark paged read_file calls against file size.
+
+Compares splitting the whole file on every call (the previous read_file) with
+slicing the requested window through the cached line index.
+
+Run from the deep_agents directory:
+    python -m benchmarks.read_file
+"""
+
+import time
+
+from src.deep_agents_from_scratch.file_tools import read_file
+
+LINE_COUNTS = [1_000, 10_000, 100_000, 500_000]
+LIMIT = 50
+ROUNDS = 20
+
+
+def splitlines_read(content: str, offset: int, limit: int) -> str:
+    """The previous implementation: split the whole file, then take the window."""
+    lines = content.splitlines()
+    end_idx = min(offset + limit, len(lines))
+    return "\n".join(f"{i + 1:6d}\t{lines[i][:2000]}" for i in range(offset, end_idx))
+
+
+def main():
+    print(f"{'lines':>8} {'splitlines (ms)':>16} {'indexed (ms)':>13} {'speedup':>8}")
+    for line_count in LINE_COUNTS:
+        content = "\n".join(f"line {i}: some search result text" for i in range(line_count))
+        state = {"files": {"big.md": content}}
+        offset = line_count - LIMIT * 2
+
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            expected = splitlines_read(content, offset, LIMIT)
+        baseline = (time.perf_counter() - start) / ROUNDS
+
+        # First call builds the index (write_file does this at write time)
+        assert read_file.func("big.md", state, offset, LIMIT) == expected
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            read_file.func("big.md", state, offset, LIMIT)
+        indexed = (time.perf_counter() - start) / ROUNDS
+
+        print(f"{line_count:>8} {baseline * 1000:>16.3f} {indexed * 1000:>13.3f} {baseline / indexed:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
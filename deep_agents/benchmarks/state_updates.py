@@ -0,0 +1,105 @@
+"""Benchmark files state updates through a real checkpointed graph.
+
+A one-node graph writes one new file per step for a fixed number of steps, on
+top of a virtual filesystem of file_count files, compiled with InMemorySaver.
+The previous pattern (the node mutates state["files"] and returns the whole
+dict, merged with {**left, **right}) is compared with delta updates applied by
+file_reducer. Reported are the mean wall time per step and the bytes the
+checkpointer stored, counting channel blobs and pending writes.
+
+Delta updates keep the pending writes proportional to the change, but
+LangGraph still stores the whole merged files channel in every checkpoint in
+which it changed, so checkpoint size grows with the filesystem in both modes.
+
+Run from the deep_agents directory:
+    python -m benchmarks.state_updates
+"""
+
+import time
+from typing import Annotated, NotRequired
+
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, StateGraph
+from typing_extensions import TypedDict
+
+from src.deep_agents_from_scratch.state import file_reducer
+
+FILE_COUNTS = [100, 1000, 5000]
+FILE_SIZE = 4000
+STEPS = 10
+
+
+def previous_file_reducer(left, right):
+    """The previous reducer: merge the whole dict returned by the tool."""
+    if left is None:
+        return right
+    elif right is None:
+        return left
+    else:
+        return {**left, **right}
+
+
+class PreviousState(TypedDict):
+    step: int
+    files: Annotated[NotRequired[dict[str, str]], previous_file_reducer]
+
+
+class DeltaState(TypedDict):
+    step: int
+    files: Annotated[NotRequired[dict[str, str]], file_reducer]
+
+
+def full_dict_write(state: PreviousState) -> dict:
+    """Mutate the injected dict and send all of it back."""
+    files = state["files"]
+    files[f"new_file_{state['step']}.md"] = "y" * FILE_SIZE
+    return {"step": state["step"] + 1, "files": files}
+
+
+def delta_write(state: DeltaState) -> dict:
+    """Send only the changed path."""
+    return {"step": state["step"] + 1, "files": {f"new_file_{state['step']}.md": "y" * FILE_SIZE}}
+
+
+def build(state_schema, node):
+    builder = StateGraph(state_schema)
+    builder.add_node("write", node)
+    builder.add_edge(START, "write")
+    builder.add_conditional_edges("write", lambda state: END if state["step"] >= STEPS else "write")
+    saver = InMemorySaver()
+    return builder.compile(checkpointer=saver), saver
+
+
+def stored_bytes(saver: InMemorySaver) -> int:
+    """Bytes of channel values and pending writes held by the checkpointer."""
+    blobs = sum(len(value) for _, value in saver.blobs.values())
+    writes = sum(
+        len(value[2][1])
+        for thread_writes in saver.writes.values()
+        for value in thread_writes.values()
+    )
+    return blobs + writes
+
+
+def measure(state_schema, node, file_count: int) -> tuple[float, int]:
+    """Return mean seconds per step and stored checkpoint bytes for one run."""
+    graph, saver = build(state_schema, node)
+    files = {f"search_result_{i}.md": "x" * FILE_SIZE for i in range(file_count)}
+    start = time.perf_counter()
+    graph.invoke({"step": 0, "files": files}, {"configurable": {"thread_id": "1"}})
+    return (time.perf_counter() - start) / STEPS, stored_bytes(saver)
+
+
+def main():
+    print(f"steps: {STEPS}, bytes per file: {FILE_SIZE}, checkpointer: InMemorySaver")
+    print(f"{'files':>6} {'full dict (ms/step)':>20} {'delta (ms/step)':>16} "
+          f"{'full dict (MB stored)':>22} {'delta (MB stored)':>18}")
+    for file_count in FILE_COUNTS:
+        full_time, full_bytes = measure(PreviousState, full_dict_write, file_count)
+        delta_time, delta_bytes = measure(DeltaState, delta_write, file_count)
+        print(f"{file_count:>6} {full_time * 1000:>20.1f} {delta_time * 1000:>16.1f} "
+              f"{full_bytes / 1e6:>22.1f} {delta_bytes / 1e6:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark parallel task delegation with stub sub-agent models.
+
+The parent turn emits N task calls at once. Each sub-agent uses a stub chat model
+that waits a fixed latency before answering. Sequential execution (the previous
+behavior) is compared with the async task tool run through a ToolNode.
+
+Run from the deep_agents directory:
+    python -m benchmarks.task_concurrency
+"""
+
+import asyncio
+import time
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.graph import END, START, StateGraph
+from langgraph.prebuilt import ToolNode
+
+from src.deep_agents_from_scratch.state import DeepAgentState
+from src.deep_agents_from_scratch.task_tool import _create_task_tool
+
+MODEL_LATENCY = 0.5
+TASK_COUNTS = [1, 2, 4, 8]
+
+
+class StubChatModel(BaseChatModel):
+    """Chat model that answers immediately with a final message after a delay."""
+
+    latency: float = MODEL_LATENCY
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage("done"))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage("done"))])
+
+
+def parent_turn(task_count: int) -> dict:
+    """Parent state whose last message delegates task_count tasks at once."""
+    tool_calls = [
+        {
+            "name": "task",
+            "args": {"description": f"Research topic {i}", "subagent_type": "research-agent"},
+            "id": f"call_{i}",
+        }
+        for i in range(task_count)
+    ]
+    return {"messages": [AIMessage("", tool_calls=tool_calls)], "files": {}}
+
+
+async def main():
+    subagents = [{"name": "research-agent", "description": "Researches", "prompt": "Research.", "tools": []}]
+    task = _create_task_tool(
+        [], subagents, StubChatModel(), DeepAgentState, max_concurrency=max(TASK_COUNTS)
+    )
+    # Run the tool node inside a graph so state and tool call ids are injected
+    builder = StateGraph(DeepAgentState)
+    builder.add_node("tools", ToolNode([task]))
+    builder.add_edge(START, "tools")
+    builder.add_edge("tools", END)
+    graph = builder.compile()
+
+    print(f"model latency: {MODEL_LATENCY:.2f}s")
+    print(f"{'tasks':>6} {'sequential (s)':>15} {'concurrent (s)':>15}")
+    for task_count in TASK_COUNTS:
+        state = parent_turn(task_count)
+
+        start = time.perf_counter()
+        for tool_call in state["messages"][-1].tool_calls:
+            task.invoke({**tool_call, "type": "tool_call", "args": {**tool_call["args"], "state": state}})
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = await graph.ainvoke(state)
+        concurrent = time.perf_counter() - start
+        assert [m.tool_call_id for m in result["messages"][1:]] == [f"call_{i}" for i in range(task_count)]
+
+        print(f"{task_count:>6} {sequential:>15.2f} {concurrent:>15.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
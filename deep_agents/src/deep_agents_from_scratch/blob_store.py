@@ -0,0 +1,132 @@
+"""Local content-addressed storage for bodies too large to keep in agent state.
+
+Oversized raw webpage content is written here and referenced from the virtual
+filesystem, so checkpoints only carry a bounded excerpt plus a blob reference.
+read_file resolves such references (file_path="blob:<sha256>") through the
+shared blob_store instance.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from src.deep_agents_from_scratch.page_cache import DEFAULT_CACHE_DIR
+
+BLOB_PREFIX = "blob:"
+
+
+class BlobStore:
+    """Write-once text blobs on local disk, addressed by SHA-256.
+
+    Blobs are evicted least recently used first (by file mtime, refreshed on
+    every read) once their total size exceeds max_bytes.
+
+    Args:
+        root: Directory holding the blobs
+        max_bytes: Upper bound on the total size of stored blobs
+    """
+
+    def __init__(
+        self,
+        root: str | Path = DEFAULT_CACHE_DIR / "blobs",
+        max_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._total: int | None = None
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def _blobs(self) -> list[Path]:
+        """Return stored blob files, skipping in-flight temporary files."""
+        if not self.root.exists():
+            return []
+        return [path for path in self.root.glob("*/*") if len(path.name) == 64]
+
+    def put(self, data: str) -> str:
+        """Store text and return its reference.
+
+        Args:
+            data: Text to store
+
+        Returns:
+            Reference of the form blob:<sha256>
+        """
+        raw = data.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._path(digest)
+        try:
+            os.utime(path)
+            return f"{BLOB_PREFIX}{digest}"
+        except FileNotFoundError:
+            pass
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+        # Readers only ever see complete blobs
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._total is None:
+                self._total = sum(blob.stat().st_size for blob in self._blobs())
+            else:
+                self._total += len(raw)
+            if self._total > self.max_bytes:
+                self._evict(keep=path)
+        return f"{BLOB_PREFIX}{digest}"
+
+    def _evict(self, keep: Path) -> None:
+        """Delete least recently used blobs until the store fits in max_bytes."""
+        entries = []
+        for blob in self._blobs():
+            try:
+                stat = blob.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, blob))
+        total = sum(size for _, size, _ in entries)
+        for _, size, blob in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            if blob == keep:
+                continue
+            blob.unlink(missing_ok=True)
+            self.evictions += 1
+            total -= size
+        self._total = total
+
+    def get(self, ref: str) -> str:
+        """Load the text stored under a reference.
+
+        Args:
+            ref: Reference returned by put
+
+        Returns:
+            The stored text
+
+        Raises:
+            KeyError: If the reference is malformed or the blob does not exist
+                (never stored, or evicted)
+        """
+        digest = ref[len(BLOB_PREFIX):] if ref.startswith(BLOB_PREFIX) else ""
+        if len(digest) != 64 or not all(c in "0123456789abcdef" for c in digest):
+            raise KeyError(ref)
+        path = self._path(digest)
+        try:
+            data = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except FileNotFoundError:
+            raise KeyError(ref) from None
+        return data
+
+
+# Shared store used by the research tools to offload pages and by read_file to
+# resolve blob references
+blob_store = BlobStore()
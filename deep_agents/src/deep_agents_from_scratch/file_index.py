@@ -0,0 +1,196 @@
+"""Line-offset and full-text indexes for files in the virtual filesystem.
+
+This module keeps, per file, the character offset at which each line
+starts. Paged reads can then slice just the requested window of lines instead of
+splitting the whole file, and searches can map a match position to its line
+number with a binary search. Each file also gets an inverted index of its lines,
+which bm25_search combines across files to rank passages for a query.
+
+Indexes are cached in process memory keyed by file path, so they never enter
+agent state or checkpoints, and each holds only the current content of its path.
+A lookup is O(1) when it is passed the very string that was indexed; a string
+with a different identity (e.g. deserialized from a checkpoint) is checked by
+length and then compared once, and the cache adopts it. Only files whose
+content changes are re-indexed; writes prime the cache so the first read is
+already O(limit).
+"""
+
+import math
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+
+# Same line boundaries as str.splitlines()
+_LINE_BREAK = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+_TOKEN = re.compile(r"\w+")
+
+MAX_CACHED_INDEXES = 512
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+class LineIndex:
+    """Start offsets of every line in a file's content.
+
+    Args:
+        content: The file content to index
+    """
+
+    __slots__ = ("content", "offsets", "_terms")
+
+    def __init__(self, content: str):
+        self.content = content
+        self._terms: TermIndex | None = None
+        self.offsets = array("q", [0])
+        self.offsets.extend(match.end() for match in _LINE_BREAK.finditer(content))
+        # A trailing line break does not start another line (matches splitlines)
+        if len(self.offsets) > 1 and self.offsets[-1] == len(content):
+            self.offsets.pop()
+        if not content:
+            self.offsets.pop()
+
+    def __len__(self) -> int:
+        """Return the number of lines."""
+        return len(self.offsets)
+
+    def lines(self, start: int, end: int) -> list[str]:
+        """Return lines [start, end) without touching the rest of the content."""
+        end = min(end, len(self.offsets))
+        if start >= end:
+            return []
+        stop = self.offsets[end] if end < len(self.offsets) else len(self.content)
+        return self.content[self.offsets[start]:stop].splitlines()
+
+    def line_number(self, position: int) -> int:
+        """Return the 0-based line containing a character position."""
+        return bisect_right(self.offsets, position) - 1
+
+    @property
+    def terms(self) -> "TermIndex":
+        """Inverted index of the file's lines, built on first access."""
+        if self._terms is None:
+            self._terms = TermIndex(self.content)
+        return self._terms
+
+
+class TermIndex:
+    """Inverted index over the lines of a single file.
+
+    Args:
+        content: The file content to index
+    """
+
+    __slots__ = ("postings", "line_lengths", "total_length")
+
+    def __init__(self, content: str):
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        self.line_lengths = array("l")
+        for line_number, line in enumerate(content.splitlines()):
+            tokens = tokenize(line)
+            self.line_lengths.append(len(tokens))
+            for term, count in Counter(tokens).items():
+                self.postings.setdefault(term, []).append((line_number, count))
+        self.total_length = sum(self.line_lengths)
+
+
+_indexes: OrderedDict[str, LineIndex] = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_line_index(path: str, content: str) -> LineIndex:
+    """Return the line index for a file, building it when its content changed.
+
+    Args:
+        path: The file path, used as the cache key
+        content: The current file content
+
+    Returns:
+        Cached LineIndex for the content
+    """
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is not None and (
+            index.content is content
+            or (len(index.content) == len(content) and index.content == content)
+        ):
+            # Share the caller's string so the cache never pins a second copy
+            index.content = content
+            _indexes.move_to_end(path)
+            return index
+
+    index = LineIndex(content)
+    with _indexes_lock:
+        _indexes[path] = index
+        _indexes.move_to_end(path)
+        while len(_indexes) > MAX_CACHED_INDEXES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def index_file(path: str, content: str) -> LineIndex:
+    """Build and cache both the line and term indexes for newly written content.
+
+    Args:
+        path: The file path, used as the cache key
+        content: The file content
+
+    Returns:
+        Cached LineIndex with its TermIndex built
+    """
+    index = get_line_index(path, content)
+    index.terms
+    return index
+
+
+def bm25_search(files: dict[str, str], query: str, max_results: int = 10) -> list[tuple[float, str, int]]:
+    """Rank the lines of all files against a query with BM25.
+
+    Each line is scored as a document; collection statistics (line count,
+    average line length, document frequencies) span every file passed in.
+
+    Args:
+        files: Virtual filesystem mapping paths to content
+        query: Free-text query
+        max_results: Maximum number of hits to return
+
+    Returns:
+        (score, path, 0-based line number) tuples, best first
+    """
+    query_terms = set(tokenize(query))
+    if not query_terms:
+        return []
+
+    term_indexes = {path: get_line_index(path, content).terms for path, content in files.items()}
+    num_lines = sum(len(terms.line_lengths) for terms in term_indexes.values())
+    total_length = sum(terms.total_length for terms in term_indexes.values())
+    if not num_lines or not total_length:
+        return []
+    avg_length = total_length / num_lines
+
+    idf = {}
+    for term in query_terms:
+        df = sum(len(terms.postings.get(term, ())) for terms in term_indexes.values())
+        if df:
+            idf[term] = math.log(1 + (num_lines - df + 0.5) / (df + 0.5))
+
+    scores: dict[tuple[str, int], float] = {}
+    for path, terms in term_indexes.items():
+        for term, term_idf in idf.items():
+            for line_number, count in terms.postings.get(term, ()):
+                length_norm = 1 - BM25_B + BM25_B * terms.line_lengths[line_number] / avg_length
+                score = term_idf * count * (BM25_K1 + 1) / (count + BM25_K1 * length_norm)
+                key = (path, line_number)
+                scores[key] = scores.get(key, 0.0) + score
+
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    return [(score, path, line_number) for (path, line_number), score in ranked[:max_results]]
@@ -4,6 +4,7 @@ This module provides tools for managing a virtual filesystem stored in agent sta
 enabling context offloading and information persistence across agent interactions.
 """
 
+import re
 from typing import Annotated
 
 from langchain_core.messages import ToolMessage
@@ -11,9 +12,13 @@ from langchain_core.tools import InjectedToolCallId, tool
 from langgraph.prebuilt import InjectedState
 from langgraph.types import Command
 
+from src.deep_agents_from_scratch.blob_store import BLOB_PREFIX, blob_store
+from src.deep_agents_from_scratch.file_index import bm25_search, get_line_index, index_file
 from src.deep_agents_from_scratch.prompts import (
+    GREP_DESCRIPTION,
     LS_DESCRIPTION,
     READ_FILE_DESCRIPTION,
+    SEARCH_FILES_DESCRIPTION,
     WRITE_FILE_DESCRIPTION,
 )
 from src.deep_agents_from_scratch.state import DeepAgentState
@@ -35,7 +40,7 @@ def read_file(
     """Read file content from virtual filesystem with optional offset and limit.
 
     Args:
-        file_path: Path to the file to read
+        file_path: Path to the file to read, or a blob:<sha256> reference
         state: Agent state containing virtual filesystem (injected in tool node)
         offset: Line number to start reading from (default: 0)
         limit: Maximum number of lines to read (default: 2000)
@@ -44,23 +49,28 @@ def read_file(
         Formatted file content with line numbers, or error message if file not found
     """
     files = state.get("files", {})
-    if file_path not in files:
+    if file_path in files:
+        content = files[file_path]
+    elif file_path.startswith(BLOB_PREFIX):
+        # Full bodies of oversized pages live outside agent state
+        try:
+            content = blob_store.get(file_path)
+        except KeyError:
+            return f"Error: Content '{file_path}' is no longer available; search again"
+    else:
         return f"Error: File '{file_path}' not found"
 
-    content = files[file_path]
     if not content:
         return "System reminder: File exists but has empty contents"
 
-    lines = content.splitlines()
-    start_idx = offset
-    end_idx = min(start_idx + limit, len(lines))
-
-    if start_idx >= len(lines):
-        return f"Error: Line offset {offset} exceeds file length ({len(lines)} lines)"
+    # Only the requested window is sliced out, using the cached line index
+    index = get_line_index(file_path, content)
+    if offset >= len(index):
+        return f"Error: Line offset {offset} exceeds file length ({len(index)} lines)"
 
     result_lines = []
-    for i in range(start_idx, end_idx):
-        line_content = lines[i][:2000]  # Truncate long lines
+    for i, line in enumerate(index.lines(offset, offset + limit), start=offset):
+        line_content = line[:2000]  # Truncate long lines
         result_lines.append(f"{i + 1:6d}\t{line_content}")
 
     return "\n".join(result_lines)
@@ -84,13 +94,90 @@ def write_file(
     Returns:
         Command to update agent state with new file content
     """
-    files = state.get("files", {})
-    files[file_path] = content
+    # Index at write time so later paged reads are O(limit) and searches are warm
+    index_file(file_path, content)
     return Command(
         update={
-            "files": files,
+            "files": {file_path: content},
             "messages": [
                 ToolMessage(f"Updated file {file_path}", tool_call_id=tool_call_id)
             ],
         }
     )
+
+
+@tool(description=GREP_DESCRIPTION, parse_docstring=True)
+def grep(
+    pattern: str,
+    state: Annotated[DeepAgentState, InjectedState],
+    file_path: str | None = None,
+    max_matches: int = 50,
+) -> str:
+    """Search file contents in the virtual filesystem with a regular expression.
+
+    Args:
+        pattern: Regular expression to search for
+        state: Agent state containing virtual filesystem (injected in tool node)
+        file_path: Only search this file (default: search all files)
+        max_matches: Maximum number of matching lines to return (default: 50)
+
+    Returns:
+        Matching lines formatted as path:line_number: content, or a message if none match
+    """
+    try:
+        regex = re.compile(pattern, re.MULTILINE)
+    except re.error as e:
+        return f"Error: Invalid pattern '{pattern}': {e}"
+
+    files = state.get("files", {})
+    if file_path is not None:
+        if file_path not in files:
+            return f"Error: File '{file_path}' not found"
+        files = {file_path: files[file_path]}
+
+    results = []
+    for path, content in files.items():
+        index = get_line_index(path, content)
+        last_line = -1
+        for match in regex.finditer(content):
+            line = index.line_number(match.start())
+            if line == last_line:
+                continue
+            last_line = line
+            line_content = index.lines(line, line + 1)[0][:2000]
+            results.append(f"{path}:{line + 1}: {line_content}")
+            if len(results) >= max_matches:
+                results.append(f"... stopped after {max_matches} matches")
+                return "\n".join(results)
+
+    if not results:
+        return f"No matches found for '{pattern}'"
+    return "\n".join(results)
+
+
+@tool(description=SEARCH_FILES_DESCRIPTION, parse_docstring=True)
+def search_files(
+    query: str,
+    state: Annotated[DeepAgentState, InjectedState],
+    max_results: int = 10,
+) -> str:
+    """Rank passages across all files in the virtual filesystem by relevance to a query.
+
+    Args:
+        query: Free-text search query
+        state: Agent state containing virtual filesystem (injected in tool node)
+        max_results: Maximum number of hits to return (default: 10)
+
+    Returns:
+        Ranked hits formatted as path:line_number (score): passage, or a message if none match
+    """
+    files = state.get("files", {})
+    hits = bm25_search(files, query, max_results=max_results)
+    if not hits:
+        return f"No matches found for '{query}'"
+
+    results = []
+    for score, path, line_number in hits:
+        passage = get_line_index(path, files[path]).lines(line_number, line_number + 1)[0][:300]
+        results.append(f"{path}:{line_number + 1} ({score:.2f}): {passage}")
+    return "\n".join(results)
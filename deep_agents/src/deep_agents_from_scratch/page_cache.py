@@ -0,0 +1,215 @@
+"""Persistent cache for fetched webpages and their summaries.
+
+This module provides a content-addressed on-disk cache used by the research tools
+so that URLs returned by repeated searches skip both the network fetch and the
+summarization model call.
+
+Two tables back the cache:
+- urls: maps a URL to the hash of the markdown last fetched from it (TTL-bound)
+- pages: maps a content hash to the markdown and its summary (size-bound LRU)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from typing_extensions import TypedDict
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("DEEP_AGENTS_CACHE_DIR", Path.home() / ".cache" / "deep_agents")
+)
+
+
+class CachedPage(TypedDict):
+    """A cached webpage.
+
+    Attributes:
+        content_hash: SHA-256 of the markdown content
+        markdown: Webpage content converted to markdown
+        summary: Serialized Summary (filename and summary fields)
+    """
+
+    content_hash: str
+    markdown: str
+    summary: dict
+
+
+class PageCache:
+    """SQLite-backed page and summary cache with TTL and LRU size eviction.
+
+    Args:
+        path: Location of the SQLite database file
+        ttl_seconds: How long a URL maps to its cached content before refetching
+        max_bytes: Upper bound on stored markdown and summary bytes
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_DIR / "pages.sqlite",
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.summary_hits = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @staticmethod
+    def content_hash(markdown: str) -> str:
+        """Return the content address for a markdown body."""
+        return hashlib.sha256(markdown.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the schema."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS urls (
+                    url TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS pages (
+                    content_hash TEXT PRIMARY KEY,
+                    markdown TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS pages_last_access ON pages (last_access);
+                """
+            )
+        return self._conn
+
+    def _load_page(self, conn: sqlite3.Connection, content_hash: str) -> CachedPage | None:
+        """Read a page by hash and mark it as recently used."""
+        row = conn.execute(
+            "SELECT markdown, summary FROM pages WHERE content_hash = ?", (content_hash,)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(
+            "UPDATE pages SET last_access = ? WHERE content_hash = ?",
+            (time.time(), content_hash),
+        )
+        conn.commit()
+        return CachedPage(content_hash=content_hash, markdown=row[0], summary=json.loads(row[1]))
+
+    def get_url(self, url: str) -> CachedPage | None:
+        """Look up the page last fetched from a URL, if it is still fresh.
+
+        Args:
+            url: The webpage URL
+
+        Returns:
+            The cached page, or None on a miss or an expired entry
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT content_hash, fetched_at FROM urls WHERE url = ?", (url,)
+            ).fetchone()
+            page = None
+            if row is not None and time.time() - row[1] < self.ttl_seconds:
+                page = self._load_page(conn, row[0])
+            if page is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return page
+
+    def get_content(self, markdown: str) -> CachedPage | None:
+        """Look up a page by its content, e.g. after refetching an expired URL.
+
+        Args:
+            markdown: Freshly fetched markdown content
+
+        Returns:
+            The cached page with the same content, or None
+        """
+        with self._lock:
+            page = self._load_page(self._connect(), self.content_hash(markdown))
+            if page is not None:
+                self.summary_hits += 1
+            return page
+
+    def put(self, url: str, markdown: str, summary: dict) -> None:
+        """Store a page and its summary, then evict down to the size bound.
+
+        Args:
+            url: The webpage URL
+            markdown: Webpage content converted to markdown
+            summary: Serialized Summary for the content
+        """
+        content_hash = self.content_hash(markdown)
+        summary_json = json.dumps(summary)
+        size = len(markdown.encode("utf-8")) + len(summary_json.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)",
+                (content_hash, markdown, summary_json, size, now),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO urls VALUES (?, ?, ?)", (url, content_hash, now)
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired URLs and least recently used pages beyond max_bytes."""
+        conn.execute(
+            "DELETE FROM urls WHERE fetched_at < ?", (time.time() - self.ttl_seconds,)
+        )
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for content_hash, size in conn.execute(
+            "SELECT content_hash, size FROM pages ORDER BY last_access"
+        ).fetchall():
+            conn.execute("DELETE FROM pages WHERE content_hash = ?", (content_hash,))
+            conn.execute("DELETE FROM urls WHERE content_hash = ?", (content_hash,))
+            self.evictions += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size, for sizing the cache."""
+        with self._lock:
+            conn = self._connect()
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "summary_hits": self.summary_hits,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        """Remove all cached entries and reset the counters."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM urls")
+            conn.execute("DELETE FROM pages")
+            conn.commit()
+            self.hits = self.misses = self.summary_hits = self.evictions = 0
@@ -55,7 +55,7 @@ READ_FILE_DESCRIPTION = """Read content from a file in the virtual filesystem wi
 This tool returns file content with line numbers (like `cat -n`) and supports reading large files in chunks to avoid context overflow.
 
 Parameters:
-- file_path (required): Path to the file you want to read
+- file_path (required): Path to the file you want to read, or a blob:<sha256> reference given in a truncated search result
 - offset (optional, default=0): Line number to start reading from  
 - limit (optional, default=2000): Maximum number of lines to read
 
@@ -71,13 +71,30 @@ Parameters:
 
 Important: This replaces the entire file content."""
 
+GREP_DESCRIPTION = """Search the contents of files in the virtual filesystem with a regular expression.
+
+Returns matching lines as `path:line_number: content`, so you can locate passages without reading whole files. Use the line numbers as the offset for a targeted read_file call.
+
+Parameters:
+- pattern (required): Regular expression to search for (^ and $ match at line boundaries)
+- file_path (optional): Only search this file; searches all files by default
+- max_matches (optional, default=50): Maximum number of matching lines to return"""
+
+SEARCH_FILES_DESCRIPTION = """Search all files in the virtual filesystem for passages relevant to a free-text query.
+
+Returns the best-matching lines ranked by relevance (BM25) as `path:line_number (score): passage`. Prefer this over reading whole files when you need specific facts from collected sources, then read_file around the returned line numbers for more context.
+
+Parameters:
+- query (required): Keywords or a short question describing what you are looking for
+- max_results (optional, default=10): Maximum number of hits to return"""
+
 FILE_USAGE_INSTRUCTIONS = """You have access to a virtual file system to help you retain and save context.
 
 ## Workflow Process
 1. **Orient**: Use ls() to see existing files before starting work
 2. **Save**: Use write_file() to store the user's request so that we can keep it for later 
 3. **Research**: Proceed with research. The search tool will write files.  
-4. **Read**: Once you are satisfied with the collected sources, read the files and use them to answer the user's question directly.
+4. **Read**: Once you are satisfied with the collected sources, read the files and use them to answer the user's question directly. Use search_files() or grep() to find specific passages and read only the lines around them.
 """
 
 SUMMARIZE_WEB_SEARCH = """You are creating a minimal summary for research steering - your goal is to help an agent know what information it has collected, NOT to preserve all details.
@@ -106,6 +123,31 @@ Output format:
 Today's date: {date}
 """
 
+SUMMARIZE_WEB_SEARCH_BATCH = """You are creating minimal summaries for research steering - your goal is to help an agent know what information it has collected, NOT to preserve all details.
+
+Below are {count} webpages. Summarize each one independently; never mix information between webpages.
+
+{webpages}
+
+For EACH webpage, create a VERY CONCISE summary focusing on:
+1. Main topic/subject in 1-2 sentences
+2. Key information type (facts, tutorial, news, analysis, etc.)
+3. Most significant 1-2 findings or points
+
+Keep each summary under 150 words. Generate a descriptive filename for each webpage that indicates the content type and topic (e.g., "mcp_protocol_overview.md").
+
+Return exactly {count} summaries, in the same order as the webpages:
+```json
+{{
+   "summaries": [
+      {{"filename": "descriptive_filename.md", "summary": "Very brief summary of webpage 1"}}
+   ]
+}}
+```
+
+Today's date: {date}
+"""
+
 RESEARCHER_INSTRUCTIONS = """You are a research assistant conducting research on the user's input topic. For context, today's date is {date}.
 
 <Task>
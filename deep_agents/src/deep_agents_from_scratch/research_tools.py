@@ -3,7 +3,9 @@
 This module provides search and content processing utilities for the research agent,
 including web search capabilities and content summarization tools.
 """
+import asyncio
 import os
+import threading
 from datetime import datetime
 import uuid, base64
 
@@ -18,7 +20,10 @@ from pydantic import BaseModel, Field
 from tavily import TavilyClient
 from typing_extensions import Annotated, Literal
 
-from src.deep_agents_from_scratch.prompts import SUMMARIZE_WEB_SEARCH
+from src.deep_agents_from_scratch.blob_store import blob_store
+from src.deep_agents_from_scratch.file_index import index_file
+from src.deep_agents_from_scratch.page_cache import PageCache
+from src.deep_agents_from_scratch.prompts import SUMMARIZE_WEB_SEARCH, SUMMARIZE_WEB_SEARCH_BATCH
 from src.deep_agents_from_scratch.state import DeepAgentState
 
 # Summarization model
@@ -27,11 +32,47 @@ summarization_model = init_chat_model("gemini-2.5-flash", model_provider="google
 
 tavily_client = TavilyClient()
 
+# Fetch-and-summarize pipeline limits
+FETCH_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+MAX_CONCURRENT_FETCHES = 10  # bounded fan-out across all hosts
+MAX_CONNECTIONS_PER_HOST = 2
+MAX_CONCURRENT_SUMMARIES = 5
+
+# Batched summarization packs several pages into one model call, up to a token budget
+BATCH_SUMMARIES = False
+SUMMARY_BATCH_TOKEN_BUDGET = 30000
+MAX_PAGES_PER_BATCH = 8
+
+# The pipeline runs on a dedicated background event loop which owns the pooled
+# HTTP client, so connections are reused across tool calls and graph runs.
+_io_loop: asyncio.AbstractEventLoop | None = None
+_io_loop_lock = threading.Lock()
+_http_client: httpx.AsyncClient | None = None
+_fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+_summary_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+_host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+# On-disk cache of fetched pages and summaries; set to None to disable
+page_cache: PageCache | None = PageCache()
+
+# Raw content ingestion limits: pages are streamed up to MAX_PAGE_BYTES, and raw
+# content beyond the token budget is kept on disk rather than in agent state
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+RAW_CONTENT_TOKEN_BUDGET = 8000
+CHARS_PER_TOKEN = 4  # rough estimate, avoids a tokenizer dependency
+
+ingestion_stats = {"files": 0, "offloaded_files": 0, "bytes_saved": 0}
+_ingestion_stats_lock = threading.Lock()
+
 class Summary(BaseModel):
     """Schema for webpage content summarization."""
     filename: str = Field(description="Name of the file to store.")
     summary: str = Field(description="Key learnings from the webpage.")
 
+class SummaryBatch(BaseModel):
+    """Schema for summarizing several webpages in one call."""
+    summaries: list[Summary] = Field(description="One summary per webpage, in input order.")
+
 def get_today_str() -> str:
     """Get current date in a human-readable format."""
     return datetime.now().strftime("%a %b %-d, %Y")
@@ -62,6 +103,22 @@ def run_tavily_search(
 
     return result
 
+def _summarization_messages(webpage_content: str) -> list[HumanMessage]:
+    """Build the summarization prompt for a single webpage."""
+    return [
+        HumanMessage(content=SUMMARIZE_WEB_SEARCH.format(
+            webpage_content=webpage_content,
+            date=get_today_str()
+        ))
+    ]
+
+def _fallback_summary(webpage_content: str) -> Summary:
+    """Build a basic summary object from truncated raw content."""
+    return Summary(
+        filename="search_result.md",
+        summary=webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
+    )
+
 def summarize_webpage_content(webpage_content: str) -> Summary:
     """Summarize webpage content using the configured summarization model.
 
@@ -76,70 +133,308 @@ def summarize_webpage_content(webpage_content: str) -> Summary:
         structured_model = summarization_model.with_structured_output(Summary)
 
         # Generate summary
-        summary_and_filename = structured_model.invoke([
-            HumanMessage(content=SUMMARIZE_WEB_SEARCH.format(
-                webpage_content=webpage_content,
-                date=get_today_str()
-            ))
-        ])
-
-        return summary_and_filename
+        return structured_model.invoke(_summarization_messages(webpage_content))
 
     except Exception:
         # Return a basic summary object on failure
-        return Summary(
-            filename="search_result.md",
-            summary=webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
+        return _fallback_summary(webpage_content)
+
+async def asummarize_webpage_content(webpage_content: str) -> Summary:
+    """Async variant of summarize_webpage_content.
+
+    Args:
+        webpage_content: Raw webpage content to summarize
+
+    Returns:
+        Summary object with filename and summary
+    """
+    try:
+        return await _asummarize_webpage_content(webpage_content)
+    except Exception:
+        return _fallback_summary(webpage_content)
+
+async def _asummarize_webpage_content(webpage_content: str) -> Summary:
+    """Summarize webpage content, raising if the model call fails."""
+    structured_model = summarization_model.with_structured_output(Summary)
+    return await structured_model.ainvoke(_summarization_messages(webpage_content))
+
+async def _asummarize_webpage_batch(contents: list[str]) -> list[Summary]:
+    """Summarize several webpages with a single model call, raising on failure."""
+    webpages = "\n\n".join(
+        f'<webpage index="{i}">\n{content}\n</webpage>' for i, content in enumerate(contents, 1)
+    )
+    structured_model = summarization_model.with_structured_output(SummaryBatch)
+    batch = await structured_model.ainvoke([
+        HumanMessage(content=SUMMARIZE_WEB_SEARCH_BATCH.format(
+            count=len(contents),
+            webpages=webpages,
+            date=get_today_str()
+        ))
+    ])
+    return batch.summaries
+
+def _get_io_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting it on first use."""
+    global _io_loop
+    with _io_loop_lock:
+        if _io_loop is None:
+            _io_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_io_loop.run_forever, name="research-tools-io", daemon=True
+            ).start()
+    return _io_loop
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared, pooled HTTP client (only used from the background loop)."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=FETCH_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_FETCHES,
+                max_keepalive_connections=MAX_CONCURRENT_FETCHES,
+            ),
         )
+    return _http_client
+
+async def _fetch_url(url: str) -> tuple[int, str] | None:
+    """Stream a URL under the global and per-host concurrency limits.
+
+    The body is read incrementally and cut off at MAX_PAGE_BYTES, so very large
+    pages never have to be held in memory in full.
+
+    Returns:
+        The HTTP status code and decoded body, or None if the request failed or timed out
+    """
+    host = httpx.URL(url).host
+    host_semaphore = _host_semaphores.setdefault(
+        host, asyncio.Semaphore(MAX_CONNECTIONS_PER_HOST)
+    )
+    async with host_semaphore, _fetch_semaphore:
+        try:
+            async with _get_http_client().stream("GET", url) as response:
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body.extend(chunk[:MAX_PAGE_BYTES - len(body)])
+                    if len(body) >= MAX_PAGE_BYTES:
+                        break
+                return response.status_code, body.decode(response.encoding or "utf-8", errors="replace")
+        except httpx.HTTPError:
+            return None
+
+async def _cache_summary(url: str, raw_content: str, summary_obj: Summary) -> None:
+    """Store a successful summary in the page cache, if enabled."""
+    if page_cache is not None:
+        await asyncio.to_thread(page_cache.put, url, raw_content, summary_obj.model_dump())
+
+async def _summarize_one(raw_content: str) -> Summary | None:
+    """Summarize one page under the summary limit, or return None on failure."""
+    async with _summary_semaphore:
+        try:
+            return await _asummarize_webpage_content(raw_content)
+        except Exception:
+            return None
+
+async def _summarize_batch(contents: list[str]) -> list[Summary | None]:
+    """Summarize a packed batch in one call, falling back to per-page calls."""
+    if len(contents) > 1:
+        async with _summary_semaphore:
+            try:
+                summaries = await _asummarize_webpage_batch(contents)
+            except Exception:
+                summaries = []
+        if len(summaries) == len(contents):
+            return summaries
+    return list(await asyncio.gather(*(_summarize_one(content) for content in contents)))
+
+def _pack_batches(contents: list[str]) -> list[list[int]]:
+    """Greedily group page indexes into batches that fit SUMMARY_BATCH_TOKEN_BUDGET."""
+    batches = []
+    current, current_tokens = [], 0
+    for i, content in enumerate(contents):
+        tokens = len(content) // CHARS_PER_TOKEN + 1
+        if current and (
+            current_tokens + tokens > SUMMARY_BATCH_TOKEN_BUDGET
+            or len(current) >= MAX_PAGES_PER_BATCH
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+async def _summarize_batched(contents: list[str]) -> list[Summary | None]:
+    """Summarize pages in token-budgeted batches, running the batches concurrently."""
+    summaries: list[Summary | None] = [None] * len(contents)
+    batches = _pack_batches(contents)
+    batch_results = await asyncio.gather(
+        *(_summarize_batch([contents[i] for i in batch]) for batch in batches)
+    )
+    for batch, batch_summaries in zip(batches, batch_results):
+        for i, summary_obj in zip(batch, batch_summaries):
+            summaries[i] = summary_obj
+    return summaries
+
+async def _load_page(result: dict) -> tuple[str, Summary | None]:
+    """Fetch a search result's page, resolving its summary from the cache if possible.
+
+    Returns:
+        Raw markdown content and its summary, or None if it still needs summarizing
+    """
+    # Get url
+    url = result['url']
+
+    # Serve repeat URLs from the cache without touching the network or the model
+    if page_cache is not None:
+        cached = await asyncio.to_thread(page_cache.get_url, url)
+        if cached is not None:
+            return cached['markdown'], Summary(**cached['summary'])
+
+    # Read url
+    response = await _fetch_url(url)
+
+    if response is None or response[0] != 200:
+        # Use Tavily's generated summary
+        return result.get('raw_content') or '', Summary(
+            filename="URL_error.md",
+            summary=result.get('content', 'Error reading URL; try another search.')
+        )
+
+    # Convert HTML to markdown off the event loop
+    raw_content = await asyncio.to_thread(markdownify, response[1])
+
+    # Reuse the summary of identical content fetched from another URL or earlier
+    if page_cache is not None:
+        cached = await asyncio.to_thread(page_cache.get_content, raw_content)
+        if cached is not None:
+            await asyncio.to_thread(page_cache.put, url, raw_content, cached['summary'])
+            return raw_content, Summary(**cached['summary'])
+
+    return raw_content, None
+
+async def _load_and_summarize(result: dict) -> tuple[str, Summary]:
+    """Fetch and summarize a single search result."""
+    raw_content, summary_obj = await _load_page(result)
+    if summary_obj is None:
+        summary_obj = await _summarize_one(raw_content)
+        if summary_obj is None:
+            # Failed summaries are not cached so the next search retries them
+            return raw_content, _fallback_summary(raw_content)
+        await _cache_summary(result['url'], raw_content, summary_obj)
+    return raw_content, summary_obj
+
+async def _load_and_summarize_batched(search_results: list[dict]) -> list[tuple[str, Summary]]:
+    """Fetch all search results, then summarize the uncached pages in batches."""
+    pages = list(await asyncio.gather(*(_load_page(result) for result in search_results)))
+    pending = [i for i, (_, summary_obj) in enumerate(pages) if summary_obj is None]
+    summaries = await _summarize_batched([pages[i][0] for i in pending])
+
+    for i, summary_obj in zip(pending, summaries):
+        raw_content = pages[i][0]
+        if summary_obj is None:
+            summary_obj = _fallback_summary(raw_content)
+        else:
+            await _cache_summary(search_results[i]['url'], raw_content, summary_obj)
+        pages[i] = (raw_content, summary_obj)
+    return pages
+
+def _processed_result(result: dict, raw_content: str, summary_obj: Summary) -> dict:
+    """Build the processed result record with a uniquified filename."""
+    # uniquify file names
+    uid = base64.urlsafe_b64encode(uuid.uuid4().bytes).rstrip(b"=").decode("ascii")[:8]
+    name, ext = os.path.splitext(summary_obj.filename)
+    summary_obj.filename = f"{name}_{uid}{ext}"
+
+    return {
+        'url': result['url'],
+        'title': result['title'],
+        'summary': summary_obj.summary,
+        'filename': summary_obj.filename,
+        'raw_content': raw_content,
+    }
+
+async def _aprocess_search_results(results: dict) -> list[dict]:
+    """Fetch and summarize all search results concurrently, preserving order."""
+    search_results = results.get('results', [])
+    if BATCH_SUMMARIES:
+        pages = await _load_and_summarize_batched(search_results)
+    else:
+        pages = await asyncio.gather(*(_load_and_summarize(result) for result in search_results))
+    return [
+        _processed_result(result, raw_content, summary_obj)
+        for result, (raw_content, summary_obj) in zip(search_results, pages)
+    ]
+
+def summarize_webpage_contents(contents: list[str]) -> list[Summary]:
+    """Summarize several webpages, packing them into as few model calls as the budget allows.
+
+    Pages are grouped into batches of up to SUMMARY_BATCH_TOKEN_BUDGET tokens and
+    MAX_PAGES_PER_BATCH pages. If a batch call fails or returns the wrong number of
+    summaries, its pages are summarized one call each.
+
+    Args:
+        contents: Raw webpage contents to summarize
+
+    Returns:
+        One Summary per webpage, in input order
+    """
+    future = asyncio.run_coroutine_threadsafe(_summarize_batched(contents), _get_io_loop())
+    return [
+        summary_obj if summary_obj is not None else _fallback_summary(content)
+        for content, summary_obj in zip(contents, future.result())
+    ]
 
 def process_search_results(results: dict) -> list[dict]:
     """Process search results by summarizing content where available.
 
+    Pages are fetched and summarized concurrently on the shared background loop,
+    so the call costs roughly one fetch plus one summarization latency. With
+    BATCH_SUMMARIES enabled, uncached pages are summarized in packed batches.
+
     Args:
         results: Tavily search results dictionary
 
     Returns:
-        List of processed results with summaries
+        List of processed results with summaries, in the original result order
     """
-    processed_results = []
+    future = asyncio.run_coroutine_threadsafe(
+        _aprocess_search_results(results), _get_io_loop()
+    )
+    return future.result()
 
-    # Create a client for HTTP requests
-    HTTPX_CLIENT = httpx.Client()
+def _ingest_raw_content(raw_content: str) -> tuple[str, int]:
+    """Bound the raw content kept in agent state to RAW_CONTENT_TOKEN_BUDGET.
 
-    for result in results.get('results', []):
+    Oversized content is written to the blob store and replaced by its first
+    budget's worth of characters plus a reference to the full body.
 
-        # Get url
-        url = result['url']
+    Args:
+        raw_content: Full raw content of a page
 
-        # Read url
-        response = HTTPX_CLIENT.get(url)
+    Returns:
+        Content to store in the file and number of bytes kept out of state
+    """
+    budget_chars = RAW_CONTENT_TOKEN_BUDGET * CHARS_PER_TOKEN
+    offloaded = len(raw_content) > budget_chars
+    saved = 0
+    if offloaded:
+        ref = blob_store.put(raw_content)
+        full_size = len(raw_content.encode("utf-8"))
+        excerpt = raw_content[:budget_chars]
+        saved = full_size - len(excerpt.encode("utf-8"))
+        raw_content = (
+            f"{excerpt}\n\n[Truncated to ~{RAW_CONTENT_TOKEN_BUDGET} tokens; "
+            f"full content ({full_size} bytes) stored outside agent state; "
+            f"read it with read_file(\"{ref}\")]"
+        )
 
-        if response.status_code == 200:
-            # Convert HTML to markdown
-            raw_content = markdownify(response.text)
-            summary_obj = summarize_webpage_content(raw_content)
-        else:
-            # Use Tavily's generated summary
-            raw_content = result.get('raw_content', '')
-            summary_obj = Summary(
-                filename="URL_error.md",
-                summary=result.get('content', 'Error reading URL; try another search.')
-            )
-
-        # uniquify file names
-        uid = base64.urlsafe_b64encode(uuid.uuid4().bytes).rstrip(b"=").decode("ascii")[:8]
-        name, ext = os.path.splitext(summary_obj.filename)
-        summary_obj.filename = f"{name}_{uid}{ext}"
-
-        processed_results.append({
-            'url': result['url'],
-            'title': result['title'],
-            'summary': summary_obj.summary,
-            'filename': summary_obj.filename,
-            'raw_content': raw_content,
-        })
-
-    return processed_results
+    with _ingestion_stats_lock:
+        ingestion_stats["files"] += 1
+        ingestion_stats["offloaded_files"] += offloaded
+        ingestion_stats["bytes_saved"] += saved
+    return raw_content, saved
 
 @tool(parse_docstring=True)
 def tavily_search(
@@ -175,15 +470,20 @@ def tavily_search(
     # Process and summarize results
     processed_results = process_search_results(search_results)
 
-    # Save each result to a file and prepare summary
-    files = state.get("files", {})
+    # Save each result to a file and prepare summary (only new files go in the update)
+    files = {}
     saved_files = []
     summaries = []
+    bytes_saved = 0
 
     for i, result in enumerate(processed_results):
         # Use the AI-generated filename from summarization
         filename = result['filename']
 
+        # Keep checkpointed state bounded regardless of page size
+        raw_content, saved = _ingest_raw_content(result['raw_content'] or '')
+        bytes_saved += saved
+
         # Create file content with full details
         file_content = f"""# Search Result: {result['title']}
 
@@ -195,10 +495,11 @@ def tavily_search(
 {result['summary']}
 
 ## Raw Content
-{result['raw_content'] if result['raw_content'] else 'No raw content available'}
+{raw_content if raw_content else 'No raw content available'}
 """
 
         files[filename] = file_content
+        index_file(filename, file_content)
         saved_files.append(filename)
         summaries.append(f"- {filename}: {result['summary']}...")
 
@@ -209,6 +510,8 @@ def tavily_search(
 
 Files: {', '.join(saved_files)}
 💡 Use read_file() to access full details when needed."""
+    if bytes_saved:
+        summary_text += f"\n📦 Kept {bytes_saved} bytes of oversized raw content out of agent state."
 
     return Command(
         update={
@@ -24,25 +24,50 @@ class Todo(TypedDict):
     status: Literal["pending", "in_progress", "completed"]
 
 
+FILE_DELETED = None
+"""Value in a files update that removes the path from the virtual filesystem."""
+
+
 def file_reducer(left, right):
-    """Merge two file dictionaries, with right side taking precedence.
+    """Apply a delta of changed files to the virtual file system.
+
+    Used as a reducer function for the files field in agent state. Updates carry
+    only the paths that changed; a path mapped to FILE_DELETED is removed. The
+    existing dictionary is returned untouched when the delta changes nothing, and
+    otherwise shallow-copied once (file contents are shared, never copied) since
+    LangGraph may hand the same value to several readers.
 
-    Used as a reducer function for the files field in agent state,
-    allowing incremental updates to the virtual file system.
+    Deltas keep tool updates (and the pending writes a checkpointer stores for
+    them) proportional to the change. The merged dict is still a single channel
+    value, so a checkpointer stores all of it at every step that changes it.
 
     Args:
         left: Left side dictionary (existing files)
-        right: Right side dictionary (new/updated files)
+        right: Right side dictionary (changed paths, FILE_DELETED for removals)
 
     Returns:
-        Merged dictionary with right values overriding left values
+        Files dictionary with the delta applied
     """
     if left is None:
-        return right
-    elif right is None:
+        left = {}
+    if right is None:
         return left
-    else:
-        return {**left, **right}
+
+    changes = {
+        path: content
+        for path, content in right.items()
+        if content is not left.get(path, FILE_DELETED)
+    }
+    if not changes:
+        return left
+
+    merged = dict(left)
+    for path, content in changes.items():
+        if content is FILE_DELETED:
+            merged.pop(path, None)
+        else:
+            merged[path] = content
+    return merged
 
 
 class DeepAgentState(AgentState):
@@ -50,7 +75,8 @@ class DeepAgentState(AgentState):
 
     Inherits from LangGraph's AgentState and adds:
     - todos: List of Todo items for task planning and progress tracking
-    - files: Virtual file system stored as dict mapping filenames to content
+    - files: Virtual file system stored as dict mapping filenames to content,
+      updated with deltas of changed paths (see file_reducer)
     """
 
     todos: NotRequired[list[Todo]]
@@ -5,51 +5,161 @@ with isolated contexts. Sub-agents prevent context clash by operating with clean
 context windows containing only their specific task description.
 """
 
+import asyncio
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from fnmatch import fnmatchcase
 from typing import Annotated, NotRequired
 from typing_extensions import TypedDict
 
+from pydantic import BaseModel, Field
+
 from langchain_core.messages import ToolMessage
-from langchain_core.tools import BaseTool, InjectedToolCallId, tool
+from langchain_core.tools import BaseTool, InjectedToolCallId, StructuredTool, tool
 from langgraph.prebuilt import InjectedState, create_react_agent
 from langgraph.types import Command
 
 from src.deep_agents_from_scratch.prompts import TASK_DESCRIPTION_PREFIX
-from src.deep_agents_from_scratch.state import DeepAgentState
+from src.deep_agents_from_scratch.state import FILE_DELETED, DeepAgentState
 
 
 class SubAgent(TypedDict):
-    """Configuration for a specialized sub-agent."""
+    """Configuration for a specialized sub-agent.
+
+    Attributes:
+        name: Identifier used as the task tool's subagent_type
+        description: What the sub-agent is for, shown to the parent agent
+        prompt: System prompt for the sub-agent
+        tools: Names of the tools the sub-agent may use (default: all tools)
+        files: Glob patterns of parent files the sub-agent can see
+            (default: all files; an empty list gives it an empty filesystem)
+    """
 
     name: str
     description: str
     prompt: str
     tools: NotRequired[list[str]]
+    files: NotRequired[list[str]]
+
+
+class TaskInput(BaseModel):
+    """Arguments of the task tool, declared once instead of inferred per tool build."""
+
+    description: str = Field(description="The task for the sub-agent to carry out")
+    subagent_type: str = Field(description="Name of the sub-agent to delegate to")
+    state: Annotated[DeepAgentState, InjectedState]
+    tool_call_id: Annotated[str, InjectedToolCallId]
+
+
+# Process-wide LRU of compiled sub-agent graphs, keyed on the identity of the
+# model and tool objects (plus prompt hash and state schema). Equal-looking models
+# or same-named tools may carry different credentials, callbacks or request-scoped
+# clients, so only the very same objects share a graph. Each entry keeps its model
+# and tools alive, so their ids cannot be reused while the entry is cached; the
+# LRU bound limits how many such objects are retained.
+MAX_CACHED_SUBAGENTS = 32
+_subagent_graphs: OrderedDict[tuple, tuple] = OrderedDict()
+_subagent_graphs_lock = threading.Lock()
+
+
+def _get_subagent_graph(model, prompt: str, tools: list, state_schema):
+    """Return a compiled ReAct sub-agent, building it only on a cache miss.
+
+    Graphs are keyed by (model instance, prompt hash, tool instances, state
+    schema). Reuse the same model and tool objects across calls to benefit from
+    the cache.
+    """
+    key = (
+        id(model),
+        hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        tuple(id(tool_) for tool_ in tools),
+        state_schema,
+    )
+    with _subagent_graphs_lock:
+        if key in _subagent_graphs:
+            _subagent_graphs.move_to_end(key)
+            return _subagent_graphs[key][0]
+
+    graph = create_react_agent(model, prompt=prompt, tools=tools, state_schema=state_schema)
+    with _subagent_graphs_lock:
+        entry = _subagent_graphs.setdefault(key, (graph, model, tuple(tools)))
+        _subagent_graphs.move_to_end(key)
+        while len(_subagent_graphs) > MAX_CACHED_SUBAGENTS:
+            _subagent_graphs.popitem(last=False)
+        return entry[0]
+
+
+def clear_subagent_cache() -> None:
+    """Drop all cached sub-agent graphs, e.g. after changing a model or tool in place."""
+    with _subagent_graphs_lock:
+        _subagent_graphs.clear()
+
 
+def _scoped_files(files: dict[str, str], patterns: list[str] | None) -> dict[str, str]:
+    """Select the parent files visible to a sub-agent.
 
-def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
+    The returned dict is new, but file contents are shared with the parent rather
+    than copied.
+    """
+    if patterns is None:
+        return dict(files)
+    return {
+        path: content
+        for path, content in files.items()
+        if any(fnmatchcase(path, pattern) for pattern in patterns)
+    }
+
+
+def _changed_files(before: dict[str, str], after: dict[str, str]) -> dict:
+    """Return the delta that turns the files a sub-agent started with into its result.
+
+    Sending only changed paths (with FILE_DELETED for removals) lets concurrent
+    sub-agents merge cleanly: one sub-agent's untouched copy of a file can never
+    overwrite another sub-agent's edit.
+    """
+    delta = {path: content for path, content in after.items() if before.get(path) != content}
+    delta.update({path: FILE_DELETED for path in before if path not in after})
+    return delta
+
+
+def _create_task_tool(
+    tools, subagents: list[SubAgent], model, state_schema, max_concurrency: int = 4
+):
     """Create a task delegation tool that enables context isolation through sub-agents.
 
     This function implements the core pattern for spawning specialized sub-agents with
     isolated contexts, preventing context clash and confusion in complex multi-step tasks.
 
+    The tool supports both sync and async execution. When the parent agent runs
+    asynchronously, several task calls from one turn run concurrently (up to
+    max_concurrency at once) via ainvoke. Their file updates are applied in tool
+    call order, so the merged result does not depend on which finishes first.
+
+    Compiled sub-agent graphs are cached process-wide (see clear_subagent_cache),
+    so building the tool repeatedly with the same model and tool objects is cheap.
+
     Args:
         tools: List of available tools that can be assigned to sub-agents
         subagents: List of specialized sub-agent configurations
         model: The language model to use for all agents
         state_schema: The state schema (typically DeepAgentState)
+        max_concurrency: Maximum number of sub-agents running at once (async only)
 
     Returns:
         A 'task' tool that can delegate work to specialized sub-agents
     """
-    # Create agent registry
+    # Create agent registry and per-agent file visibility
     agents = {}
+    file_scopes = {}
 
     # Build tool name mapping for selective tool assignment
+    # (original objects are kept so cached sub-agent graphs match across calls)
     tools_by_name = {}
     for tool_ in tools:
-        if not isinstance(tool_, BaseTool):
-            tool_ = tool(tool_)
-        tools_by_name[tool_.name] = tool_
+        name = tool_.name if isinstance(tool_, BaseTool) else tool(tool_).name
+        tools_by_name[name] = tool_
 
     # Create specialized sub-agents based on configurations
     for _agent in subagents:
@@ -59,16 +169,56 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
         else:
             # Default to all tools
             _tools = tools
-        agents[_agent["name"]] = create_react_agent(
-            model, prompt=_agent["prompt"], tools=_tools, state_schema=state_schema
+        agents[_agent["name"]] = _get_subagent_graph(
+            model, _agent["prompt"], _tools, state_schema
         )
+        file_scopes[_agent["name"]] = _agent.get("files")
 
     # Generate description of available sub-agents for the tool description
     other_agents_string = [
         f"- {_agent['name']}: {_agent['description']}" for _agent in subagents
     ]
 
-    @tool(description=TASK_DESCRIPTION_PREFIX.format(other_agents=other_agents_string))
+    # One semaphore per event loop, since asyncio primitives are bound to a loop
+    semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore() -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if loop not in semaphores:
+            semaphores[loop] = asyncio.Semaphore(max_concurrency)
+        return semaphores[loop]
+
+    def _subagent_input(description: str, files: dict[str, str]) -> dict:
+        """Create isolated context with only the task description and scoped files.
+
+        This is the key to context isolation - no parent history, TODOs, or files
+        outside the sub-agent's scope. Each call builds a fresh input, so
+        concurrent sub-agents never share mutable state with each other or with
+        the parent.
+        """
+        return {
+            "messages": [{"role": "user", "content": description}],
+            "files": files,
+        }
+
+    def _task_result(files: dict[str, str], result: dict, tool_call_id: str) -> Command:
+        """Return results to parent agent via Command state update."""
+        return Command(
+            update={
+                # Merge only the files the sub-agent changed within its scope
+                "files": _changed_files(files, result.get("files", files)),
+                "messages": [
+                    # Sub-agent result becomes a ToolMessage in parent context
+                    ToolMessage(
+                        result["messages"][-1].content, tool_call_id=tool_call_id
+                    )
+                ],
+            }
+        )
+
+    def _unknown_agent_error(subagent_type: str) -> str:
+        return f"Error: invoked agent of type {subagent_type}, the only allowed types are {[f'`{k}`' for k in agents]}"
+
     def task(
         description: str,
         subagent_type: str,
@@ -82,29 +232,34 @@ def _create_task_tool(tools, subagents: list[SubAgent], model, state_schema):
         """
         # Validate requested agent type exists
         if subagent_type not in agents:
-            return f"Error: invoked agent of type {subagent_type}, the only allowed types are {[f'`{k}`' for k in agents]}"
-
-        # Get the requested sub-agent
-        sub_agent = agents[subagent_type]
-
-        # Create isolated context with only the task description
-        # This is the key to context isolation - no parent history
-        state["messages"] = [{"role": "user", "content": description}]
+            return _unknown_agent_error(subagent_type)
 
         # Execute the sub-agent in isolation
-        result = sub_agent.invoke(state)
+        files = _scoped_files(state.get("files", {}), file_scopes[subagent_type])
+        result = agents[subagent_type].invoke(_subagent_input(description, files))
+        return _task_result(files, result, tool_call_id)
 
-        # Return results to parent agent via Command state update
-        return Command(
-            update={
-                "files": result.get("files", {}),  # Merge any file changes
-                "messages": [
-                    # Sub-agent result becomes a ToolMessage in parent context
-                    ToolMessage(
-                        result["messages"][-1].content, tool_call_id=tool_call_id
-                    )
-                ],
-            }
-        )
+    async def atask(
+        description: str,
+        subagent_type: str,
+        state: Annotated[DeepAgentState, InjectedState],
+        tool_call_id: Annotated[str, InjectedToolCallId],
+    ):
+        """Delegate a task to a specialized sub-agent with isolated context."""
+        if subagent_type not in agents:
+            return _unknown_agent_error(subagent_type)
+
+        files = _scoped_files(state.get("files", {}), file_scopes[subagent_type])
+        async with _semaphore():
+            result = await agents[subagent_type].ainvoke(
+                _subagent_input(description, files)
+            )
+        return _task_result(files, result, tool_call_id)
 
-    return task
+    return StructuredTool.from_function(
+        func=task,
+        coroutine=atask,
+        name="task",
+        args_schema=TaskInput,
+        description=TASK_DESCRIPTION_PREFIX.format(other_agents=other_agents_string),
+    )
@@ -0,0 +1,100 @@
+"""Benchmark sequential, concurrent and batched webpage summarization.
+
+Each search in the fixture set returns three pages, taken from the markdown files
+checked into this repository. The summarization model is replaced by a stub whose
+latency is a fixed per-request overhead plus a per-token cost, which is the cost
+shape batching targets. The benchmark counts model calls and wall-clock time per
+search for per-page calls made one at a time (the previous behavior), per-page
+calls made concurrently, and batched calls.
+
+Run from the deep_research_langgraph directory:
+    python -m benchmarks.batch_summarization
+"""
+
+import asyncio
+import os
+import re
+import time
+from pathlib import Path
+
+# Dummy credentials so the research utilities can be imported offline
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from src.deep_research_from_scratch import utils  # noqa: E402
+from src.deep_research_from_scratch.state_research import Summary, SummaryBatch  # noqa: E402
+
+REQUEST_OVERHEAD = 0.4
+SECONDS_PER_TOKEN = 0.00002
+RESULTS_PER_SEARCH = 3
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+class StubStructuredModel:
+    """Structured-output stub that sleeps like a remote model and counts calls."""
+
+    def __init__(self, schema, stats):
+        self.schema = schema
+        self.stats = stats
+
+    async def ainvoke(self, messages):
+        prompt = messages[-1].content
+        await asyncio.sleep(REQUEST_OVERHEAD + len(prompt) / utils.CHARS_PER_TOKEN * SECONDS_PER_TOKEN)
+        self.stats["calls"] += 1
+        if self.schema is SummaryBatch:
+            count = len(re.findall(r'<webpage index="\d+">', prompt))
+            return SummaryBatch(summaries=[Summary(summary="stub", key_excerpts="stub")] * count)
+        return Summary(summary="stub", key_excerpts="stub")
+
+
+class StubModel:
+    def __init__(self):
+        self.stats = {"calls": 0}
+
+    def with_structured_output(self, schema):
+        return StubStructuredModel(schema, self.stats)
+
+
+def load_fixture_searches() -> list[dict]:
+    """Group the repository's markdown files into fixture searches of three pages each."""
+    pages = sorted(REPO_ROOT.glob("*/README.md")) + sorted(REPO_ROOT.glob("*/notebooks/files/*.md"))
+    results = [
+        {"url": f"https://example.com/{path.parent.name}/{path.name}", "title": path.stem,
+         "content": "", "raw_content": path.read_text(encoding="utf-8")}
+        for path in pages
+    ]
+    return [
+        {url_result["url"]: url_result for url_result in results[i:i + RESULTS_PER_SEARCH]}
+        for i in range(0, len(results) - RESULTS_PER_SEARCH + 1, RESULTS_PER_SEARCH)
+    ]
+
+
+def run(searches: list[dict], batch: bool, concurrency: int) -> tuple[int, float]:
+    """Return total model calls and seconds for processing every fixture search."""
+    utils.BATCH_SUMMARIZATION = batch
+    utils.MAX_CONCURRENT_SUMMARIES = concurrency
+    utils.summarization_model = StubModel()
+    start = time.perf_counter()
+    for i, unique_results in enumerate(searches):
+        # A fresh run per search so the per-run summary cache does not hide model calls
+        utils.process_search_results(unique_results, run_key=f"{batch}-{concurrency}-{i}")
+    return utils.summarization_model.stats["calls"], time.perf_counter() - start
+
+
+def main():
+    searches = load_fixture_searches()
+    concurrency = utils.MAX_CONCURRENT_SUMMARIES
+    modes = {
+        "sequential": run(searches, batch=False, concurrency=1),
+        "concurrent": run(searches, batch=False, concurrency=concurrency),
+        "batched": run(searches, batch=True, concurrency=concurrency),
+    }
+
+    print(f"searches: {len(searches)}, pages per search: {RESULTS_PER_SEARCH}")
+    print(f"{'mode':>10} {'calls/search':>13} {'seconds/search':>15}")
+    for mode, (calls, seconds) in modes.items():
+        print(f"{mode:>10} {calls / len(searches):>13.1f} {seconds / len(searches):>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
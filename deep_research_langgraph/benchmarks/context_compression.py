@@ -0,0 +1,91 @@
+"""Benchmark researcher prompt sizes with and without rolling context compression.
+
+A stub researcher runs a fixed number of search turns, each returning a large
+tool output, before answering. Stub models record the size of every prompt they
+receive. Without rolling compression every llm_call re-sends all earlier tool
+outputs and the final compression call receives the whole history; with it,
+older outputs are folded into short research summaries.
+
+Run from the deep_research_langgraph directory:
+    python -m benchmarks.context_compression
+"""
+
+import asyncio
+import math
+import os
+
+# Dummy credentials so the research agent can be imported offline
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from langchain_core.language_models import BaseChatModel  # noqa: E402
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage  # noqa: E402
+from langchain_core.outputs import ChatGeneration, ChatResult  # noqa: E402
+from langchain_core.tools import tool  # noqa: E402
+
+from src.deep_research_from_scratch import research_agent  # noqa: E402
+from src.deep_research_from_scratch.utils import CHARS_PER_TOKEN  # noqa: E402
+
+SEARCH_TURNS = 12
+TOOL_OUTPUT_TOKENS = 6000
+SUMMARY_TOKENS = 500
+
+
+class RecordingChatModel(BaseChatModel):
+    """Chat model that records prompt sizes in tokens and answers instantly."""
+
+    prompt_tokens: list = []
+    role: str = "researcher"
+
+    @property
+    def _llm_type(self) -> str:
+        return "recording"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.prompt_tokens.append(sum(len(str(m.content)) for m in messages) // CHARS_PER_TOKEN)
+        if self.role == "compressor":
+            message = AIMessage("s" * SUMMARY_TOKENS * CHARS_PER_TOKEN)
+        elif sum(isinstance(m, ToolMessage) for m in messages) < SEARCH_TURNS:
+            turn = sum(isinstance(m, AIMessage) for m in messages)
+            message = AIMessage("", tool_calls=[{"name": "tavily_search", "args": {"query": f"q{turn}"}, "id": f"call_{turn}"}])
+        else:
+            message = AIMessage("done")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+@tool
+def tavily_search(query: str) -> str:
+    """Stub search returning a large result."""
+    return f"results for {query} " + "x" * TOOL_OUTPUT_TOKENS * CHARS_PER_TOKEN
+
+
+async def run(threshold: float) -> tuple[list[int], list[int]]:
+    """Return prompt token counts of researcher and compressor calls for one research run."""
+    research_agent.context_token_threshold = threshold
+    research_agent.model_with_tools = RecordingChatModel(prompt_tokens=[])
+    research_agent.compress_model = RecordingChatModel(prompt_tokens=[], role="compressor")
+    await research_agent.researcher_agent.ainvoke({
+        "researcher_messages": [HumanMessage(content="topic")],
+        "research_topic": "topic",
+    })
+    return research_agent.model_with_tools.prompt_tokens, research_agent.compress_model.prompt_tokens
+
+
+async def main():
+    research_agent.tools_by_name = {"tavily_search": tavily_search}
+    default_threshold = research_agent.context_token_threshold
+
+    print(f"search turns: {SEARCH_TURNS}, tokens per tool output: {TOOL_OUTPUT_TOKENS}, "
+          f"threshold: {default_threshold}")
+    print(f"{'mode':>9} {'max turn prompt':>16} {'researcher total':>17} "
+          f"{'compress calls':>15} {'final compress':>15}")
+    for mode, threshold in [("full", math.inf), ("rolling", default_threshold)]:
+        turns, compressions = await run(threshold)
+        print(f"{mode:>9} {max(turns):>16} {sum(turns):>17} {len(compressions):>15} {compressions[-1]:>15}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
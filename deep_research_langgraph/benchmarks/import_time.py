@@ -0,0 +1,75 @@
+"""Benchmark module import time with lazily built models.
+
+Each module is imported in a fresh interpreter under python -X importtime, with
+no model or search credentials set. "lazy" is the import as it now happens;
+"eager" additionally builds every model declared by the module and the package
+modules it imports, which is what the import used to do. "models" counts the
+distinct models built; declarations with the same configuration share one.
+
+Run from the deep_research_langgraph directory:
+    python -m benchmarks.import_time
+"""
+
+import os
+import subprocess
+import sys
+
+MODULES = [
+    "utils",
+    "research_agent_scope",
+    "research_agent",
+    "multi_agent_supervisor",
+    "research_agent_full",
+]
+ROUNDS = 3
+
+# Builds every model declared by the module and the package modules it imported,
+# as importing them used to
+BUILD_ALL = """
+import os, sys
+os.environ["GOOGLE_API_KEY"] = "benchmark"  # dummy credentials so models can be constructed offline
+from src.deep_research_from_scratch.model_registry import LazyClient
+for name, loaded in list(sys.modules.items()):
+    if name.startswith("src.deep_research_from_scratch."):
+        for value in vars(loaded).values():
+            if isinstance(value, LazyClient):
+                value.get()
+"""
+
+
+def import_seconds(module: str, eager: bool) -> tuple[float, int]:
+    """Return the module's cumulative import time as reported by -X importtime, and models built.
+
+    When eager, the time to build the module's models is added to the import time.
+    """
+    name = f"src.deep_research_from_scratch.{module}"
+    code = f"import time\nimport {name} as module\nstart = time.perf_counter()"
+    if eager:
+        code += BUILD_ALL
+    code += "\nfrom src.deep_research_from_scratch.model_registry import _models"
+    code += "\nprint(time.perf_counter() - start, len(_models))"
+    env = {k: v for k, v in os.environ.items() if k not in ("GOOGLE_API_KEY", "TAVILY_API_KEY")}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    # importtime lines look like "import time: self | cumulative | name", in microseconds
+    import_us = next(
+        int(line.split("|")[1]) for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == name
+    )
+    build_seconds, models = result.stdout.split()
+    return import_us / 1e6 + float(build_seconds), int(models)
+
+
+def main():
+    print(f"{'module':>24} {'lazy (s)':>9} {'eager (s)':>10} {'models':>7}")
+    for module in MODULES:
+        lazy = min(import_seconds(module, eager=False)[0] for _ in range(ROUNDS))
+        eager_runs = [import_seconds(module, eager=True) for _ in range(ROUNDS)]
+        eager = min(seconds for seconds, _ in eager_runs)
+        print(f"{module:>24} {lazy:>9.2f} {eager:>10.2f} {eager_runs[0][1]:>7}")
+
+
+if __name__ == "__main__":
+    main()
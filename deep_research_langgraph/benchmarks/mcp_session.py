@@ -0,0 +1,90 @@
+"""Benchmark per-step MCP overhead of the MCP researcher against a stub server.
+
+A researcher step loads the tool list, binds it to the model, and runs one
+tool call. Previously each step called client.get_tools(), which starts a new
+server session, and bound the model again; every tool call opened another
+session. The persistent session reuses one server process and caches the tools
+and bound model until the server sends a tool list change notification, which
+is checked at the end.
+
+Run from the deep_research_langgraph directory with the package installed
+(pip install -e .):
+    python -m benchmarks.mcp_session
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Dummy credentials so the MCP research agent can be imported offline
+for key in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "TAVILY_API_KEY", "GOOGLE_API_KEY"):
+    os.environ.setdefault(key, "benchmark")
+
+from deep_research_from_scratch import research_agent_mcp  # noqa: E402
+
+STEPS = 10
+TOOL_CALL = {"name": "read_text_file", "args": {"path": "notes_0.md"}, "id": "call_0"}
+
+
+async def per_session_step() -> None:
+    """One step as before: fresh tool list, fresh binding, tool call on a new session."""
+    client = research_agent_mcp.get_mcp_client()
+    tools = await client.get_tools() + [research_agent_mcp.think_tool]
+    research_agent_mcp.model.bind_tools(tools)
+    await research_agent_mcp.execute_tool_calls([TOOL_CALL], {tool.name: tool for tool in tools})
+
+
+async def persistent_session_step() -> None:
+    """One step with the persistent session and cached tools and bound model."""
+    await research_agent_mcp.get_model_with_tools()
+    tools = await research_agent_mcp.get_mcp_tools()
+    await research_agent_mcp.execute_tool_calls([TOOL_CALL], {tool.name: tool for tool in tools})
+
+
+async def timed(step) -> tuple[float, float]:
+    """Return seconds for the first step and the mean of the following steps."""
+    start = time.perf_counter()
+    await step()
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        await step()
+    return first, (time.perf_counter() - start) / STEPS
+
+
+async def main():
+    research_agent_mcp.mcp_config = {
+        research_agent_mcp.MCP_SERVER_NAME: {
+            "command": sys.executable,
+            "args": [str(Path(__file__).with_name("stub_mcp_server.py"))],
+            "transport": "stdio",
+        }
+    }
+
+    modes = {
+        "per-session": await timed(per_session_step),
+        "persistent": await timed(persistent_session_step),
+    }
+
+    print(f"steps: {STEPS}, each = tool list + model binding + 1 tool call")
+    print(f"{'mode':>12} {'first step (ms)':>16} {'per step (ms)':>14}")
+    for mode, (first, mean) in modes.items():
+        print(f"{mode:>12} {first * 1000:>16.1f} {mean * 1000:>14.1f}")
+
+    # A tool list change notification must invalidate the cached tools
+    tools = await research_agent_mcp.get_mcp_tools()
+    await research_agent_mcp.execute_tool_calls(
+        [{"name": "enable_search", "args": {}, "id": "call_1"}], {tool.name: tool for tool in tools}
+    )
+    await asyncio.sleep(0.1)
+    names = {tool.name for tool in await research_agent_mcp.get_mcp_tools()}
+    assert "search_files" in names, names
+    print("tool list change notification reloaded tools: ok")
+
+    await research_agent_mcp.close_mcp_session()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,76 @@
+"""Benchmark the size of the supervisor's raw_notes channel.
+
+Synthetic researchers return raw notes made of formatted search output drawn
+from a shared pool of URLs, so different researchers summarize the same pages.
+The bytes checkpointed in raw_notes by the previous aggregation (every note
+joined and appended as is) are compared with compact_raw_notes, which collapses
+repeated sources and moves large notes into a temporary blob store.
+
+Run from the deep_research_langgraph directory:
+    python -m benchmarks.raw_notes
+"""
+
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+# Dummy credentials so the supervisor can be imported offline
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from src.deep_research_from_scratch import multi_agent_supervisor  # noqa: E402
+from src.deep_research_from_scratch.blob_store import BlobStore  # noqa: E402
+from src.deep_research_from_scratch.utils import format_search_output  # noqa: E402
+
+ITERATIONS = 4
+RESEARCHERS = 5
+SEARCHES_PER_RESEARCHER = 4
+RESULTS_PER_SEARCH = 3
+URL_POOL = 60
+SUMMARY_BYTES = 5_000
+
+
+def researcher_notes(rng: random.Random) -> str:
+    """Raw notes of one researcher: its search outputs joined, as compress_research does."""
+    searches = []
+    for _ in range(SEARCHES_PER_RESEARCHER):
+        urls = rng.sample(range(URL_POOL), RESULTS_PER_SEARCH)
+        searches.append(format_search_output({
+            f"https://example.com/page/{i}": {"title": f"Page {i}", "content": f"summary {i} " * (SUMMARY_BYTES // 12)}
+            for i in urls
+        }))
+    return "\n".join(searches)
+
+
+def main():
+    rng = random.Random(0)
+    batches = [[researcher_notes(rng) for _ in range(RESEARCHERS)] for _ in range(ITERATIONS)]
+
+    previous = [note for batch in batches for note in batch]
+
+    with tempfile.TemporaryDirectory() as blob_dir:
+        multi_agent_supervisor.blob_store = BlobStore(blob_dir)
+        compacted = []
+        start = time.perf_counter()
+        for batch in batches:
+            compacted += multi_agent_supervisor.compact_raw_notes(batch, compacted)
+        elapsed = time.perf_counter() - start
+        blob_bytes = sum(path.stat().st_size for path in Path(blob_dir).rglob("*") if path.is_file())
+
+    def size(notes):
+        return sum(len(note.encode("utf-8")) for note in notes)
+
+    print(f"supervisor iterations: {ITERATIONS}, researchers per iteration: {RESEARCHERS}, "
+          f"sources per researcher: {SEARCHES_PER_RESEARCHER * RESULTS_PER_SEARCH}, url pool: {URL_POOL}")
+    print(f"budget: {multi_agent_supervisor.raw_notes_byte_budget} bytes, "
+          f"inline limit: {multi_agent_supervisor.raw_note_inline_bytes} bytes")
+    print(f"previous raw_notes in state: {size(previous):>10} bytes")
+    print(f"compacted raw_notes in state: {size(compacted):>9} bytes")
+    print(f"stored in blobs (gzip): {blob_bytes:>15} bytes")
+    print(f"compaction time: {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark time to first visible output of final report generation.
+
+The writer model is a stub that streams a fixed markdown report token by token
+with a fixed time-to-first-token and per-token delay. The final report node is
+run inside a graph streamed with stream_mode="custom"; the time to the first
+report_delta event and the first completed report_section are compared with
+the total time, which is when the previous (non-streaming) node returned
+anything at all.
+
+Run from the deep_research_langgraph directory:
+    python -m benchmarks.report_streaming
+"""
+
+import asyncio
+import os
+import time
+
+# Dummy credentials so the full research agent can be imported offline
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from langchain_core.language_models import BaseChatModel  # noqa: E402
+from langchain_core.messages import AIMessageChunk  # noqa: E402
+from langchain_core.outputs import ChatGenerationChunk  # noqa: E402
+from langgraph.graph import END, START, StateGraph  # noqa: E402
+
+from src.deep_research_from_scratch import research_agent_full  # noqa: E402
+from src.deep_research_from_scratch.state_scope import AgentState  # noqa: E402
+
+FIRST_TOKEN_LATENCY = 0.5
+TOKEN_LATENCY = 0.002
+SECTIONS = 6
+WORDS_PER_SECTION = 400
+
+REPORT = "".join(
+    f"## Section {i}\n\n" + " ".join(f"word{j}" for j in range(WORDS_PER_SECTION)) + "\n\n"
+    for i in range(SECTIONS)
+)
+
+
+class StreamingStubModel(BaseChatModel):
+    """Chat model that streams REPORT one word at a time."""
+
+    @property
+    def _llm_type(self) -> str:
+        return "streaming-stub"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        raise NotImplementedError
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(FIRST_TOKEN_LATENCY)
+        for token in REPORT.split(" "):
+            await asyncio.sleep(TOKEN_LATENCY)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token + " "))
+
+
+async def main():
+    research_agent_full.writer_model = StreamingStubModel()
+    builder = StateGraph(AgentState)
+    builder.add_node("final_report_generation", research_agent_full.final_report_generation)
+    builder.add_edge(START, "final_report_generation")
+    builder.add_edge("final_report_generation", END)
+    graph = builder.compile()
+
+    first_token = first_section = None
+    sections = 0
+    start = time.perf_counter()
+    async for mode, event in graph.astream(
+        {"notes": ["finding"], "research_brief": "brief"}, stream_mode=["custom", "values"]
+    ):
+        now = time.perf_counter() - start
+        if mode == "custom" and "report_delta" in event and first_token is None:
+            first_token = now
+        if mode == "custom" and "report_section" in event:
+            sections += 1
+            if first_section is None:
+                first_section = now
+        if mode == "values" and event.get("final_report"):
+            final_report = event["final_report"]
+    total = time.perf_counter() - start
+    assert final_report.split() == REPORT.split() and sections == SECTIONS
+
+    print(f"report: {len(REPORT.split())} tokens in {SECTIONS} sections")
+    print(f"time to first token:   {first_token:.2f}s")
+    print(f"time to first section: {first_section:.2f}s")
+    print(f"total (previous time to first output): {total:.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,140 @@
+"""Benchmark researcher throughput with stub models at growing fan-out.
+
+Each researcher makes one tool-calling model turn, runs one search, makes a
+final model turn and compresses its findings. Models are stubs that wait a
+fixed latency; searches go through the real tavily_search tool with only the
+Tavily client replaced by a stub that waits a fixed latency. The async
+researcher graph is compared with the same graph built from synchronous nodes
+(the previous behavior), which LangGraph runs on the event loop's thread pool
+and where the sync tool starts an event loop per call.
+
+Run from the deep_research_langgraph directory:
+    python -m benchmarks.researcher_throughput
+"""
+
+import asyncio
+import os
+import time
+
+# Dummy credentials so the research agent can be imported offline
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+import tavily  # noqa: E402
+from langchain_core.language_models import BaseChatModel  # noqa: E402
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage  # noqa: E402
+from langchain_core.outputs import ChatGeneration, ChatResult  # noqa: E402
+from langgraph.graph import END, START, StateGraph  # noqa: E402
+
+from src.deep_research_from_scratch import research_agent  # noqa: E402
+from src.deep_research_from_scratch.state_research import ResearcherOutputState, ResearcherState  # noqa: E402
+
+MODEL_LATENCY = 0.3
+TOOL_LATENCY = 0.3
+RESEARCHER_COUNTS = [3, 10, 30]
+
+
+class StubChatModel(BaseChatModel):
+    """Chat model that searches once, then answers, after a fixed delay per call."""
+
+    latency: float = MODEL_LATENCY
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _respond(self, messages) -> ChatResult:
+        if any(isinstance(m, ToolMessage) for m in messages):
+            message = AIMessage("findings")
+        else:
+            message = AIMessage("", tool_calls=[{"name": "tavily_search", "args": {"query": "topic"}, "id": "call_0"}])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        return self._respond(messages)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        return self._respond(messages)
+
+
+class StubTavilyClient:
+    """Stands in for AsyncTavilyClient: answers after a fixed delay, without raw content."""
+
+    async def search(self, query: str, **kwargs) -> dict:
+        await asyncio.sleep(TOOL_LATENCY)
+        return {"query": query, "results": [
+            {"url": f"https://example.com/{query}", "title": query, "content": f"results for {query}", "raw_content": None},
+        ]}
+
+
+def sync_researcher_graph():
+    """The researcher graph with the previous synchronous nodes."""
+
+    def llm_call(state):
+        return {"researcher_messages": [research_agent.model_with_tools.invoke(state["researcher_messages"])]}
+
+    def tool_node(state):
+        tool_calls = state["researcher_messages"][-1].tool_calls
+        return {"researcher_messages": [
+            ToolMessage(
+                content=research_agent.tools_by_name[tc["name"]].invoke(tc["args"]),
+                name=tc["name"],
+                tool_call_id=tc["id"],
+            )
+            for tc in tool_calls
+        ]}
+
+    def compress_research(state):
+        response = research_agent.compress_model.invoke(state["researcher_messages"])
+        return {"compressed_research": str(response.content), "raw_notes": []}
+
+    builder = StateGraph(ResearcherState, output_schema=ResearcherOutputState)
+    builder.add_node("llm_call", llm_call)
+    builder.add_node("tool_node", tool_node)
+    builder.add_node("compress_research", compress_research)
+    builder.add_edge(START, "llm_call")
+    builder.add_conditional_edges("llm_call", research_agent.should_continue)
+    builder.add_edge("tool_node", "llm_call")
+    builder.add_edge("compress_research", END)
+    return builder.compile()
+
+
+async def run(graph, researcher_count: int) -> float:
+    """Return seconds taken to run researcher_count researchers concurrently."""
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        graph.ainvoke({
+            "researcher_messages": [HumanMessage(content=f"topic {i}")],
+            "research_topic": f"topic {i}",
+        })
+        for i in range(researcher_count)
+    ))
+    elapsed = time.perf_counter() - start
+    assert all(result["compressed_research"] == "findings" for result in results)
+    return elapsed
+
+
+async def main():
+    research_agent.model_with_tools = StubChatModel()
+    research_agent.compress_model = StubChatModel()
+    tavily.AsyncTavilyClient = StubTavilyClient
+    graphs = {"sync nodes": sync_researcher_graph(), "async nodes": research_agent.researcher_agent}
+
+    # A single researcher's critical path: three model calls and one search
+    ideal = 3 * MODEL_LATENCY + TOOL_LATENCY
+    print(f"model latency: {MODEL_LATENCY:.2f}s, tool latency: {TOOL_LATENCY:.2f}s, "
+          f"single researcher: {ideal:.2f}s, thread pool: {min(32, (os.cpu_count() or 1) + 4)}")
+    print(f"{'researchers':>11} {'mode':>12} {'seconds':>8} {'researchers/s':>14}")
+    for count in RESEARCHER_COUNTS:
+        for mode, graph in graphs.items():
+            elapsed = await run(graph, count)
+            print(f"{count:>11} {mode:>12} {elapsed:>8.2f} {count / elapsed:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""Benchmark concurrent multi-query Tavily search against a local fake backend.
+
+A local HTTP server stands in for the Tavily API and answers every search after
+a fixed latency. Sequential execution (one query at a time, as before) is
+compared with atavily_search_multiple running queries concurrently.
+
+Run from the deep_research_langgraph directory:
+    python -m benchmarks.search_concurrency
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Dummy credentials so the research utilities can be imported offline
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+import tavily  # noqa: E402
+
+from src.deep_research_from_scratch import utils  # noqa: E402
+
+SEARCH_LATENCY = 0.4
+QUERY_COUNTS = [1, 3, 5, 10]
+
+
+class FakeTavilyHandler(BaseHTTPRequestHandler):
+    """Answer POST /search with one canned result after a fixed delay."""
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(SEARCH_LATENCY)
+        body = json.dumps({
+            "query": request["query"],
+            "results": [{
+                "url": f"https://example.com/{abs(hash(request['query']))}",
+                "title": request["query"],
+                "content": "Canned search result.",
+                "raw_content": None,
+            }],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def timed_search(queries: list[str], concurrency: int) -> float:
+    utils.MAX_CONCURRENT_SEARCHES = concurrency
+    start = time.perf_counter()
+    results = await utils.atavily_search_multiple(queries, max_results=1, include_raw_content=False)
+    elapsed = time.perf_counter() - start
+    assert [r["query"] for r in results] == queries
+    return elapsed
+
+
+async def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeTavilyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # The shared client is built on first use, so point the Tavily class at the fake backend
+    tavily.AsyncTavilyClient = partial(
+        tavily.AsyncTavilyClient, api_base_url=f"http://127.0.0.1:{server.server_address[1]}"
+    )
+
+    print(f"search latency: {SEARCH_LATENCY:.2f}s")
+    print(f"{'queries':>8} {'sequential (s)':>15} {'concurrent (s)':>15}")
+    for count in QUERY_COUNTS:
+        queries = [f"query {i}" for i in range(count)]
+        sequential = await timed_search(queries, concurrency=1)
+        concurrent = await timed_search(queries, concurrency=count)
+        print(f"{count:>8} {sequential:>15.2f} {concurrent:>15.2f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
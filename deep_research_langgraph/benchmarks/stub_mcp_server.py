@@ -0,0 +1,43 @@
+"""Minimal stdio MCP server standing in for the filesystem server in benchmarks.
+
+Serves two read-only tools over an in-memory directory, plus enable_search,
+which adds a third tool and notifies the client that the tool list changed.
+
+Started by benchmarks.mcp_session as a subprocess:
+    python benchmarks/stub_mcp_server.py
+"""
+
+from mcp.server.fastmcp import Context, FastMCP
+
+FILES = {f"notes_{i}.md": f"# Notes {i}\n\nStub research notes.\n" for i in range(5)}
+
+server = FastMCP("stub-filesystem", log_level="WARNING")
+
+
+@server.tool()
+def list_directory(path: str) -> str:
+    """List the files in a directory."""
+    return "\n".join(f"[FILE] {name}" for name in FILES)
+
+
+@server.tool()
+def read_text_file(path: str) -> str:
+    """Read the complete contents of a file."""
+    return FILES.get(path.rsplit("/", 1)[-1], f"Error: {path} not found")
+
+
+def search_files(path: str, pattern: str) -> str:
+    """Find files whose name contains a pattern."""
+    return "\n".join(name for name in FILES if pattern in name)
+
+
+@server.tool()
+async def enable_search(ctx: Context) -> str:
+    """Register the search_files tool and notify the client."""
+    server.add_tool(search_files)
+    await ctx.session.send_tool_list_changed()
+    return "search_files enabled"
+
+
+if __name__ == "__main__":
+    server.run("stdio")
@@ -0,0 +1,83 @@
+"""Benchmark the researcher tool node with stub tools that inject latency.
+
+The model turn issues N search calls plus one think_tool call, and one of the
+searches fails. Sequential execution (one call at a time, as before) is compared
+with the concurrent tool node. Both must return one ToolMessage per call, in
+call order, with only the failing call reported as an error.
+
+Run from the deep_research_langgraph directory:
+    python -m benchmarks.tool_node
+"""
+
+import asyncio
+import os
+import time
+
+# Dummy credentials so the research agent can be imported offline
+os.environ.setdefault("TAVILY_API_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from langchain_core.messages import AIMessage  # noqa: E402
+from langchain_core.tools import tool  # noqa: E402
+
+from src.deep_research_from_scratch import research_agent, utils  # noqa: E402
+
+TOOL_LATENCY = 0.4
+CALL_COUNTS = [1, 3, 5, 10]
+FAILING_QUERY = "query 0"
+
+
+@tool
+async def tavily_search(query: str) -> str:
+    """Stub search that answers after a fixed delay."""
+    await asyncio.sleep(TOOL_LATENCY)
+    if query == FAILING_QUERY:
+        raise RuntimeError("search backend unavailable")
+    return f"results for {query}"
+
+
+@tool
+def think_tool(reflection: str) -> str:
+    """Stub reflection running in a worker thread."""
+    time.sleep(TOOL_LATENCY)
+    return f"Reflection recorded: {reflection}"
+
+
+def model_turn(call_count: int) -> dict:
+    """Researcher state whose last message issues call_count searches and one reflection."""
+    tool_calls = [
+        {"name": "tavily_search", "args": {"query": f"query {i}"}, "id": f"call_{i}"}
+        for i in range(call_count)
+    ]
+    tool_calls.append({"name": "think_tool", "args": {"reflection": "plan"}, "id": "call_think"})
+    return {"researcher_messages": [AIMessage("", tool_calls=tool_calls)], "research_run_id": "benchmark"}
+
+
+async def timed_tool_node(state: dict, concurrency: int) -> float:
+    utils.MAX_CONCURRENT_TOOL_CALLS = concurrency
+    start = time.perf_counter()
+    result = await research_agent.tool_node(state, config={})
+    elapsed = time.perf_counter() - start
+
+    messages = result["researcher_messages"]
+    tool_calls = state["researcher_messages"][-1].tool_calls
+    assert [m.tool_call_id for m in messages] == [tc["id"] for tc in tool_calls]
+    assert [m.status for m in messages].count("error") == 1 and messages[0].status == "error"
+    return elapsed
+
+
+async def main():
+    research_agent.tools_by_name = {t.name: t for t in [tavily_search, think_tool]}
+    default_concurrency = utils.MAX_CONCURRENT_TOOL_CALLS
+
+    print(f"tool latency: {TOOL_LATENCY:.2f}s, concurrency limit: {default_concurrency}")
+    print(f"{'calls':>6} {'sequential (s)':>15} {'concurrent (s)':>15}")
+    for count in CALL_COUNTS:
+        state = model_turn(count)
+        sequential = await timed_tool_node(state, concurrency=1)
+        concurrent = await timed_tool_node(state, concurrency=default_concurrency)
+        print(f"{count + 1:>6} {sequential:>15.2f} {concurrent:>15.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
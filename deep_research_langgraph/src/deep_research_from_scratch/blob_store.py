@@ -0,0 +1,108 @@
+"""Local storage for research text too large to keep in graph state.
+
+Large raw research notes are written here and referenced from state, so
+checkpoints carry a bounded excerpt plus a blob reference instead of the full
+text. Notes are plain text that repeats a lot (search output, tool messages), so
+they are stored gzip-compressed, one file per note named by its SHA-256. The
+store holds at most max_bytes of compressed notes and drops the least recently
+used ones first; a reference can therefore outlive its note.
+"""
+
+import gzip
+import hashlib
+import os
+import re
+import threading
+import uuid
+from pathlib import Path
+
+DEFAULT_BLOB_DIR = Path(
+    os.environ.get("DEEP_RESEARCH_CACHE_DIR", Path.home() / ".cache" / "deep_research")
+) / "blobs"
+
+BLOB_PREFIX = "blob:"
+
+
+class BlobStore:
+    """Compressed text notes on local disk, addressed by SHA-256, with LRU eviction.
+
+    Args:
+        root: Directory holding the blobs
+        max_bytes: Upper bound on the compressed size of all stored notes
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_BLOB_DIR, max_bytes: int = 256 * 1024 * 1024):
+        """Open the store at root; the directory is created on the first put."""
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def _path(self, digest: str) -> Path:
+        return self.root / f"{digest}.gz"
+
+    def put(self, data: str) -> str:
+        """Store text and return its reference.
+
+        Args:
+            data: Text to store
+
+        Returns:
+            Reference of the form blob:<sha256>
+        """
+        raw = data.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._path(digest)
+        with self._lock:
+            if path.exists():
+                path.touch()
+            else:
+                self.root.mkdir(parents=True, exist_ok=True)
+                # Rename into place so a reader never opens a half-written note
+                tmp_path = path.with_name(f".{uuid.uuid4().hex}.tmp")
+                tmp_path.write_bytes(gzip.compress(raw, compresslevel=6))
+                os.replace(tmp_path, path)
+                self._evict(keep=path)
+        return f"{BLOB_PREFIX}{digest}"
+
+    def _evict(self, keep: Path) -> None:
+        """Remove the least recently used notes while the store exceeds max_bytes."""
+        entries = []
+        for path in self.root.glob("*.gz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path != keep:
+                path.unlink(missing_ok=True)
+                self.evictions += 1
+                total -= size
+
+    def get(self, ref: str) -> str:
+        """Load the text stored under a reference.
+
+        Args:
+            ref: Reference returned by put
+
+        Returns:
+            The stored text
+
+        Raises:
+            KeyError: If the reference is malformed or its note is not stored
+                (never written, or evicted)
+        """
+        digest = ref.removeprefix(BLOB_PREFIX)
+        if not ref.startswith(BLOB_PREFIX) or not re.fullmatch(r"[0-9a-f]{64}", digest):
+            raise KeyError(ref)
+        path = self._path(digest)
+        try:
+            data = gzip.decompress(path.read_bytes())
+            path.touch()
+        except FileNotFoundError:
+            raise KeyError(ref) from None
+        return data.decode("utf-8")
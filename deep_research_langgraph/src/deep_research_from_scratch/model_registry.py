@@ -0,0 +1,134 @@
+"""Lazy, shared chat model registry.
+
+Modules declare the models they use at import time with lazy_model, but nothing
+is constructed (and no provider package is imported or credential checked)
+until a model is first used. Models with the same configuration are built once
+and shared across modules, e.g. the summarization model used by both the
+search utilities and the researcher. The Tavily search client is shared the
+same way.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Callable
+
+
+_models: dict[tuple, Any] = {}
+_models_lock = threading.Lock()
+
+# One AsyncTavilyClient per event loop: its httpx connection pool is bound to
+# the loop that opened it, and sync tool calls run searches on their own loop
+_tavily_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_chat_model(model: str, **kwargs) -> Any:
+    """Get the shared chat model for a configuration, building it on first use.
+
+    Args:
+        model: Model name, optionally prefixed with its provider
+        **kwargs: Remaining init_chat_model arguments (model_provider, max_tokens, ...)
+
+    Returns:
+        Chat model shared by every caller asking for the same configuration
+    """
+    key = (model, tuple(sorted(kwargs.items())))
+    with _models_lock:
+        if key not in _models:
+            # Importing langchain's model factory pulls in provider packages; defer it too
+            from langchain.chat_models import init_chat_model
+            _models[key] = init_chat_model(model=model, **kwargs)
+        return _models[key]
+
+
+def get_tavily_client() -> Any:
+    """Get the shared AsyncTavilyClient for the running event loop, building it on first use.
+
+    Returns:
+        Client reused by every search on this loop, keeping its connections warm
+    """
+    loop = asyncio.get_running_loop()
+    with _models_lock:
+        client = _tavily_clients.get(loop)
+        if client is None:
+            from tavily import AsyncTavilyClient
+            client = _tavily_clients[loop] = AsyncTavilyClient()
+        return client
+
+
+class LazyClient:
+    """Stand-in for a model or client that builds its target on first attribute access.
+
+    Args:
+        factory: Zero-argument callable that builds the target
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        """Wrap factory without calling it."""
+        self._factory = factory
+        self._target = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        """Return the target, building it if needed."""
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    self._target = self._factory()
+        return self._target
+
+    # The entry points used by the graphs are forwarded explicitly, so looking
+    # them up (as LangGraph does when inspecting node functions) does not build
+    # the target; any other attribute is resolved through __getattr__.
+    def invoke(self, *args, **kwargs) -> Any:
+        """Forward to the target's invoke."""
+        return self.get().invoke(*args, **kwargs)
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        """Forward to the target's ainvoke."""
+        return await self.get().ainvoke(*args, **kwargs)
+
+    def astream(self, *args, **kwargs) -> Any:
+        """Forward to the target's astream."""
+        return self.get().astream(*args, **kwargs)
+
+    def bind_tools(self, *args, **kwargs) -> Any:
+        """Forward to the target's bind_tools."""
+        return self.get().bind_tools(*args, **kwargs)
+
+    def with_structured_output(self, *args, **kwargs) -> Any:
+        """Forward to the target's with_structured_output."""
+        return self.get().with_structured_output(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve any other attribute on the target, building it if needed."""
+        # Protocol probes (hasattr(x, "__self__"), copy, pickle) must not build the target
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
+
+
+def lazy_model(model: str, **kwargs) -> LazyClient:
+    """Declare a shared chat model without building it.
+
+    Args:
+        model: Model name, optionally prefixed with its provider
+        **kwargs: Remaining init_chat_model arguments
+
+    Returns:
+        LazyClient resolving to get_chat_model(model, **kwargs)
+    """
+    return LazyClient(lambda: get_chat_model(model, **kwargs))
+
+
+def lazy_bound_model(model: LazyClient, tools: list) -> LazyClient:
+    """Declare a lazy model with tools bound, built once on first use.
+
+    Args:
+        model: Lazy model to bind the tools to
+        tools: Tools to bind
+
+    Returns:
+        LazyClient resolving to model.bind_tools(tools)
+    """
+    return LazyClient(lambda: model.bind_tools(tools))
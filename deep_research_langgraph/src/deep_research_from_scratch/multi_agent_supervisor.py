@@ -11,10 +11,11 @@ maintaining isolated context windows for each research topic.
 """
 
 import asyncio
+import logging
+import re
 
 from typing_extensions import Literal
 
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import (
     HumanMessage, 
     BaseMessage, 
@@ -22,9 +23,12 @@ from langchain_core.messages import (
     ToolMessage,
     filter_messages
 )
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import Command
 
+from src.deep_research_from_scratch.blob_store import BlobStore
+from src.deep_research_from_scratch.model_registry import lazy_model, lazy_bound_model
 from src.deep_research_from_scratch.prompts import lead_researcher_prompt
 from src.deep_research_from_scratch.research_agent import researcher_agent
 from src.deep_research_from_scratch.state_multi_agent_supervisor import (
@@ -32,7 +36,10 @@ from src.deep_research_from_scratch.state_multi_agent_supervisor import (
     ConductResearch, 
     ResearchComplete
 )
-from src.deep_research_from_scratch.utils import get_today_str, think_tool
+from src.deep_research_from_scratch.utils import get_today_str, think_tool, deduplicate_source_blocks, SOURCE_BLOCK
+from src.deep_research_from_scratch.utils import new_research_run_id
+
+logger = logging.getLogger(__name__)
 
 def get_notes_from_tool_calls(messages: list[BaseMessage]) -> list[str]:
     """Extract research notes from ToolMessage objects in supervisor message history.
@@ -68,9 +75,9 @@ except ImportError:
 # ===== CONFIGURATION =====
 
 supervisor_tools = [ConductResearch, ResearchComplete, think_tool]
-#supervisor_model = init_chat_model(model="anthropic:claude-sonnet-4-20250514") 
-supervisor_model = init_chat_model("gemini-2.5-flash", model_provider="google_genai")
-supervisor_model_with_tools = supervisor_model.bind_tools(supervisor_tools)
+#supervisor_model = lazy_model(model="anthropic:claude-sonnet-4-20250514") 
+supervisor_model = lazy_model("gemini-2.5-flash", model_provider="google_genai")
+supervisor_model_with_tools = lazy_bound_model(supervisor_model, supervisor_tools)
 
 # System constants
 # Maximum number of tool call iterations for individual researcher agents
@@ -78,9 +85,136 @@ supervisor_model_with_tools = supervisor_model.bind_tools(supervisor_tools)
 max_researcher_iterations = 6 # Calls to think_tool + ConductResearch
 
 # Maximum number of concurrent research agents the supervisor can launch
-# This is passed to the lead_researcher_prompt to limit parallel research tasks
+# This is passed to the lead_researcher_prompt and enforced by run_research_topics:
+# topics beyond the limit wait in a queue until a researcher finishes
 max_concurrent_researchers = 3
 
+# Maximum time (seconds) a single research agent may run before it is abandoned
+researcher_timeout = 600.0
+
+# Raw notes kept in supervisor state: notes larger than raw_note_inline_bytes are
+# stored in the blob store and replaced by an excerpt plus reference, and once the
+# raw notes in state reach raw_notes_byte_budget, new notes are kept by reference only
+raw_note_inline_bytes = 50_000
+raw_notes_byte_budget = 1_000_000
+raw_note_excerpt_chars = 2_000
+
+blob_store = BlobStore()
+
+# ===== RESEARCH SCHEDULING =====
+
+async def run_research_topics(conduct_research_calls: list[dict], research_run_id: str | None = None) -> list[dict]:
+    """Run research agents for ConductResearch calls with a bounded worker pool.
+
+    At most max_concurrent_researchers agents run at once; the remaining topics
+    are queued. Each agent is limited to researcher_timeout seconds. A failed or
+    timed-out agent yields an error note instead of failing the whole batch.
+    As each agent finishes, its compressed findings are emitted on the custom
+    stream (stream with stream_mode="custom") so callers see them without
+    waiting for the slowest researcher.
+
+    Args:
+        conduct_research_calls: ConductResearch tool calls from the supervisor
+        research_run_id: Research run the agents belong to; agents of one run
+            share its page summary cache
+
+    Returns:
+        Researcher results (compressed_research and raw_notes), in call order
+    """
+    semaphore = asyncio.Semaphore(max_concurrent_researchers)
+    writer = get_stream_writer()
+
+    async def research(tool_call: dict) -> dict:
+        topic = tool_call["args"]["research_topic"]
+        async with semaphore:
+            try:
+                result = await asyncio.wait_for(
+                    researcher_agent.ainvoke({
+                        "researcher_messages": [HumanMessage(content=topic)],
+                        "research_topic": topic,
+                        **({"research_run_id": research_run_id} if research_run_id else {}),
+                    }),
+                    timeout=researcher_timeout,
+                )
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                logger.warning("Research failed for topic %r: %s", topic[:80], error)
+                result = {"compressed_research": f"Error conducting research: {error}", "raw_notes": []}
+        # Raw notes stay out of the event; they only reach state through compact_raw_notes
+        writer({"research_completed": {
+            "tool_call_id": tool_call["id"],
+            "research_topic": topic,
+            "compressed_research": result["compressed_research"],
+        }})
+        return result
+
+    return list(await asyncio.gather(*(research(tool_call) for tool_call in conduct_research_calls)))
+
+def compact_raw_notes(new_notes: list[str], existing_notes: list[str]) -> list[str]:
+    """Prepare researchers' raw notes for the supervisor's raw_notes channel.
+
+    Source blocks for URLs already present in existing or earlier new notes are
+    collapsed to a one-line reference, empty notes are dropped, and notes are
+    moved to the blob store by reference when they are too large or the channel
+    is over its byte budget.
+
+    Args:
+        new_notes: Raw notes from the researchers that just finished
+        existing_notes: Raw notes already in supervisor state
+
+    Returns:
+        Notes to append to the raw_notes channel
+    """
+    seen_urls = {match.group(1) for note in existing_notes for match in SOURCE_BLOCK.finditer(note)}
+    used_bytes = sum(len(note.encode("utf-8")) for note in existing_notes)
+
+    compacted = []
+    for note in new_notes:
+        note = deduplicate_source_blocks(note, seen_urls)
+        if not note.strip():
+            continue
+        size = len(note.encode("utf-8"))
+        if size > raw_note_inline_bytes or used_bytes + size > raw_notes_byte_budget:
+            try:
+                reference = f"[Full raw note: {blob_store.put(note)} ({size} bytes)]"
+            except OSError as e:
+                logger.warning("Failed to store raw note: %s", str(e) or type(e).__name__)
+                reference = f"[Raw note truncated ({size} bytes)]"
+            excerpt = note[:raw_note_excerpt_chars] + "\n...\n"
+            if used_bytes + len(excerpt.encode("utf-8")) + len(reference) > raw_notes_byte_budget:
+                excerpt = ""
+            note = excerpt + reference
+        used_bytes += len(note.encode("utf-8"))
+        compacted.append(note)
+    return compacted
+
+# Trailing reference left by compact_raw_notes in place of (most of) a note
+RAW_NOTE_REFERENCE = re.compile(r"\[Full raw note: (blob:[0-9a-f]{64}) \(\d+ bytes\)\]\Z")
+
+def read_raw_notes(raw_notes: list[str]) -> list[str]:
+    """Load raw notes for reading, replacing notes kept by reference with their full text.
+
+    The final report is written from the compressed notes, so raw_notes are read
+    by callers of the graph (e.g. result["raw_notes"]). Notes whose blob has been
+    evicted are returned as stored: excerpt plus reference.
+
+    Args:
+        raw_notes: Raw notes from supervisor or agent state
+
+    Returns:
+        The notes in full where the blob store still holds them
+    """
+    notes = []
+    for note in raw_notes:
+        match = RAW_NOTE_REFERENCE.search(note)
+        if match:
+            try:
+                note = blob_store.get(match.group(1))
+            except KeyError:
+                pass
+        notes.append(note)
+    return notes
+
 # ===== SUPERVISOR NODES =====
 
 async def supervisor(state: SupervisorState) -> Command[Literal["supervisor_tools"]]:
@@ -90,6 +224,8 @@ async def supervisor(state: SupervisorState) -> Command[Literal["supervisor_tool
     - What research topics need investigation
     - Whether to conduct parallel research
     - When research is complete
+
+    The first call of a run assigns its research_run_id.
     
     Args:
         state: Current supervisor state with messages and research progress
@@ -114,7 +250,8 @@ async def supervisor(state: SupervisorState) -> Command[Literal["supervisor_tool
         goto="supervisor_tools",
         update={
             "supervisor_messages": [response],
-            "research_iterations": state.get("research_iterations", 0) + 1
+            "research_iterations": state.get("research_iterations", 0) + 1,
+            "research_run_id": state.get("research_run_id") or new_research_run_id(),
         }
     )
 
@@ -182,19 +319,8 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
 
             # Handle ConductResearch calls (asynchronous)
             if conduct_research_calls:
-                # Launch parallel research agents
-                coros = [
-                    researcher_agent.ainvoke({
-                        "researcher_messages": [
-                            HumanMessage(content=tool_call["args"]["research_topic"])
-                        ],
-                        "research_topic": tool_call["args"]["research_topic"]
-                    }) 
-                    for tool_call in conduct_research_calls
-                ]
-
-                # Wait for all research to complete
-                tool_results = await asyncio.gather(*coros)
+                # Launch research agents through the bounded worker pool
+                tool_results = await run_research_topics(conduct_research_calls, state.get("research_run_id"))
 
                 # Format research results as tool messages
                 # Each sub-agent returns compressed research findings in result["compressed_research"]
@@ -210,11 +336,11 @@ async def supervisor_tools(state: SupervisorState) -> Command[Literal["superviso
                 
                 tool_messages.extend(research_tool_messages)
 
-                # Aggregate raw notes from all research
-                all_raw_notes = [
-                    "\n".join(result.get("raw_notes", [])) 
-                    for result in tool_results
-                ]
+                # Aggregate raw notes from all research, deduplicated and size-bounded
+                all_raw_notes = compact_raw_notes(
+                    ["\n".join(result.get("raw_notes", [])) for result in tool_results],
+                    state.get("raw_notes", [])
+                )
                 
         except Exception as e:
             print(f"Error in supervisor tools: {e}")
@@ -192,6 +192,40 @@ Remember, your goal is to create a summary that can be easily understood and uti
 Today's date is {date}.
 """
 
+summarize_webpages_batch_prompt = """You are tasked with summarizing the raw content of several webpages retrieved from a web search. Your goal is to create, for each webpage, a summary that preserves the most important information from the original page. These summaries will be used by a downstream research agent, so it's crucial to maintain the key details without losing essential information.
+
+Here are the {count} webpages, each wrapped in its own tag:
+
+{webpages}
+
+Summarize each webpage independently - never mix information between webpages. For each one:
+
+1. Identify and preserve the main topic or purpose of the webpage.
+2. Retain key facts, statistics, and data points that are central to the content's message.
+3. Keep important quotes from credible sources or experts.
+4. Maintain the chronological order of events if the content is time-sensitive or historical.
+5. Preserve any lists or step-by-step instructions if present.
+6. Include relevant dates, names, and locations that are crucial to understanding the content.
+7. Summarize lengthy explanations while keeping the core message intact.
+
+Each summary should be significantly shorter than the original content but comprehensive enough to stand alone as a source of information. Aim for about 25-30 percent of the original length, unless the content is already concise.
+
+Return exactly {count} summaries, in the same order as the webpages, in the following format:
+
+```
+{{
+   "summaries": [
+      {{
+         "summary": "Summary of webpage 1, structured with appropriate paragraphs or bullet points as needed",
+         "key_excerpts": "First important quote or excerpt, Second important quote or excerpt, ...up to a maximum of 5"
+      }}
+   ]
+}}
+```
+
+Today's date is {date}.
+"""
+
 # Research agent prompt for MCP (Model Context Protocol) file access
 research_agent_prompt_with_mcp = """You are a research assistant conducting research on the user's input topic using local files. For context, today's date is {date}.
 
@@ -365,6 +399,28 @@ CRITICAL REQUIREMENTS:
 
 The cleaned findings will be used for final report generation, so comprehensiveness is critical."""
 
+compress_research_partial_prompt = """You are a research assistant helping a researcher keep their working context small. The researcher is still gathering information, and the older tool outputs below are about to be removed from their context and replaced by your summary. For context, today's date is {date}.
+
+<Task>
+Rewrite the tool outputs below into a compact set of findings.
+Preserve every relevant fact, figure, name, date and quote, and keep the source title and URL next to each finding so it can be cited later.
+Remove only navigation text, boilerplate and information repeated across sources (say which sources agree instead).
+Skip think_tool outputs; they are the researcher's internal reflections, not findings.
+</Task>
+
+<Tool Outputs>
+{tool_outputs}
+</Tool Outputs>
+"""
+
+research_summaries_context = """
+
+<Research Summaries>
+Earlier tool outputs have been condensed into the summaries below; their original messages now say they were compressed. Treat these summaries as findings you have already gathered.
+
+{summaries}
+</Research Summaries>"""
+
 final_report_generation_prompt = """Based on all the research conducted, create a comprehensive, well-structured answer to the overall research brief:
 <Research Brief>
 {research_brief}
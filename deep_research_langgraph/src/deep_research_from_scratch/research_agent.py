@@ -5,16 +5,28 @@ This module implements a research agent that can perform iterative web searches
 and synthesis to answer complex research questions.
 """
 
+import logging
+
 from pydantic import BaseModel, Field
 from typing_extensions import Literal
 
 from langgraph.graph import StateGraph, START, END
-from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, filter_messages
-from langchain.chat_models import init_chat_model
+from langchain_core.runnables import RunnableConfig
+from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, ToolMessage, filter_messages
 
+from src.deep_research_from_scratch.model_registry import lazy_model, lazy_bound_model
 from src.deep_research_from_scratch.state_research import ResearcherState, ResearcherOutputState
-from src.deep_research_from_scratch.utils import tavily_search, get_today_str, think_tool
-from src.deep_research_from_scratch.prompts import research_agent_prompt, compress_research_system_prompt, compress_research_human_message
+from src.deep_research_from_scratch.utils import tavily_search, get_today_str, think_tool, execute_tool_calls, CHARS_PER_TOKEN
+from src.deep_research_from_scratch.utils import new_research_run_id, research_run_config
+from src.deep_research_from_scratch.prompts import (
+    research_agent_prompt,
+    compress_research_system_prompt,
+    compress_research_human_message,
+    compress_research_partial_prompt,
+    research_summaries_context
+)
+
+logger = logging.getLogger(__name__)
 
 # ===== CONFIGURATION =====
 
@@ -22,76 +34,123 @@ from src.deep_research_from_scratch.prompts import research_agent_prompt, compre
 tools = [tavily_search, think_tool]
 tools_by_name = {tool.name: tool for tool in tools}
 
-# Initialize models
-#model = init_chat_model(model="anthropic:claude-sonnet-4-20250514")
-model = init_chat_model("gemini-2.5-flash", model_provider="google_genai")
-model_with_tools = model.bind_tools(tools)
-#summarization_model = init_chat_model(model="openai:gpt-4.1-mini")
-summarization_model = init_chat_model("gemini-2.5-flash-lite", model_provider="google_genai")
-#compress_model = init_chat_model(model="openai:gpt-4.1", max_tokens=32000) # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
-compress_model = init_chat_model(model="gemini-2.5-flash-lite", model_provider="google_genai", max_tokens=64000)
+# Declare models (built lazily on first use and shared across modules)
+#model = lazy_model(model="anthropic:claude-sonnet-4-20250514")
+model = lazy_model("gemini-2.5-flash", model_provider="google_genai")
+model_with_tools = lazy_bound_model(model, tools)
+#compress_model = lazy_model(model="openai:gpt-4.1", max_tokens=32000) # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
+compress_model = lazy_model(model="gemini-2.5-flash-lite", model_provider="google_genai", max_tokens=64000)
+
+# Rolling context compression: once the tool outputs still in researcher_messages
+# exceed this many tokens, all but the latest turn's outputs are summarized
+context_token_threshold = 20000
+
+# Content left in place of a tool output that was folded into research_summaries
+COMPRESSED_TOOL_OUTPUT = "[Compressed: see <Research Summaries>]"
+
+def with_research_summaries(system_prompt: str, state: ResearcherState) -> str:
+    """Append the rolling research summaries, if any, to a system prompt."""
+    summaries = state.get("research_summaries", [])
+    if not summaries:
+        return system_prompt
+    return system_prompt + research_summaries_context.format(summaries="\n\n".join(summaries))
 
 # ===== AGENT NODES =====
 
-def llm_call(state: ResearcherState):
+async def llm_call(state: ResearcherState):
     """Analyze current state and decide on next actions.
     
     The model analyzes the current conversation state and decides whether to:
     1. Call search tools to gather more information
     2. Provide a final answer based on gathered information
     
-    Returns updated state with the model's response.
+    Returns updated state with the model's response. A researcher started on
+    its own (not by the supervisor) gets a fresh research_run_id here.
     """
     return {
         "researcher_messages": [
-            model_with_tools.invoke(
-                [SystemMessage(content=research_agent_prompt)] + state["researcher_messages"]
+            await model_with_tools.ainvoke(
+                [SystemMessage(content=with_research_summaries(research_agent_prompt, state))] + state["researcher_messages"]
             )
-        ]
+        ],
+        "research_run_id": state.get("research_run_id") or new_research_run_id(),
     }
 
-def tool_node(state: ResearcherState):
+async def tool_node(state: ResearcherState, config: RunnableConfig):
     """Execute all tool calls from the previous LLM response.
     
-    Executes all tool calls from the previous LLM responses.
-    Returns updated state with tool execution results.
+    Independent tool calls (e.g. several searches issued in one turn) run
+    concurrently, tagged with the research run so searches share its summary
+    cache. Returns updated state with tool execution results, one ToolMessage
+    per call in the order the calls were made.
     """
     tool_calls = state["researcher_messages"][-1].tool_calls
- 
-    # Execute all tool calls
-    observations = []
-    for tool_call in tool_calls:
-        tool = tools_by_name[tool_call["name"]]
-        observations.append(tool.invoke(tool_call["args"]))
-            
-    # Create tool message outputs
-    tool_outputs = [
-        ToolMessage(
-            content=observation,
-            name=tool_call["name"],
-            tool_call_id=tool_call["id"]
-        ) for observation, tool_call in zip(observations, tool_calls)
-    ]
-    
+    tool_outputs = await execute_tool_calls(
+        tool_calls, tools_by_name, config=research_run_config(config, state["research_run_id"])
+    )
     return {"researcher_messages": tool_outputs}
 
-def compress_research(state: ResearcherState) -> dict:
+async def compress_context(state: ResearcherState) -> dict:
+    """Summarize older tool outputs once they exceed the context token threshold.
+
+    Keeps the prompt sent by each llm_call bounded as research iterations grow.
+    The latest turn's tool outputs stay verbatim so the model can react to them;
+    older outputs are condensed into a new entry of research_summaries, their
+    messages are replaced by a short placeholder, and their raw content is kept
+    in raw_notes. If summarization fails, the context is left unchanged.
+    """
+    messages = state["researcher_messages"]
+    last_ai_index = max(i for i, m in enumerate(messages) if isinstance(m, AIMessage))
+    uncompressed = [
+        (i, m) for i, m in enumerate(messages)
+        if isinstance(m, ToolMessage) and m.content != COMPRESSED_TOOL_OUTPUT
+    ]
+    tokens = sum(len(str(m.content)) for _, m in uncompressed) // CHARS_PER_TOKEN
+    older = [m for i, m in uncompressed if i < last_ai_index]
+    if tokens <= context_token_threshold or not older:
+        return {}
+
+    tool_outputs = "\n\n".join(f'<{m.name}>\n{m.content}\n</{m.name}>' for m in older)
+    try:
+        response = await compress_model.ainvoke([
+            HumanMessage(content=compress_research_partial_prompt.format(
+                tool_outputs=tool_outputs,
+                date=get_today_str()
+            ))
+        ])
+    except Exception as e:
+        logger.warning("Failed to compress research context: %s", str(e) or type(e).__name__)
+        return {}
+
+    return {
+        "research_summaries": [str(response.content)],
+        "raw_notes": ["\n".join(str(m.content) for m in older)],
+        # Same ids, so add_messages replaces the original tool outputs
+        "researcher_messages": [
+            ToolMessage(content=COMPRESSED_TOOL_OUTPUT, name=m.name, tool_call_id=m.tool_call_id, id=m.id)
+            for m in older
+        ],
+    }
+
+async def compress_research(state: ResearcherState) -> dict:
     """Compress research findings into a concise summary.
     
-    Takes all the research messages and tool outputs and creates
-    a compressed summary suitable for the supervisor's decision-making.
+    Takes all the research messages and tool outputs, together with the rolling
+    summaries of earlier tool outputs, and creates a compressed summary suitable
+    for the supervisor's decision-making.
     """
     
-    system_message = compress_research_system_prompt.format(date=get_today_str())
+    system_message = with_research_summaries(compress_research_system_prompt.format(date=get_today_str()), state)
     messages = [SystemMessage(content=system_message)] + state.get("researcher_messages", []) + [HumanMessage(content=compress_research_human_message)]
-    response = compress_model.invoke(messages)
+    response = await compress_model.ainvoke(messages)
     
-    # Extract raw notes from tool and AI messages
+    # Extract raw notes from tool and AI messages (compressed outputs are already in raw_notes)
     raw_notes = [
         str(m.content) for m in filter_messages(
             state["researcher_messages"], 
             include_types=["tool", "ai"]
         )
+        if m.content != COMPRESSED_TOOL_OUTPUT
     ]
     
     return {
@@ -128,6 +187,7 @@ agent_builder = StateGraph(ResearcherState, output_schema=ResearcherOutputState)
 # Add nodes to the graph
 agent_builder.add_node("llm_call", llm_call)
 agent_builder.add_node("tool_node", tool_node)
+agent_builder.add_node("compress_context", compress_context)
 agent_builder.add_node("compress_research", compress_research)
 
 # Add edges to connect nodes
@@ -140,7 +200,8 @@ agent_builder.add_conditional_edges(
         "compress_research": "compress_research", # Provide final answer
     },
 )
-agent_builder.add_edge("tool_node", "llm_call") # Loop back for more research
+agent_builder.add_edge("tool_node", "compress_context")
+agent_builder.add_edge("compress_context", "llm_call") # Loop back for more research
 agent_builder.add_edge("compress_research", END)
 
 # Compile the agent
@@ -12,7 +12,10 @@ The system orchestrates the complete research workflow from initial user
 input through final report delivery.
 """
 
+import re
+
 from langchain_core.messages import HumanMessage
+from langgraph.config import get_stream_writer
 from langgraph.graph import StateGraph, START, END
 
 from src.deep_research_from_scratch.utils import get_today_str
@@ -23,19 +26,52 @@ from src.deep_research_from_scratch.multi_agent_supervisor import supervisor_age
 
 # ===== Config =====
 
-from langchain.chat_models import init_chat_model
-#writer_model = init_chat_model(model="openai:gpt-4.1", max_tokens=32000) # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
-writer_model = init_chat_model(model="gemini-2.5-flash", model_provider="google_genai", max_tokens=64000)
+from src.deep_research_from_scratch.model_registry import lazy_model
+#writer_model = lazy_model(model="openai:gpt-4.1", max_tokens=32000) # model="anthropic:claude-sonnet-4-20250514", max_tokens=64000
+writer_model = lazy_model(model="gemini-2.5-flash", model_provider="google_genai", max_tokens=64000)
 
 # ===== FINAL REPORT GENERATION =====
 
 from src.deep_research_from_scratch.state_scope import AgentState
 
+# A markdown heading at the start of a line begins a new report section
+SECTION_HEADING = re.compile(r"^#{1,6} ", re.MULTILINE)
+
+def split_completed_sections(text: str) -> tuple[list[str], str]:
+    """Split streamed report text into completed markdown sections and the rest.
+
+    A section is complete once the next heading has started.
+
+    Args:
+        text: Report text streamed so far that has not been emitted as a section
+
+    Returns:
+        Completed sections, and the trailing text of the section still in progress
+    """
+    starts = [match.start() for match in SECTION_HEADING.finditer(text)]
+    boundaries = [0] + [start for start in starts if start > 0]
+    sections = [text[a:b] for a, b in zip(boundaries, boundaries[1:]) if text[a:b].strip()]
+    return sections, text[boundaries[-1]:]
+
+def content_text(content: str | list) -> str:
+    """Return the text of message content given as a string or a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
+
 async def final_report_generation(state: AgentState):
     """
     Final report generation node.
     
-    Synthesizes all research findings into a comprehensive final report
+    Synthesizes all research findings into a comprehensive final report.
+    The report is streamed from the writer model: every text chunk is emitted as
+    a {"report_delta": ...} custom stream event, and every completed markdown
+    section as {"report_section": ...}, so callers streaming with
+    stream_mode="custom" see output long before the report is finished.
     """
     
     notes = state.get("notes", [])
@@ -47,12 +83,26 @@ async def final_report_generation(state: AgentState):
         findings=findings,
         date=get_today_str()
     )
-    
-    final_report = await writer_model.ainvoke([HumanMessage(content=final_report_prompt)])
-    
+
+    writer = get_stream_writer()
+    chunks = []
+    pending = ""
+    async for chunk in writer_model.astream([HumanMessage(content=final_report_prompt)]):
+        text = content_text(chunk.content)
+        if not text:
+            continue
+        chunks.append(text)
+        writer({"report_delta": text})
+        sections, pending = split_completed_sections(pending + text)
+        for section in sections:
+            writer({"report_section": section})
+    if pending.strip():
+        writer({"report_section": pending})
+
+    final_report = "".join(chunks)
     return {
-        "final_report": final_report.content, 
-        "messages": ["Here is the final report: " + final_report.content],
+        "final_report": final_report, 
+        "messages": ["Here is the final report: " + final_report],
     }
 
 # ===== GRAPH CONSTRUCTION =====
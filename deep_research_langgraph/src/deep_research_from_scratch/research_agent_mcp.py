@@ -12,20 +12,28 @@ Key features:
 - Secure directory access with permission checking
 - Research compression for efficient processing
 - Lazy MCP client initialization for LangGraph Platform compatibility
+- One MCP session kept open across steps, with the tool list and bound model
+  cached until the server reports a tool list change
 """
 
+import asyncio
+import logging
 import os
 
 from typing_extensions import Literal
 
-from langchain.chat_models import init_chat_model
-from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage, filter_messages
+from langchain_core.messages import SystemMessage, HumanMessage, filter_messages
 from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
 from langgraph.graph import StateGraph, START, END
+from mcp.types import ServerNotification, ToolListChangedNotification
 
+from deep_research_from_scratch.model_registry import lazy_model
 from deep_research_from_scratch.prompts import research_agent_prompt_with_mcp, compress_research_system_prompt, compress_research_human_message
 from deep_research_from_scratch.state_research import ResearcherState, ResearcherOutputState
-from deep_research_from_scratch.utils import get_today_str, think_tool, get_current_dir
+from deep_research_from_scratch.utils import get_today_str, think_tool, get_current_dir, execute_tool_calls
+
+logger = logging.getLogger(__name__)
 
 # ===== CONFIGURATION =====
 
@@ -42,19 +50,97 @@ mcp_config = {
     }
 }
 
+MCP_SERVER_NAME = "filesystem"
+
 # Global client variable - will be initialized lazily
 _client = None
 
+# Persistent session state, bound to the event loop that opened the session
+_session = None  # Future resolving to the open ClientSession
+_session_task = None  # Task holding the session open
+_session_loop = None
+_tools = None  # MCP tools bound to the session, plus think_tool
+_model_with_tools = None
+
+async def _on_server_message(message) -> None:
+    """Drop the cached tools when the server reports that its tool list changed."""
+    if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+        invalidate_mcp_tools()
+
 def get_mcp_client():
     """Get or initialize MCP client lazily to avoid issues with LangGraph Platform."""
     global _client
     if _client is None:
-        _client = MultiServerMCPClient(mcp_config)
+        _client = MultiServerMCPClient({
+            name: {**connection, "session_kwargs": {"message_handler": _on_server_message}}
+            for name, connection in mcp_config.items()
+        })
     return _client
 
-# Initialize models
-compress_model = init_chat_model(model="openai:gpt-4.1", max_tokens=32000)
-model = init_chat_model(model="anthropic:claude-sonnet-4-20250514")
+def invalidate_mcp_tools():
+    """Forget the cached tool list and bound model; they are reloaded on next use."""
+    global _tools, _model_with_tools
+    _tools = None
+    _model_with_tools = None
+
+async def _hold_session(session_future: asyncio.Future):
+    """Open the MCP session and keep it open until this task is cancelled."""
+    global _session
+    try:
+        async with get_mcp_client().session(MCP_SERVER_NAME) as session:
+            session_future.set_result(session)
+            await asyncio.Event().wait()
+    except Exception as e:
+        if not session_future.done():
+            session_future.set_exception(e)
+        else:
+            logger.warning("MCP session closed: %s", str(e) or type(e).__name__)
+    finally:
+        if not session_future.done():
+            session_future.cancel()
+        # Tools are bound to this session, so a reconnect must reload them
+        if _session is session_future:
+            _session = None
+            invalidate_mcp_tools()
+
+async def get_mcp_session():
+    """Get the persistent MCP session, opening it on first use or after it closed."""
+    global _session, _session_task, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session_loop is not loop:
+        invalidate_mcp_tools()
+        _session = loop.create_future()
+        _session_loop = loop
+        _session_task = loop.create_task(_hold_session(_session))
+    return await asyncio.shield(_session)
+
+async def close_mcp_session():
+    """Close the persistent MCP session, if one is open on the running loop."""
+    if _session_task is not None and _session_loop is asyncio.get_running_loop():
+        _session_task.cancel()
+        try:
+            await _session_task
+        except asyncio.CancelledError:
+            pass
+
+async def get_mcp_tools() -> list:
+    """Get the MCP tools (plus think_tool), loading them over the persistent session once."""
+    global _tools, _model_with_tools
+    session = await get_mcp_session()
+    if _tools is None:
+        tools = await load_mcp_tools(session, server_name=MCP_SERVER_NAME) + [think_tool]
+        _model_with_tools = model.bind_tools(tools)
+        _tools = tools
+    return _tools
+
+async def get_model_with_tools():
+    """Get the model bound to the cached MCP tools."""
+    await get_mcp_tools()
+    return _model_with_tools
+
+# Declare models (built lazily on first use and shared across modules)
+compress_model = lazy_model(model="openai:gpt-4.1", max_tokens=32000)
+model = lazy_model(model="anthropic:claude-sonnet-4-20250514")
 
 # ===== AGENT NODES =====
 
@@ -62,26 +148,19 @@ async def llm_call(state: ResearcherState):
     """Analyze current state and decide on tool usage with MCP integration.
 
     This node:
-    1. Retrieves available tools from MCP server
-    2. Binds tools to the language model
+    1. Retrieves available tools from MCP server (cached across steps)
+    2. Binds tools to the language model (cached with the tools)
     3. Processes user input and decides on tool usage
 
     Returns updated state with model response.
     """
-    # Get available tools from MCP server
-    client = get_mcp_client()
-    mcp_tools = await client.get_tools()
-
-    # Use MCP tools for local document access
-    tools = mcp_tools + [think_tool]
-
-    # Initialize model with tool binding
-    model_with_tools = model.bind_tools(tools)
+    # Model bound to the MCP tools for local document access plus think_tool
+    model_with_tools = await get_model_with_tools()
 
     # Process user input with system prompt
     return {
         "researcher_messages": [
-            model_with_tools.invoke(
+            await model_with_tools.ainvoke(
                 [SystemMessage(content=research_agent_prompt_with_mcp.format(date=get_today_str()))] + state["researcher_messages"]
             )
         ]
@@ -92,7 +171,7 @@ async def tool_node(state: ResearcherState):
 
     This node:
     1. Retrieves current tool calls from the last message
-    2. Executes all tool calls using async operations (required for MCP)
+    2. Executes all tool calls concurrently using async operations (required for MCP)
     3. Returns formatted tool results
 
     Note: MCP requires async operations due to inter-process communication
@@ -100,43 +179,16 @@ async def tool_node(state: ResearcherState):
     """
     tool_calls = state["researcher_messages"][-1].tool_calls
 
-    async def execute_tools():
-        """Execute all tool calls. MCP tools require async execution."""
-        # Get fresh tool references from MCP server
-        client = get_mcp_client()
-        mcp_tools = await client.get_tools()
-        tools = mcp_tools + [think_tool]
-        tools_by_name = {tool.name: tool for tool in tools}
-
-        # Execute tool calls (sequentially for reliability)
-        observations = []
-        for tool_call in tool_calls:
-            tool = tools_by_name[tool_call["name"]]
-            if tool_call["name"] == "think_tool":
-                # think_tool is sync, use regular invoke
-                observation = tool.invoke(tool_call["args"])
-            else:
-                # MCP tools are async, use ainvoke
-                observation = await tool.ainvoke(tool_call["args"])
-            observations.append(observation)
-
-        # Format results as tool messages
-        tool_outputs = [
-            ToolMessage(
-                content=observation,
-                name=tool_call["name"],
-                tool_call_id=tool_call["id"],
-            )
-            for observation, tool_call in zip(observations, tool_calls)
-        ]
-
-        return tool_outputs
+    # Tools bound to the persistent MCP session
+    tools = await get_mcp_tools()
+    tools_by_name = {tool.name: tool for tool in tools}
 
-    messages = await execute_tools()
+    # Execute tool calls concurrently; each failure is reported in its own message
+    messages = await execute_tool_calls(tool_calls, tools_by_name)
 
     return {"researcher_messages": messages}
 
-def compress_research(state: ResearcherState) -> dict:
+async def compress_research(state: ResearcherState) -> dict:
     """Compress research findings into a concise summary.
 
     Takes all the research messages and tool outputs and creates
@@ -149,7 +201,7 @@ def compress_research(state: ResearcherState) -> dict:
     system_message = compress_research_system_prompt.format(date=get_today_str())
     messages = [SystemMessage(content=system_message)] + state.get("researcher_messages", []) + [HumanMessage(content=compress_research_human_message)]
 
-    response = compress_model.invoke(messages)
+    response = await compress_model.ainvoke(messages)
 
     # Extract raw notes from tool and AI messages
     raw_notes = [
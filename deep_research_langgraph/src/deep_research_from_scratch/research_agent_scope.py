@@ -12,11 +12,11 @@ whether sufficient context exists to proceed with research.
 from datetime import datetime
 from typing_extensions import Literal
 
-from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, AIMessage, get_buffer_string
 from langgraph.graph import StateGraph, START, END
 from langgraph.types import Command
 
+from src.deep_research_from_scratch.model_registry import lazy_model
 from src.deep_research_from_scratch.prompts import clarify_with_user_instructions, transform_messages_into_research_topic_prompt
 from src.deep_research_from_scratch.state_scope import AgentState, ClarifyWithUser, ResearchQuestion, AgentInputState
 
@@ -28,9 +28,9 @@ def get_today_str() -> str:
 
 # ===== CONFIGURATION =====
 
-# Initialize model
-#model = init_chat_model(model="openai:gpt-4.1", temperature=0.0)
-model = init_chat_model("gemini-2.5-flash", model_provider="google_genai", temperature=0)
+# Declare model (built lazily on first use)
+#model = lazy_model(model="openai:gpt-4.1", temperature=0.0)
+model = lazy_model("gemini-2.5-flash", model_provider="google_genai", temperature=0)
 
 # ===== WORKFLOW NODES =====
 
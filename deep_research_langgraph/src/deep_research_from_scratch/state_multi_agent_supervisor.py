@@ -32,6 +32,8 @@ class SupervisorState(TypedDict):
     research_iterations: int = 0
     # Raw unprocessed research notes collected from sub-agent research
     raw_notes: Annotated[list[str], operator.add] = []
+    # Identifier of this research run, shared with its sub-agents (scopes their caches)
+    research_run_id: str
 
 @tool
 class ConductResearch(BaseModel):
@@ -20,12 +20,15 @@ class ResearcherState(TypedDict):
     
     This state tracks the researcher's conversation, iteration count for limiting
     tool calls, the research topic being investigated, compressed findings,
-    and raw research notes for detailed analysis.
+    rolling summaries of older tool outputs, raw research notes for detailed analysis,
+    and the identifier of the research run the researcher belongs to.
     """
     researcher_messages: Annotated[Sequence[BaseMessage], add_messages]
     tool_call_iterations: int
     research_topic: str
+    research_run_id: str
     compressed_research: str
+    research_summaries: Annotated[List[str], operator.add]
     raw_notes: Annotated[List[str], operator.add]
 
 class ResearcherOutputState(TypedDict):
@@ -63,3 +66,7 @@ class Summary(BaseModel):
     """Schema for webpage content summarization."""
     summary: str = Field(description="Concise summary of the webpage content")
     key_excerpts: str = Field(description="Important quotes and excerpts from the content")
+
+class SummaryBatch(BaseModel):
+    """Schema for summarizing several webpages in one call."""
+    summaries: List[Summary] = Field(description="One summary per webpage, in input order")
@@ -5,18 +5,27 @@ This module provides search and content processing utilities for the research ag
 including web search capabilities and content summarization tools.
 """
 
+import asyncio
+import logging
+import re
+import threading
+import uuid
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
 from typing_extensions import Annotated, List, Literal
 
-from langchain.chat_models import init_chat_model
-from langchain_core.messages import HumanMessage
+import httpx
+from langchain_core.messages import HumanMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
-from langchain_core.tools import tool, InjectedToolArg
-from tavily import TavilyClient
+from langchain_core.tools import BaseTool, StructuredTool, tool, InjectedToolArg
+from tavily.errors import TimeoutError as TavilyTimeoutError
 
-from src.deep_research_from_scratch.state_research import Summary
-from src.deep_research_from_scratch.prompts import summarize_webpage_prompt
+from src.deep_research_from_scratch.model_registry import get_tavily_client, lazy_model
+from src.deep_research_from_scratch.state_research import Summary, SummaryBatch
+from src.deep_research_from_scratch.prompts import summarize_webpage_prompt, summarize_webpages_batch_prompt
+
+logger = logging.getLogger(__name__)
 
 # ===== UTILITY FUNCTIONS =====
 
@@ -39,12 +48,79 @@ def get_current_dir() -> Path:
 
 # ===== CONFIGURATION =====
 
-#summarization_model = init_chat_model(model="openai:gpt-4.1-mini")
-summarization_model = init_chat_model("gemini-2.5-flash-lite", model_provider="google_genai")
-tavily_client = TavilyClient()
+#summarization_model = lazy_model(model="openai:gpt-4.1-mini")
+summarization_model = lazy_model("gemini-2.5-flash-lite", model_provider="google_genai")
+
+# Concurrent search settings
+MAX_CONCURRENT_SEARCHES = 5
+SEARCH_TIMEOUT = 30.0  # seconds per query attempt
+SEARCH_RETRIES = 2
+SEARCH_RETRY_BACKOFF = 1.0  # seconds, doubled after each failed attempt
+
+# Batched summarization packs several pages into one model call, up to a token budget
+BATCH_SUMMARIZATION = False
+SUMMARY_BATCH_TOKEN_BUDGET = 30000
+MAX_PAGES_PER_BATCH = 8
+CHARS_PER_TOKEN = 4  # rough estimate, avoids a tokenizer dependency
+
+# Concurrent summarization settings
+MAX_CONCURRENT_SUMMARIES = 5
+SUMMARY_TIMEOUT = 60.0  # seconds per summarization call
+MAX_CACHED_RUNS = 32  # research runs whose per-URL summaries are kept in memory
+MAX_SUMMARIES_PER_RUN = 256  # cached page summaries per research run, oldest dropped first
+
+# Tool calls from a single model turn that may run at once
+MAX_CONCURRENT_TOOL_CALLS = 5
 
 # ===== SEARCH FUNCTIONS =====
 
+async def atavily_search_multiple(
+    search_queries: List[str],
+    max_results: int = 3,
+    topic: Literal["general", "news", "finance"] = "general",
+    include_raw_content: bool = True,
+) -> List[dict]:
+    """Perform search using Tavily API for multiple queries concurrently.
+
+    At most MAX_CONCURRENT_SEARCHES queries run at once. Each attempt is limited
+    to SEARCH_TIMEOUT seconds, and timeouts or transient HTTP errors are retried
+    up to SEARCH_RETRIES times with exponential backoff. A query that still fails
+    yields an empty result set so the other queries are not lost. Searches reuse
+    the event loop's shared client from get_tavily_client.
+
+    Args:
+        search_queries: List of search queries to execute
+        max_results: Maximum number of results per query
+        topic: Topic filter for search results
+        include_raw_content: Whether to include raw webpage content
+
+    Returns:
+        List of search result dictionaries, in the order of search_queries
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+    client = get_tavily_client()
+
+    async def search(query: str) -> dict:
+        async with semaphore:
+            for attempt in range(SEARCH_RETRIES + 1):
+                try:
+                    return await asyncio.wait_for(
+                        client.search(
+                            query,
+                            max_results=max_results,
+                            include_raw_content=include_raw_content,
+                            topic=topic
+                        ),
+                        timeout=SEARCH_TIMEOUT,
+                    )
+                except (TimeoutError, TavilyTimeoutError, httpx.TransportError, httpx.HTTPStatusError) as e:
+                    if attempt == SEARCH_RETRIES:
+                        logger.warning("Search failed for query %r: %s", query, str(e) or type(e).__name__)
+                        return {"query": query, "results": []}
+                    await asyncio.sleep(SEARCH_RETRY_BACKOFF * 2 ** attempt)
+
+    return list(await asyncio.gather(*(search(query) for query in search_queries)))
+
 def tavily_search_multiple(
     search_queries: List[str],
     max_results: int = 3,
@@ -53,6 +129,9 @@ def tavily_search_multiple(
 ) -> List[dict]:
     """Perform search using Tavily API for multiple queries.
 
+    Synchronous entry point for atavily_search_multiple; must not be called from
+    a running event loop (await atavily_search_multiple there instead).
+
     Args:
         search_queries: List of search queries to execute
         max_results: Maximum number of results per query
@@ -62,19 +141,23 @@ def tavily_search_multiple(
     Returns:
         List of search result dictionaries
     """
+    return asyncio.run(atavily_search_multiple(
+        search_queries,
+        max_results=max_results,
+        topic=topic,
+        include_raw_content=include_raw_content,
+    ))
+
+def format_summary(summary: Summary) -> str:
+    """Format a summary with clear structure for the research agent."""
+    return (
+        f"<summary>\n{summary.summary}\n</summary>\n\n"
+        f"<key_excerpts>\n{summary.key_excerpts}\n</key_excerpts>"
+    )
 
-    # Execute searches sequentially. Note: yon can use AsyncTavilyClient to parallelize this step.
-    search_docs = []
-    for query in search_queries:
-        result = tavily_client.search(
-            query,
-            max_results=max_results,
-            include_raw_content=include_raw_content,
-            topic=topic
-        )
-        search_docs.append(result)
-
-    return search_docs
+def truncate_content(webpage_content: str) -> str:
+    """Fallback used when a webpage cannot be summarized."""
+    return webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
 
 def summarize_webpage_content(webpage_content: str) -> str:
     """Summarize webpage content using the configured summarization model.
@@ -97,17 +180,131 @@ def summarize_webpage_content(webpage_content: str) -> str:
             ))
         ])
 
-        # Format summary with clear structure
-        formatted_summary = (
-            f"<summary>\n{summary.summary}\n</summary>\n\n"
-            f"<key_excerpts>\n{summary.key_excerpts}\n</key_excerpts>"
-        )
-
-        return formatted_summary
+        return format_summary(summary)
 
     except Exception as e:
         print(f"Failed to summarize webpage: {str(e)}")
-        return webpage_content[:1000] + "..." if len(webpage_content) > 1000 else webpage_content
+        return truncate_content(webpage_content)
+
+async def asummarize_webpage(webpage_content: str) -> Summary:
+    """Summarize webpage content asynchronously, raising on failure.
+
+    Args:
+        webpage_content: Raw webpage content to summarize
+
+    Returns:
+        Structured summary of the webpage
+    """
+    structured_model = summarization_model.with_structured_output(Summary)
+    return await structured_model.ainvoke([
+        HumanMessage(content=summarize_webpage_prompt.format(
+            webpage_content=webpage_content,
+            date=get_today_str()
+        ))
+    ])
+
+def pack_summary_batches(webpage_contents: List[str]) -> List[List[int]]:
+    """Greedily group page indexes into batches that fit the summary token budget.
+
+    Args:
+        webpage_contents: Raw webpage contents to summarize
+
+    Returns:
+        Lists of indexes into webpage_contents, one list per model call
+    """
+    batches = []
+    current, current_tokens = [], 0
+    for i, content in enumerate(webpage_contents):
+        tokens = len(content) // CHARS_PER_TOKEN + 1
+        if current and (
+            current_tokens + tokens > SUMMARY_BATCH_TOKEN_BUDGET
+            or len(current) >= MAX_PAGES_PER_BATCH
+        ):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+async def asummarize_webpage_batch(webpage_contents: List[str]) -> List[Summary]:
+    """Summarize several webpages with a single structured-output model call.
+
+    Args:
+        webpage_contents: Raw webpage contents to summarize together
+
+    Returns:
+        One Summary per webpage, in input order
+
+    Raises:
+        ValueError: If the model returns a different number of summaries
+    """
+    webpages = "\n\n".join(
+        f'<webpage index="{i}">\n{content}\n</webpage>'
+        for i, content in enumerate(webpage_contents, 1)
+    )
+    structured_model = summarization_model.with_structured_output(SummaryBatch)
+    batch = await structured_model.ainvoke([
+        HumanMessage(content=summarize_webpages_batch_prompt.format(
+            count=len(webpage_contents),
+            webpages=webpages,
+            date=get_today_str()
+        ))
+    ])
+    if len(batch.summaries) != len(webpage_contents):
+        raise ValueError(
+            f"Expected {len(webpage_contents)} summaries, got {len(batch.summaries)}"
+        )
+    return batch.summaries
+
+# Successful summaries keyed by URL, one dict per research run (LRU over runs)
+_summary_caches: OrderedDict = OrderedDict()
+_summary_caches_lock = threading.Lock()
+
+def new_research_run_id() -> str:
+    """Return a fresh identifier for one top-level research run."""
+    return uuid.uuid4().hex
+
+def research_run_config(config: RunnableConfig | None, research_run_id: str) -> RunnableConfig:
+    """Return the config for tool calls made on behalf of a research run.
+
+    Args:
+        config: Config of the calling graph node
+        research_run_id: Identifier of the research run, from the graph state
+
+    Returns:
+        Config whose configurable carries research_run_id next to the node's own values
+    """
+    configurable = (config or {}).get("configurable") or {}
+    return {"configurable": {**configurable, "research_run_id": research_run_id}}
+
+def get_research_run_key(config: RunnableConfig | None) -> str | None:
+    """Identify the research run a tool call belongs to.
+
+    The research graphs pass the research_run_id from their state into tool calls
+    (see research_run_config). Calls made outside a research run have no key and
+    get no cross-call summary cache.
+    """
+    return ((config or {}).get("configurable") or {}).get("research_run_id")
+
+def get_summary_cache(run_key: str | None) -> dict:
+    """Return the URL -> formatted summary cache for a research run.
+
+    Without a run key a fresh dict is returned, so unrelated anonymous runs
+    never share or accumulate summaries.
+    """
+    if run_key is None:
+        return {}
+    with _summary_caches_lock:
+        cache = _summary_caches.get(run_key)
+        if cache is None:
+            cache = _summary_caches[run_key] = {}
+            while len(_summary_caches) > MAX_CACHED_RUNS:
+                _summary_caches.popitem(last=False)
+        else:
+            _summary_caches.move_to_end(run_key)
+        return cache
 
 def deduplicate_search_results(search_results: List[dict]) -> dict:
     """Deduplicate search results by URL to avoid processing duplicate content.
@@ -128,32 +325,103 @@ def deduplicate_search_results(search_results: List[dict]) -> dict:
 
     return unique_results
 
-def process_search_results(unique_results: dict) -> dict:
+async def aprocess_search_results(unique_results: dict, run_key: str | None = None) -> dict:
     """Process search results by summarizing content where available.
 
+    Pages are summarized concurrently, at most MAX_CONCURRENT_SUMMARIES model
+    calls at a time. A call that fails or exceeds SUMMARY_TIMEOUT falls back to
+    the truncated raw content. Successful summaries are cached by URL for the
+    research run, so pages returned again by later searches are not re-summarized.
+    With BATCH_SUMMARIZATION, pages are packed into batched calls instead.
+
     Args:
         unique_results: Dictionary of unique search results
+        run_key: Research run identifier from get_research_run_key
 
     Returns:
-        Dictionary of processed results with summaries
+        Dictionary of processed results with summaries, in the order of unique_results
     """
-    summarized_results = {}
+    cache = get_summary_cache(run_key)
+    summaries = {}
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+
+    async def summarize_page(url: str) -> None:
+        raw_content = unique_results[url]['raw_content']
+        try:
+            async with semaphore:
+                summary = await asyncio.wait_for(asummarize_webpage(raw_content), timeout=SUMMARY_TIMEOUT)
+            summaries[url] = cache[url] = format_summary(summary)
+        except Exception as e:
+            logger.warning("Failed to summarize webpage: %s", str(e) or type(e).__name__)
+            summaries[url] = truncate_content(raw_content)
+
+    async def summarize_batch(urls: List[str]) -> None:
+        if len(urls) > 1:
+            contents = [unique_results[url]['raw_content'] for url in urls]
+            try:
+                async with semaphore:
+                    batch = await asyncio.wait_for(asummarize_webpage_batch(contents), timeout=SUMMARY_TIMEOUT)
+                for url, summary in zip(urls, batch):
+                    summaries[url] = cache[url] = format_summary(summary)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Failed to summarize webpage batch, falling back to per-page calls: %s",
+                    str(e) or type(e).__name__,
+                )
+        await asyncio.gather(*(summarize_page(url) for url in urls))
+
+    # Take cached summaries up front; a concurrent search of the same run may
+    # drop them from the cache while this one is still summarizing
+    summaries.update({url: cache[url] for url in unique_results if url in cache})
+    pending = [
+        url for url, result in unique_results.items()
+        if result.get("raw_content") and url not in summaries
+    ]
+    if BATCH_SUMMARIZATION:
+        contents = [unique_results[url]['raw_content'] for url in pending]
+        batches = [[pending[i] for i in batch] for batch in pack_summary_batches(contents)]
+        await asyncio.gather(*(summarize_batch(urls) for urls in batches))
+    else:
+        await asyncio.gather(*(summarize_page(url) for url in pending))
 
+    summarized_results = {}
     for url, result in unique_results.items():
         # Use existing content if no raw content for summarization
         if not result.get("raw_content"):
             content = result['content']
         else:
-            # Summarize raw content for better processing
-            content = summarize_webpage_content(result['raw_content'])
+            content = summaries[url]
 
         summarized_results[url] = {
             'title': result['title'],
             'content': content
         }
 
+    # Keep the per-run cache bounded; dicts iterate oldest entry first
+    while len(cache) > MAX_SUMMARIES_PER_RUN:
+        cache.pop(next(iter(cache)), None)
+
     return summarized_results
 
+def process_search_results(unique_results: dict, run_key: str | None = None) -> dict:
+    """Process search results by summarizing content where available.
+
+    Synchronous entry point for aprocess_search_results; must not be called from
+    a running event loop (await aprocess_search_results there instead).
+
+    Args:
+        unique_results: Dictionary of unique search results
+        run_key: Research run identifier from get_research_run_key
+
+    Returns:
+        Dictionary of processed results with summaries
+    """
+    return asyncio.run(aprocess_search_results(unique_results, run_key))
+
+# Lines of a summary that look like the source block terminator
+SOURCE_RULE_LINE = re.compile(r"^-{80}$", re.MULTILINE)
+
 def format_search_output(summarized_results: dict) -> str:
     """Format search results into a well-structured string output.
 
@@ -169,33 +437,104 @@ def format_search_output(summarized_results: dict) -> str:
     formatted_output = "Search results: \n\n"
 
     for i, (url, result) in enumerate(summarized_results.items(), 1):
+        # A page's own 80-dash rule would read as the end of the source block
+        content = SOURCE_RULE_LINE.sub("-" * 40, result['content'])
         formatted_output += f"\n\n--- SOURCE {i}: {result['title']} ---\n"
         formatted_output += f"URL: {url}\n\n"
-        formatted_output += f"SUMMARY:\n{result['content']}\n\n"
+        formatted_output += f"SUMMARY:\n{content}\n\n"
         formatted_output += "-" * 80 + "\n"
 
     return formatted_output
 
+# One source block of format_search_output; group 1 is the URL. The block ends at
+# a blank line followed by a line of exactly 80 dashes, which format_search_output
+# never lets through from the summary itself.
+SOURCE_BLOCK = re.compile(
+    r"\n\n--- SOURCE \d+: [^\n]* ---\nURL: (\S+)\n\nSUMMARY:\n.*?\n\n-{80}\n", re.DOTALL
+)
+
+def deduplicate_source_blocks(text: str, seen_urls: set) -> str:
+    """Replace search output source blocks for already seen URLs with a one-line reference.
+
+    Args:
+        text: Text containing formatted search output (e.g. raw research notes)
+        seen_urls: URLs kept so far; updated with the URLs kept from text
+
+    Returns:
+        The text with repeated source blocks collapsed
+    """
+    def replace(match: re.Match) -> str:
+        url = match.group(1)
+        if url in seen_urls:
+            return f"\n\n--- DUPLICATE SOURCE: {url} ---\n"
+        seen_urls.add(url)
+        return match.group(0)
+
+    return SOURCE_BLOCK.sub(replace, text)
+
+async def execute_tool_calls(
+    tool_calls: List[dict],
+    tools_by_name: dict[str, BaseTool],
+    max_concurrency: int | None = None,
+    config: RunnableConfig | None = None,
+) -> List[ToolMessage]:
+    """Execute the tool calls of one model turn concurrently.
+
+    At most max_concurrency calls run at once; sync tools run in a worker thread.
+    A call that raises (or names an unknown tool) produces an error ToolMessage
+    without affecting the other calls.
+
+    Args:
+        tool_calls: Tool calls from the last AI message
+        tools_by_name: Available tools keyed by name
+        max_concurrency: Maximum number of tool calls running at once
+            (defaults to MAX_CONCURRENT_TOOL_CALLS)
+        config: Config passed to every tool call
+
+    Returns:
+        One ToolMessage per tool call, in the order of tool_calls
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or MAX_CONCURRENT_TOOL_CALLS)
+
+    async def execute(tool_call: dict) -> ToolMessage:
+        async with semaphore:
+            try:
+                observation = await tools_by_name[tool_call["name"]].ainvoke(tool_call["args"], config=config)
+                status = "success"
+            except Exception as e:
+                logger.warning("Tool %s failed: %s", tool_call["name"], str(e) or type(e).__name__)
+                observation = f"Error executing {tool_call['name']}: {str(e) or type(e).__name__}"
+                status = "error"
+        return ToolMessage(
+            content=observation,
+            name=tool_call["name"],
+            tool_call_id=tool_call["id"],
+            status=status,
+        )
+
+    return list(await asyncio.gather(*(execute(tool_call) for tool_call in tool_calls)))
+
 # ===== RESEARCH TOOLS =====
 
-@tool(parse_docstring=True)
-def tavily_search(
+async def atavily_search(
     query: str,
-    max_results: Annotated[int, InjectedToolArg] = 3,
-    topic: Annotated[Literal["general", "news", "finance"], InjectedToolArg] = "general",
+    max_results: int = 3,
+    topic: Literal["general", "news", "finance"] = "general",
+    run_key: str | None = None,
 ) -> str:
-    """Fetch results from Tavily search API with content summarization.
+    """Search, summarize and format results for a single query.
 
     Args:
         query: A single search query to execute
         max_results: Maximum number of results to return
-        topic: Topic to filter results by ('general', 'news', 'finance')
+        topic: Topic to filter results by
+        run_key: Research run identifier from get_research_run_key
 
     Returns:
         Formatted string of search results with summaries
     """
     # Execute search for single query
-    search_results = tavily_search_multiple(
+    search_results = await atavily_search_multiple(
         [query],  # Convert single query to list for the internal function
         max_results=max_results,
         topic=topic,
@@ -205,12 +544,48 @@ def tavily_search(
     # Deduplicate results by URL to avoid processing duplicate content
     unique_results = deduplicate_search_results(search_results)
 
-    # Process results with summarization
-    summarized_results = process_search_results(unique_results)
+    # Process results with concurrent summarization
+    summarized_results = await aprocess_search_results(unique_results, run_key)
 
     # Format output for consumption
     return format_search_output(summarized_results)
 
+def _tavily_search(
+    query: str,
+    max_results: Annotated[int, InjectedToolArg] = 3,
+    topic: Annotated[Literal["general", "news", "finance"], InjectedToolArg] = "general",
+    config: RunnableConfig = None,
+) -> str:
+    """Fetch results from Tavily search API with content summarization.
+
+    Args:
+        query: A single search query to execute
+        max_results: Maximum number of results to return
+        topic: Topic to filter results by ('general', 'news', 'finance')
+
+    Returns:
+        Formatted string of search results with summaries
+    """
+    return asyncio.run(atavily_search(query, max_results, topic, get_research_run_key(config)))
+
+async def _atavily_search(
+    query: str,
+    max_results: int = 3,
+    topic: Literal["general", "news", "finance"] = "general",
+    config: RunnableConfig = None,
+) -> str:
+    """Async implementation of tavily_search, awaited on the caller's event loop."""
+    return await atavily_search(query, max_results, topic, get_research_run_key(config))
+
+# Async callers (the researcher's tool node) await the coroutine on their own
+# event loop; sync invoke still works outside a running loop
+tavily_search = StructuredTool.from_function(
+    func=_tavily_search,
+    coroutine=_atavily_search,
+    name="tavily_search",
+    parse_docstring=True,
+)
+
 @tool(parse_docstring=True)
 def think_tool(reflection: str) -> str:
     """Tool for strategic reflection on research progress and decision-making.
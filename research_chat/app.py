@@ -1,4 +1,5 @@
 import gradio as gr
+import logging
 import os
 from typing import List, Dict, Any, AsyncGenerator
 import json
@@ -18,15 +19,40 @@ import asyncio
 # Load environment variables
 load_dotenv()
 
-# Store chat history
-chat_history = []
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+logger = logging.getLogger("research_chat")
 
-async def process_message(message: str, effort: str, model: str) -> AsyncGenerator[List[Dict], None]:
+# Research runs processed at once; further requests wait in the queue
+CONCURRENCY_LIMIT = int(os.getenv("RESEARCH_CHAT_CONCURRENCY_LIMIT", "4"))
+# Requests allowed to wait in the queue before new ones are turned away
+MAX_QUEUE_SIZE = int(os.getenv("RESEARCH_CHAT_MAX_QUEUE_SIZE", "32"))
+
+
+async def process_message(
+    message: str, effort: str, model: str, chat_history: List[Dict]
+) -> AsyncGenerator[tuple, None]:
+    """
+    Run a research request and stream the chat history of the session as it progresses.
+
+    Args:
+        message: The user's question
+        effort: Research effort level ("low", "medium" or "high")
+        model: Gemini model selected in the interface
+        chat_history: Chat history of this browser session, held in a gr.State
+
+    Yields:
+        tuple: The chat history to display, the new textbox value (None to keep
+               it), and the session's chat history
+    """
+    request_start = time.perf_counter()
     try:
         # Add initial message to chat history
         chat_history.append({"role": "user", "content": message})
         #chat_history.append({"role": "assistant", "content": "Starting research process..."})
-        yield chat_history.copy(), None  # Don't clear textbox during intermediate updates
+        yield chat_history.copy(), None, chat_history  # Don't clear textbox during intermediate updates
         
         if effort == "low":
             initial_search_query_count = 1
@@ -38,7 +64,8 @@ async def process_message(message: str, effort: str, model: str) -> AsyncGenerat
             initial_search_query_count = 5
             max_research_loops = 10
         else:
-            yield []
+            logger.warning("Unknown effort level %r", effort)
+            yield chat_history.copy(), "", chat_history
             return
 
         config = Configuration(
@@ -58,11 +85,12 @@ async def process_message(message: str, effort: str, model: str) -> AsyncGenerat
             "research_loop_count": 0,
             "reasoning_model": model
         }
+        logger.info("Research started: effort=%s model=%s", effort, model)
         
         # Add initial message to chat history
         #chat_history.append({"role": "user", "content": message})
         chat_history.append({"role": "assistant", "content": "Starting research process..."})
-        yield chat_history.copy(), None  # Don't clear textbox during intermediate updates
+        yield chat_history.copy(), None, chat_history  # Don't clear textbox during intermediate updates
         
         
         # Process the message using astream
@@ -71,11 +99,8 @@ async def process_message(message: str, effort: str, model: str) -> AsyncGenerat
             initial_state,
             config={"configurable": config.model_dump()}
         ):
-            print("\n")
-            print("\n")
-            print("Received event:", event)  # Debug log
-            print("\n")
-            print("\n")
+            # Events hold whole search results; log which node produced them, not their content
+            logger.debug("Received event from %s", ", ".join(event))
             # Handle different types of events
             current_activity = ""
             if "generate_query" in event:
@@ -95,7 +120,7 @@ async def process_message(message: str, effort: str, model: str) -> AsyncGenerat
             elif "finalize_answer" in event:
                 current_activity = "📝 Composing final answer..."
                 chat_history[-1] = {"role": "assistant", "content": current_activity}
-                yield chat_history.copy(), None  # Don't clear textbox during intermediate updates
+                yield chat_history.copy(), None, chat_history  # Don't clear textbox during intermediate updates
                 
                 # Extract the final result from the finalize_answer event
                 if "messages" in event["finalize_answer"]:
@@ -104,7 +129,11 @@ async def process_message(message: str, effort: str, model: str) -> AsyncGenerat
                         last_message = messages[-1]
                         if hasattr(last_message, "content"):
                             final_result = last_message.content
-                            print("Final result received:", final_result)  # Debug log
+                            logger.info(
+                                "Research finished in %.1fs, answer of %d chars",
+                                time.perf_counter() - request_start,
+                                len(final_result),
+                            )
                             # Format the result in markdown
                             formatted_result = final_result.replace("\n\n", "\n").replace("\n*", "\n\n*")
                             chat_history.pop()
@@ -112,25 +141,26 @@ async def process_message(message: str, effort: str, model: str) -> AsyncGenerat
                             #chat_history[-1] = {"role": "assistant", "content": formatted_result}
                             current_activity = "\n✅ Research complete!"
                             chat_history.append({"role": "assistant", "content": current_activity})
-                            yield chat_history.copy(), ""  # Return empty string to clear textbox
+                            yield chat_history.copy(), "", chat_history  # Return empty string to clear textbox
 
                             return
                             
             if current_activity:
                 # Update the last assistant message with current activity
                 chat_history[-1] = {"role": "assistant", "content": current_activity}
-                yield chat_history.copy(), None  # Don't clear textbox during intermediate updates
+                yield chat_history.copy(), None, chat_history  # Don't clear textbox during intermediate updates
 
         if not final_result:
             # If no final result was received, add an error message
+            logger.warning("Research ended without a final answer")
             chat_history.append({"role": "assistant", "content": "❌ No response received from the research process."})
-            yield chat_history.copy(), ""  # Return empty string to clear textbox
+            yield chat_history.copy(), "", chat_history  # Return empty string to clear textbox
 
     except Exception as e:
-        print("Error occurred:", str(e))  # Debug log
+        logger.exception("Research failed")
         error_message = f"❌ Error: {str(e)}"
         chat_history.append({"role": "assistant", "content": error_message})
-        yield chat_history.copy(), ""  # Return empty string to clear textbox
+        yield chat_history.copy(), "", chat_history  # Return empty string to clear textbox
 
 
 with gr.Blocks(
@@ -216,6 +246,9 @@ with gr.Blocks(
         elem_id="title"
     )
     
+    # Chat history of each browser session
+    chat_state = gr.State([])
+
     with gr.Column(elem_id="main-container"):
         # Chat history display
         chat_history_display = gr.Chatbot(
@@ -260,16 +293,23 @@ with gr.Blocks(
 
     submit.click(
         process_message,
-        [msg, effort, model],
-        [chat_history_display, msg],  # Added msg to outputs to clear it
-        api_name="process_message"
+        [msg, effort, model, chat_state],
+        [chat_history_display, msg, chat_state],  # Added msg to outputs to clear it
+        api_name="process_message",
+        concurrency_limit=CONCURRENCY_LIMIT,
+        concurrency_id="research",
     )
 
     msg.submit(
         process_message,
-        [msg, effort, model],
-        [chat_history_display, msg],  # Added msg to outputs to clear it
-        api_name="process_message"
+        [msg, effort, model, chat_state],
+        [chat_history_display, msg, chat_state],  # Added msg to outputs to clear it
+        api_name="process_message",
+        concurrency_limit=CONCURRENCY_LIMIT,
+        concurrency_id="research",  # Shares the limit with the Send button
     )
 
-demo.launch(server_name="0.0.0.0", server_port=7860, debug=True, inbrowser=True)
\ No newline at end of file
+demo.queue(max_size=MAX_QUEUE_SIZE)
+
+if __name__ == "__main__":
+    demo.launch(server_name="0.0.0.0", server_port=7860, debug=True, inbrowser=True)
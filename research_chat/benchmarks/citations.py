@@ -0,0 +1,97 @@
+"""Micro-benchmark citation marker insertion and short url expansion.
+
+A synthetic 50 KB answer gets 500 citations, some sharing an end index, each
+citing one to three of 500 sources. The previous implementations (re-slicing
+the text for every citation, and one str.replace scan of the answer per
+gathered source) are timed against insert_citation_markers and
+expand_short_urls, and their outputs are checked to be identical.
+
+Run from the research_chat directory:
+    python -m benchmarks.citations
+"""
+
+import random
+import time
+
+from utils import expand_short_urls, insert_citation_markers
+
+TEXT_BYTES = 50_000
+CITATIONS = 500
+QUERIES = 50
+CHUNKS_PER_QUERY = 10
+ROUNDS = 20
+PREFIX = "https://vertexaisearch.cloud.google.com/id/"
+
+
+def legacy_insert_citation_markers(text, citations_list):
+    sorted_citations = sorted(
+        citations_list, key=lambda c: (c["end_index"], c["start_index"]), reverse=True
+    )
+    modified_text = text
+    for citation_info in sorted_citations:
+        end_idx = citation_info["end_index"]
+        marker_to_insert = ""
+        for segment in citation_info["segments"]:
+            marker_to_insert += f" [{segment['label']}]({segment['short_url']})"
+        modified_text = (
+            modified_text[:end_idx] + marker_to_insert + modified_text[end_idx:]
+        )
+    return modified_text
+
+
+def legacy_expand_short_urls(text, sources):
+    unique_sources = []
+    for source in sources:
+        if source["short_url"] in text:
+            text = text.replace(source["short_url"], source["value"])
+            unique_sources.append(source)
+    return text, unique_sources
+
+
+def best_ms(fn, *args) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    rng = random.Random(0)
+    words = [rng.choice(["gemini", "model", "latency", "benchmark", "release", "quota"]) for _ in range(TEXT_BYTES // 7)]
+    text = " ".join(words)[:TEXT_BYTES]
+
+    sources = [
+        {
+            "label": f"site{query}",
+            "short_url": f"{PREFIX}{query}-{chunk}",
+            "value": f"https://vertexaisearch.cloud.google.com/grounding-api-redirect/{query}x{chunk}",
+        }
+        for query in range(QUERIES)
+        for chunk in range(CHUNKS_PER_QUERY)
+    ]
+    ends = rng.sample(range(1, len(text)), CITATIONS - CITATIONS // 10)
+    ends += rng.sample(ends, CITATIONS // 10)  # some citations share an end index
+    citations = []
+    for end in ends:
+        start = max(0, end - rng.randint(20, 200))
+        citations.append({"start_index": start, "end_index": end, "segments": rng.sample(sources, rng.randint(1, 3))})
+    # Sources in the order web research gathers them, duplicates included
+    gathered = [segment for citation in citations for segment in citation["segments"]]
+
+    answer = insert_citation_markers(text, citations)
+    assert answer == legacy_insert_citation_markers(text, citations)
+    assert expand_short_urls(answer, gathered) == legacy_expand_short_urls(answer, gathered)
+
+    print(f"text: {len(text)} bytes, citations: {len(citations)}, gathered sources: {len(gathered)}, "
+          f"answer: {len(answer)} bytes")
+    print(f"{'step':>24} {'previous (ms)':>14} {'single pass (ms)':>17}")
+    print(f"{'insert_citation_markers':>24} {best_ms(legacy_insert_citation_markers, text, citations):>14.2f} "
+          f"{best_ms(insert_citation_markers, text, citations):>17.2f}")
+    print(f"{'expand short urls':>24} {best_ms(legacy_expand_short_urls, answer, gathered):>14.2f} "
+          f"{best_ms(expand_short_urls, answer, gathered):>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Benchmark sustained Gemini throughput under per-key quotas.
+
+A fake Gemini endpoint enforces a sliding-window quota per (API key, model) and
+answers over-quota requests with a 429 carrying a retryDelay, like the real API.
+Concurrent web_research branches keep issuing queries for a fixed number of
+quota windows, first through the previous try_all_clients (shuffled keys, a
+blocking time.sleep with doubling backoff once every key failed, one worker
+thread per branch as LangGraph runs sync nodes) and then through
+GeminiClientPool. Time is scaled so a quota "minute" lasts PERIOD seconds.
+
+Run from the research_chat directory:
+    python -m benchmarks.gemini_quota
+"""
+
+import asyncio
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from google.genai import Client
+
+from client_pool import GeminiClientPool
+
+# Rate-limit warnings are expected here; the 429 count is reported instead
+logging.getLogger("client_pool").setLevel(logging.ERROR)
+
+KEYS = 3
+MODELS = ["gemini-2.0-flash", "gemini-2.5-flash-preview-04-17", "gemini-2.5-flash-preview-05-20"]
+REQUESTS_PER_MINUTE = 10
+PERIOD = 2.0  # seconds standing in for one quota minute
+MINUTES = 10
+BRANCHES = 12
+LATENCY = 0.05
+
+# The previous backoff started at 15 seconds of a 60 second quota window
+LEGACY_WAIT = 15 / 60 * PERIOD
+
+RESPONSE = json.dumps({
+    "candidates": [{"content": {"role": "model", "parts": [{"text": "result"}]}}],
+}).encode()
+
+
+class FakeGemini:
+    """Counts requests and enforces a sliding-window quota per (key, model)."""
+
+    def __init__(self):
+        self.windows = defaultdict(deque)
+        self.lock = threading.Lock()
+        self.accepted = 0
+        self.rejected = 0
+
+    def admit(self, key: str, model: str) -> float:
+        """Return 0 if the request is within quota, else the seconds until it would be."""
+        now = time.monotonic()
+        with self.lock:
+            window = self.windows[(key, model)]
+            while window and window[0] <= now - PERIOD:
+                window.popleft()
+            if len(window) < REQUESTS_PER_MINUTE:
+                window.append(now)
+                self.accepted += 1
+                return 0.0
+            self.rejected += 1
+            return window[0] + PERIOD - now
+
+
+def serve(fake: FakeGemini) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            model = re.search(r"models/([^:]+):", self.path).group(1)
+            retry_after = fake.admit(self.headers["x-goog-api-key"], model)
+            time.sleep(LATENCY)
+            if retry_after:
+                body = json.dumps({"error": {
+                    "code": 429,
+                    "message": "You exceeded your current quota.",
+                    "status": "RESOURCE_EXHAUSTED",
+                    "details": [{
+                        "@type": "type.googleapis.com/google.rpc.RetryInfo",
+                        "retryDelay": f"{retry_after:.2f}s",
+                    }],
+                }}).encode()
+                self.send_response(429)
+            else:
+                body = RESPONSE
+                self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def legacy_try_all_clients(clients, api_call_fn, max_retries=5, wait_seconds=LEGACY_WAIT):
+    """The previous try_all_clients, with its first wait scaled to PERIOD."""
+    for attempt in range(max_retries):
+        last_exception = None
+        shuffled = clients.copy()
+        random.shuffle(shuffled)
+        for client in shuffled:
+            try:
+                return api_call_fn(client)
+            except Exception as e:
+                err_str = str(e).lower()
+                if "429" in err_str or "quota" in err_str:
+                    last_exception = e
+                    continue
+                raise
+        if attempt < max_retries - 1:
+            time.sleep(wait_seconds)
+            wait_seconds *= 2
+    raise last_exception
+
+
+async def run_legacy(clients, deadline: float) -> list:
+    def branch():
+        latencies = []
+        while time.monotonic() < deadline:
+            start = time.monotonic()
+            legacy_try_all_clients(clients, lambda client: client.models.generate_content(
+                model=random.choice(MODELS), contents="query",
+            ))
+            latencies.append(time.monotonic() - start)
+        return latencies
+
+    results = await asyncio.gather(*(asyncio.to_thread(branch) for _ in range(BRANCHES)))
+    return [latency for latencies in results for latency in latencies]
+
+
+async def run_pool(clients, deadline: float) -> list:
+    pool = GeminiClientPool(clients, MODELS, requests_per_minute=REQUESTS_PER_MINUTE, period=PERIOD)
+
+    async def api_call(client, model):
+        return await client.aio.models.generate_content(model=model, contents="query")
+
+    async def branch():
+        latencies = []
+        while time.monotonic() < deadline:
+            start = time.monotonic()
+            await pool.call(api_call)
+            latencies.append(time.monotonic() - start)
+        return latencies
+
+    results = await asyncio.gather(*(branch() for _ in range(BRANCHES)))
+    return [latency for latencies in results for latency in latencies]
+
+
+async def main():
+    print(f"keys: {KEYS}, models: {len(MODELS)}, quota: {REQUESTS_PER_MINUTE} per key and model per minute, "
+          f"branches: {BRANCHES}, minutes: {MINUTES} (1 minute = {PERIOD}s)")
+    print(f"quota ceiling: {KEYS * len(MODELS) * REQUESTS_PER_MINUTE} queries per minute")
+    print(f"{'mode':>8} {'queries/min':>12} {'429s':>6} {'p50 (min)':>10} {'max (min)':>10}")
+    for mode, run in [("previous", run_legacy), ("pool", run_pool)]:
+        fake = FakeGemini()
+        server = serve(fake)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        clients = [Client(api_key=f"key-{i}", http_options={"base_url": base_url}) for i in range(KEYS)]
+        start = time.monotonic()
+        latencies = await run(clients, start + MINUTES * PERIOD)
+        minutes = (time.monotonic() - start) / PERIOD
+        server.shutdown()
+        latencies.sort()
+        print(f"{mode:>8} {len(latencies) / minutes:>12.1f} {fake.rejected:>6} "
+              f"{latencies[len(latencies) // 2] / PERIOD:>10.2f} {latencies[-1] / PERIOD:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""Benchmark per-node overhead of building chat models per call vs reusing them.
+
+The generate_query, reflection and finalize_answer nodes are run against a fake
+Gemini endpoint that answers instantly over keep-alive HTTP. "per call" clears
+the model registry before every node call, which is what building a new
+ChatGoogleGenerativeAI (and structured-output binding) on every step did;
+"shared" keeps the registry across calls and runs. Connections to the real API
+also pay a TLS handshake per new client, which this local endpoint does not.
+
+Run from the research_chat directory:
+    python -m benchmarks.llm_reuse
+"""
+
+import functools
+import json
+import os
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Dummy credentials so the graph can be imported offline
+for i in range(1, 4):
+    os.environ.setdefault(f"GEMINI_API_KEY_{i}", f"benchmark-{i}")
+
+from langchain_core.messages import HumanMessage  # noqa: E402
+from langchain_google_genai import ChatGoogleGenerativeAI  # noqa: E402
+
+import graph  # noqa: E402
+import llm_registry  # noqa: E402
+
+ROUNDS = 30
+
+# One body that parses as every structured output the nodes ask for
+ANSWER = json.dumps({
+    "query": ["query"],
+    "rationale": "rationale",
+    "is_sufficient": False,
+    "knowledge_gap": "gap",
+    "follow_up_queries": ["follow up"],
+})
+RESPONSE = json.dumps({
+    "candidates": [{"content": {"role": "model", "parts": [{"text": ANSWER}]}, "finishReason": "STOP"}],
+}).encode()
+
+
+def serve() -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(RESPONSE)))
+            self.end_headers()
+            self.wfile.write(RESPONSE)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def clear_registry():
+    llm_registry.get_llm.cache_clear()
+    llm_registry.get_structured_llm.cache_clear()
+
+
+def node_ms(node, state, shared: bool) -> float:
+    """Median milliseconds of one node call."""
+    timings = []
+    for _ in range(ROUNDS):
+        if not shared:
+            clear_registry()
+        start = time.perf_counter()
+        node(state, {"configurable": {}})
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    server = serve()
+    llm_registry.ChatGoogleGenerativeAI = functools.partial(
+        ChatGoogleGenerativeAI, base_url=f"http://127.0.0.1:{server.server_address[1]}"
+    )
+    state = {
+        "messages": [HumanMessage(content="What changed in the latest Gemini release?")],
+        "search_query": ["query"],
+        "web_research_result": ["finding"],
+        "sources_gathered": [],
+        "initial_search_query_count": 3,
+        "research_loop_count": 0,
+        "reasoning_model": "gemini-2.0-flash",
+    }
+    nodes = [
+        ("generate_query", graph.generate_query),
+        ("reflection", graph.reflection),
+        ("finalize_answer", graph.finalize_answer),
+    ]
+
+    print(f"rounds per node: {ROUNDS}, median per call")
+    print(f"{'node':>16} {'per call (ms)':>14} {'shared (ms)':>12}")
+    for name, node in nodes:
+        fresh = node_ms(node, state, shared=False)
+        # Warm the configurations the node picks from so "shared" measures steady state
+        for _ in range(ROUNDS):
+            node(state, {"configurable": {}})
+        shared = node_ms(node, state, shared=True)
+        print(f"{name:>16} {fresh:>14.1f} {shared:>12.1f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Load test the chat app with concurrent simulated sessions.
+
+Each simulated browser session sends one question through app.process_message
+with its own chat history, as the gr.State of a session would hold it. The
+research graph is replaced by a stub that streams the usual node events with a
+fixed latency per step and answers by echoing the question, so sessions can be
+checked for isolation: every history must contain only its own question and
+answer. Gradio's queue is modelled by a semaphore of app.CONCURRENCY_LIMIT.
+
+Run from the research_chat directory:
+    python -m benchmarks.load_test --sessions 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+# Dummy credentials so the app can be imported offline; keep per-request logs quiet
+for i in range(1, 4):
+    os.environ.setdefault(f"GEMINI_API_KEY_{i}", f"benchmark-{i}")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from langchain_core.messages import AIMessage  # noqa: E402
+
+import app  # noqa: E402
+
+STEP_LATENCY = 0.2
+EFFORT = "medium"
+
+
+class StubGraph:
+    """Streams the node events of a research run without calling any model."""
+
+    async def astream(self, initial_state, config=None):
+        question = initial_state["messages"][-1].content
+        loops = initial_state["max_research_loops"]
+        await asyncio.sleep(STEP_LATENCY)
+        yield {"generate_query": {"query_list": [f"{question} query"]}}
+        for loop in range(1, loops + 1):
+            await asyncio.sleep(STEP_LATENCY)
+            yield {"web_research": {"sources_gathered": [], "web_research_result": ["x" * 5000]}}
+            await asyncio.sleep(STEP_LATENCY)
+            yield {"reflection": {"is_sufficient": loop == loops, "follow_up_queries": [f"{question} follow up"]}}
+        await asyncio.sleep(STEP_LATENCY)
+        yield {"finalize_answer": {"messages": [AIMessage(content=f"Answer to {question}")]}}
+
+
+async def session(idx: int, queue: asyncio.Semaphore) -> tuple[float, float, list]:
+    """Run one session; return its queue wait, total latency and final chat history."""
+    question = f"question {idx}"
+    chat_history = []
+    start = time.perf_counter()
+    async with queue:
+        waited = time.perf_counter() - start
+        async for _, _, chat_history in app.process_message(question, EFFORT, "gemini-2.0-flash", chat_history):
+            pass
+    return waited, time.perf_counter() - start, chat_history
+
+
+def p95(values: list) -> float:
+    return sorted(values)[int(len(values) * 0.95) - 1]
+
+
+async def main(sessions: int, concurrency_limit: int):
+    app.graph = StubGraph()
+    queue = asyncio.Semaphore(concurrency_limit)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(session(idx, queue) for idx in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    for idx, (_, _, chat_history) in enumerate(results):
+        user_messages = [m["content"] for m in chat_history if m["role"] == "user"]
+        assert user_messages == [f"question {idx}"], f"session {idx} saw {user_messages}"
+        assert chat_history[-2]["content"] == f"Answer to question {idx}", f"session {idx} got another answer"
+
+    waits = [waited for waited, _, _ in results]
+    latencies = [latency for _, latency, _ in results]
+    print(f"sessions: {sessions}, concurrency limit: {concurrency_limit}, effort: {EFFORT}, "
+          f"step latency: {STEP_LATENCY}s")
+    print(f"all {sessions} session histories isolated")
+    print(f"wall time: {elapsed:.2f}s, throughput: {sessions / elapsed * 60:.1f} sessions/min")
+    print(f"queue wait  p50: {statistics.median(waits):.2f}s  p95: {p95(waits):.2f}s")
+    print(f"latency     p50: {statistics.median(latencies):.2f}s  p95: {p95(latencies):.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20, help="concurrent simulated sessions")
+    parser.add_argument(
+        "--concurrency-limit", type=int, default=app.CONCURRENCY_LIMIT,
+        help="research runs processed at once (default: the app's CONCURRENCY_LIMIT)",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.sessions, args.concurrency_limit))
@@ -0,0 +1,93 @@
+"""Benchmark reflection and final answer prompt sizes with and without incremental reflection.
+
+Runs a "high" effort research (10 loops) offline: every loop adds a fixed number
+of web research results with citation markers, then calls the reflection node;
+the final answer node runs at the end. Stub models record the prompt size of
+every call in tokens; the stub reflection writes a knowledge summary of the size
+the incremental prompt allows.
+
+Run from the research_chat directory:
+    python -m benchmarks.reflection_prompts
+"""
+
+import os
+
+# Dummy credentials so the graph can be imported offline
+for i in range(1, 4):
+    os.environ.setdefault(f"GEMINI_API_KEY_{i}", f"benchmark-{i}")
+
+from langchain_core.messages import AIMessage, HumanMessage  # noqa: E402
+
+import graph  # noqa: E402
+from tools_and_schemas import Reflection  # noqa: E402
+from utils import CHARS_PER_TOKEN  # noqa: E402
+
+LOOPS = 10
+RESULTS_PER_LOOP = 3
+RESULT_TOKENS = 1500
+CITATIONS_PER_RESULT = 12
+
+
+class RecordingModel:
+    """Stand-in for the reflection and answer models that records prompt sizes."""
+
+    def __init__(self):
+        self.prompt_tokens = []
+
+    def invoke(self, prompt: str):
+        self.prompt_tokens.append(len(prompt) // CHARS_PER_TOKEN)
+        if "knowledge_summary" in prompt:
+            return Reflection(
+                is_sufficient=False, knowledge_gap="gap", follow_up_queries=["follow up"],
+                knowledge_summary=" ".join(["fact"] * graph.KNOWLEDGE_SUMMARY_WORDS),
+            )
+        if "follow_up_queries" in prompt:
+            return Reflection(is_sufficient=False, knowledge_gap="gap", follow_up_queries=["follow up"])
+        return AIMessage(content="answer")
+
+
+def research_result(loop: int, idx: int) -> str:
+    """A web research result with citation markers, as web_research returns."""
+    citations = max(1, CITATIONS_PER_RESULT - (loop + idx) % CITATIONS_PER_RESULT)
+    chunk = (RESULT_TOKENS * CHARS_PER_TOKEN) // citations
+    return "".join(
+        "x" * (chunk - 60) + f" [site](https://vertexaisearch.cloud.google.com/id/{loop}{idx}-{c})"
+        for c in range(citations)
+    )
+
+
+def run(incremental: bool) -> tuple[list[int], int]:
+    """Return reflection prompt tokens per loop and the final answer prompt tokens."""
+    model = RecordingModel()
+    graph.get_structured_llm = lambda *args: model
+    graph.get_llm = lambda *args: model
+    config = {"configurable": {"incremental_reflection": incremental}}
+    state = {
+        "messages": [HumanMessage(content="How do recent Gemini models compare?")],
+        "search_query": [],
+        "web_research_result": [],
+        "sources_gathered": [],
+        "research_loop_count": 0,
+        "reasoning_model": "gemini-2.0-flash",
+    }
+    for loop in range(LOOPS):
+        state["web_research_result"] += [research_result(loop, idx) for idx in range(RESULTS_PER_LOOP)]
+        state["search_query"] += ["query"] * RESULTS_PER_LOOP
+        state.update(graph.reflection(state, config))
+    graph.finalize_answer(state, config)
+    return model.prompt_tokens[:-1], model.prompt_tokens[-1]
+
+
+def main():
+    print(f"loops: {LOOPS}, results per loop: {RESULTS_PER_LOOP}, tokens per result: {RESULT_TOKENS}")
+    full, full_answer = run(incremental=False)
+    incremental, incremental_answer = run(incremental=True)
+    print(f"{'loop':>6} {'full (tokens)':>14} {'incremental (tokens)':>21}")
+    for loop, (before, after) in enumerate(zip(full, incremental), start=1):
+        print(f"{loop:>6} {before:>14} {after:>21}")
+    print(f"{'total':>6} {sum(full):>14} {sum(incremental):>21}")
+    print(f"{'answer':>6} {full_answer:>14} {incremental_answer:>21}")
+
+
+if __name__ == "__main__":
+    main()
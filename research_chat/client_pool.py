@@ -0,0 +1,227 @@
+import asyncio
+import bisect
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Substrings of errors that mean "try another key or wait", not "the request is bad"
+RATE_LIMIT_MARKERS = ("429", "503", "quota", "rate", "unavailable", "overload")
+
+# 429 responses carry a google.rpc.RetryInfo detail such as {'retryDelay': '17s'}
+RETRY_DELAY = re.compile(r"retryDelay['\"]?\s*:\s*['\"]?(\d+(?:\.\d+)?)s")
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """
+    Whether an API error is a rate limit or overload that another key or a later retry may avoid.
+    """
+    err_str = str(error).lower()
+    return any(marker in err_str for marker in RATE_LIMIT_MARKERS)
+
+
+def get_retry_delay(error: Exception) -> Optional[float]:
+    """
+    Get the retry delay in seconds the server asked for in a 429 response, if any.
+    """
+    match = RETRY_DELAY.search(str(error))
+    return float(match.group(1)) if match else None
+
+
+class SlidingWindow:
+    """
+    Log of the requests counted against a quota of `limit` requests per `period` seconds.
+
+    Mirrors the server's sliding-window quota: a request may be sent only while
+    fewer than `limit` requests fall within the last `period` seconds. Requests are
+    logged when sent and moved to their completion time once answered, since the
+    server counts them somewhere in between.
+    """
+
+    def __init__(self, limit: int, period: float):
+        self.limit = limit
+        self.period = period
+        self.sent: List[float] = []  # sorted timestamps
+
+    def _expire(self, now: float) -> None:
+        del self.sent[:bisect.bisect_right(self.sent, now - self.period)]
+
+    def available(self, now: float) -> int:
+        """Requests that may be sent right now."""
+        self._expire(now)
+        return self.limit - len(self.sent)
+
+    def take(self, now: float) -> float:
+        """Log a request sent now and return its log entry."""
+        bisect.insort(self.sent, now)
+        return now
+
+    def settle(self, entry: float, finished: float) -> None:
+        """Move a request's entry to the time its response arrived."""
+        self.sent.remove(entry)
+        bisect.insort(self.sent, finished)
+
+    def cancel(self, entry: float) -> None:
+        """Forget a request the server rejected, so it does not count against the quota."""
+        self.sent.remove(entry)
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a request may be sent."""
+        self._expire(now)
+        if len(self.sent) < self.limit:
+            return 0.0
+        return self.sent[len(self.sent) - self.limit] + self.period - now
+
+
+class _Slot:
+    """Quota state of one (key, model) pair."""
+
+    def __init__(self, window: SlidingWindow):
+        self.window = window
+        self.cooldown_until = 0.0
+        self.failures = 0
+
+    def wait_time(self, now: float) -> float:
+        return max(self.cooldown_until - now, self.window.wait_time(now))
+
+
+class GeminiClientPool:
+    """
+    Async pool of Gemini clients, one per API key, with rate-limit-aware scheduling.
+
+    Every (key, model) pair has its own sliding-window log of the requests counted
+    against its per-minute quota, matching how the server enforces it, and a cooldown set from the retry delay of 429 responses. Each call goes to the
+    key with the fewest calls in flight among the pairs that have quota left, and
+    when none has, the call waits with asyncio.sleep until the earliest one does,
+    so a rate-limited branch never blocks the others.
+
+    Args:
+        clients: google.genai clients, one per API key
+        models: Models the calls may be routed to
+        requests_per_minute: Quota of each (key, model) pair
+        max_retries: Attempts per call before the last rate-limit error is raised
+        default_cooldown: Cooldown in seconds after a rate-limit error without a
+            retry delay, doubled for each consecutive failure of the same pair
+        period: Length of the quota window in seconds
+    """
+
+    def __init__(
+        self,
+        clients: Sequence[Any],
+        models: Sequence[str],
+        requests_per_minute: float = 10,
+        max_retries: int = 10,
+        default_cooldown: float = 15.0,
+        period: float = 60.0,
+    ):
+        self.clients = list(clients)
+        self.models = list(models)
+        self.max_retries = max_retries
+        self.default_cooldown = default_cooldown
+        self._slots: Dict[Tuple[int, str], _Slot] = {
+            (index, model): _Slot(SlidingWindow(int(requests_per_minute), period))
+            for index in range(len(self.clients))
+            for model in self.models
+        }
+        self._in_flight: List[int] = [0] * len(self.clients)
+        self._waiting: List[object] = []
+        # Sync graph runs drive the pool from several worker threads, each on its own loop
+        self._lock = threading.Lock()
+
+    async def _acquire(self, models: Sequence[str]) -> Tuple[int, str, float]:
+        """Wait for a (key, model) pair with quota left and log one request on it.
+
+        Returns the pair and the request's entry in the pair's window.
+
+        Waiting calls are served in arrival order, so a call is never overtaken
+        indefinitely by newer ones while quota is scarce.
+        """
+        ticket = object()
+        with self._lock:
+            self._waiting.append(ticket)
+        try:
+            return await self._acquire_in_turn(models, ticket)
+        finally:
+            with self._lock:
+                self._waiting.remove(ticket)
+
+    async def _acquire_in_turn(self, models: Sequence[str], ticket: object) -> Tuple[int, str, float]:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                ready = [
+                    (index, model)
+                    for (index, model), slot in self._slots.items()
+                    if model in models and slot.cooldown_until <= now and slot.window.available(now) >= 1
+                ]
+                # Older waiters get the first ready pairs
+                if len(ready) > self._waiting.index(ticket):
+                    # Least-loaded key first, then the pair with the most quota left
+                    index, model = min(
+                        ready,
+                        key=lambda pair: (
+                            self._in_flight[pair[0]],
+                            -self._slots[pair].window.available(now),
+                            random.random(),
+                        ),
+                    )
+                    entry = self._slots[(index, model)].window.take(now)
+                    self._in_flight[index] += 1
+                    return index, model, entry
+                wait = min(
+                    slot.wait_time(now) for (_, model), slot in self._slots.items() if model in models
+                )
+            await asyncio.sleep(max(wait, 0.01))
+
+    async def call(
+        self,
+        api_call_fn: Callable[[Any, str], Awaitable[Any]],
+        models: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """
+        Run an API call on the best available client, retrying rate-limited attempts on other keys.
+
+        Args:
+            api_call_fn: Coroutine function taking a client and a model name
+            models: Models the call may use; defaults to all models of the pool
+
+        Returns:
+            The result of the first successful attempt
+        """
+        models = list(models) if models else self.models
+        last_exception = None
+        for attempt in range(self.max_retries):
+            index, model, entry = await self._acquire(models)
+            slot = self._slots[(index, model)]
+            try:
+                result = await api_call_fn(self.clients[index], model)
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    raise  # Other errors, re-raise
+                with self._lock:
+                    now = time.monotonic()
+                    delay = get_retry_delay(e)
+                    if delay is None:
+                        delay = self.default_cooldown * 2 ** slot.failures
+                    slot.failures += 1
+                    slot.cooldown_until = now + delay
+                    slot.window.cancel(entry)
+                last_exception = e
+                logger.warning(
+                    "Gemini key %d rate-limited on %s, cooling down for %.1f seconds", index + 1, model, delay
+                )
+            else:
+                with self._lock:
+                    slot.failures = 0
+                    slot.window.settle(entry, time.monotonic())
+                return result
+            finally:
+                with self._lock:
+                    self._in_flight[index] -= 1
+        if last_exception:
+            raise last_exception
+        raise RuntimeError("No valid Gemini API clients available.")
@@ -39,6 +39,20 @@ class Configuration(BaseModel):
         metadata={"description": "The maximum number of research loops to perform."},
     )
 
+    incremental_reflection: bool = Field(
+        default=True,
+        metadata={
+            "description": "Whether each reflection sees a running knowledge summary and only the new web research results, instead of all of them."
+        },
+    )
+
+    final_answer_token_budget: int = Field(
+        default=12000,
+        metadata={
+            "description": "Approximate token budget for the web research results given to the final answer in incremental mode."
+        },
+    )
+
     @classmethod
     def from_runnable_config(
         cls, config: Optional[RunnableConfig] = None
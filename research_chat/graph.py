@@ -1,13 +1,13 @@
+import asyncio
 import os
 import random
-import time
 from tools_and_schemas import SearchQueryList, Reflection
 from dotenv import load_dotenv
 from langchain_core.messages import AIMessage
 from langgraph.types import Send
 from langgraph.graph import StateGraph
 from langgraph.graph import START, END
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from google.genai import Client
 
 from state import (
@@ -16,20 +16,24 @@ from state import (
     ReflectionState,
     WebSearchState,
 )
+from client_pool import GeminiClientPool
 from configuration import Configuration
+from llm_registry import get_llm, get_structured_llm
 from prompts import (
     get_current_date,
     query_writer_instructions,
     web_searcher_instructions,
     reflection_instructions,
+    incremental_reflection_instructions,
     answer_instructions,
 )
-from langchain_google_genai import ChatGoogleGenerativeAI
 from utils import (
+    expand_short_urls,
     get_citations,
     get_research_topic,
     insert_citation_markers,
     resolve_urls,
+    select_research_results,
 )
 
 load_dotenv()
@@ -57,41 +61,17 @@ GEMINI_MODELS = [
     "gemini-2.5-flash-preview-05-20"
 ]
 
-def try_all_clients(api_call_fn, max_retries=5, wait_seconds=15):
-    """
-    Try the API call with all clients asynchronously, return on first success, else retry after wait.
-    api_call_fn: function that takes a client and returns the API result.
-    max_retries: how many times to retry the whole pool before giving up.
-    wait_seconds: how long to wait before retrying all clients.
-    """
-    for attempt in range(max_retries):
-        last_exception = None
-        clients = GEMINI_CLIENTS.copy()
-        random.shuffle(clients)
-        for client in clients:
-            try:
-                return api_call_fn(client)
-            except Exception as e:
-                err_str = str(e).lower()
-                if (
-                    "429" in err_str or
-                    "503" in err_str or
-                    "quota" in err_str or
-                    "rate" in err_str or
-                    "unavailable" in err_str or
-                    "overload" in err_str
-                ):
-                    last_exception = e
-                    continue
-                else:
-                    raise  # Other errors, re-raise
-        if attempt < max_retries - 1:
-            print(f"All Gemini clients exhausted or rate-limited. Waiting {wait_seconds} seconds before retrying...")
-            time.sleep(wait_seconds)
-            wait_seconds *= 2
-    if last_exception:
-        raise last_exception
-    raise RuntimeError("No valid Gemini API clients available.")
+# Per-minute request quota of each (key, model) pair
+GEMINI_REQUESTS_PER_MINUTE = 10
+
+GEMINI_CLIENT_POOL = GeminiClientPool(
+    GEMINI_CLIENTS,
+    GEMINI_MODELS,
+    requests_per_minute=GEMINI_REQUESTS_PER_MINUTE,
+)
+
+# Word limit of the running knowledge summary kept by incremental reflection
+KNOWLEDGE_SUMMARY_WORDS = 500
 
 # Nodes
 def generate_query(state: OverallState, config: RunnableConfig) -> QueryGenerationState:
@@ -100,13 +80,12 @@ def generate_query(state: OverallState, config: RunnableConfig) -> QueryGenerati
         state["initial_search_query_count"] = configurable.number_of_initial_queries
         
     random_model = random.choice(GEMINI_MODELS)
-    llm = ChatGoogleGenerativeAI(
-        model=random_model, # configurable.query_generator_model,
-        temperature=1.0,
-        max_retries=2,
-        api_key=random.choice(GEMINI_API_KEYS),
+    structured_llm = get_structured_llm(
+        random_model, # configurable.query_generator_model,
+        random.choice(GEMINI_API_KEYS),
+        1.0,
+        SearchQueryList,
     )
-    structured_llm = llm.with_structured_output(SearchQueryList)
 
     current_date = get_current_date()
     formatted_prompt = query_writer_instructions.format(
@@ -123,25 +102,21 @@ def continue_to_web_research(state: QueryGenerationState):
         for idx, search_query in enumerate(state["query_list"])
     ]
 
-def web_research(state: WebSearchState, config: RunnableConfig) -> OverallState:
-    configurable = Configuration.from_runnable_config(config)
-    formatted_prompt = web_searcher_instructions.format(
-        current_date=get_current_date(),
-        research_topic=state["search_query"],
-    )
-
-    def api_call(client):
-        random_model = random.choice(GEMINI_MODELS)
-        return client.models.generate_content(
-            model=random_model,
-            contents=formatted_prompt,
-            config={
-                "tools": [{"google_search": {}}],
-                "temperature": 0,
-            },
-        )
-    response = try_all_clients(api_call)
+def _web_search_request(state: WebSearchState) -> dict:
+    """Arguments of the grounded Google Search call for one query."""
+    return {
+        "contents": web_searcher_instructions.format(
+            current_date=get_current_date(),
+            research_topic=state["search_query"],
+        ),
+        "config": {
+            "tools": [{"google_search": {}}],
+            "temperature": 0,
+        },
+    }
 
+def _web_research_update(state: WebSearchState, response) -> OverallState:
+    """Turn a grounded search response into the web_research state update."""
     resolved_urls = resolve_urls(
         response.candidates[0].grounding_metadata.grounding_chunks, state["id"]
     )
@@ -154,7 +129,29 @@ def web_research(state: WebSearchState, config: RunnableConfig) -> OverallState:
         "search_query": [state["search_query"]],
         "web_research_result": [modified_text],
     }
-    
+
+async def aweb_research(state: WebSearchState, config: RunnableConfig) -> OverallState:
+    request = _web_search_request(state)
+
+    async def api_call(client, model):
+        return await client.aio.models.generate_content(model=model, **request)
+    response = await GEMINI_CLIENT_POOL.call(api_call)
+    return _web_research_update(state, response)
+
+def web_research(state: WebSearchState, config: RunnableConfig) -> OverallState:
+    """Synchronous web_research for graph.invoke / graph.stream.
+
+    LangGraph runs sync nodes in worker threads; each runs the pool on its own
+    event loop and calls the blocking client API off that loop, so no async
+    client is shared across loops.
+    """
+    request = _web_search_request(state)
+
+    async def api_call(client, model):
+        return await asyncio.to_thread(client.models.generate_content, model=model, **request)
+    response = asyncio.run(GEMINI_CLIENT_POOL.call(api_call))
+    return _web_research_update(state, response)
+
 def evaluate_research(
     state: ReflectionState,
     config: RunnableConfig,
@@ -197,19 +194,30 @@ def reflection(state: OverallState, config: RunnableConfig) -> ReflectionState:
     # reasoning_model = state.get("reasoning_model") or configurable.reasoning_model
 
     current_date = get_current_date()
-    formatted_prompt = reflection_instructions.format(
-        current_date=current_date,
-        research_topic=get_research_topic(state["messages"]),
-        summaries="\n\n---\n\n".join(state["web_research_result"]),
-    )
+    if configurable.incremental_reflection:
+        # Earlier results are already condensed into the knowledge summary
+        new_results = state["web_research_result"][state.get("reflected_result_count", 0):]
+        formatted_prompt = incremental_reflection_instructions.format(
+            current_date=current_date,
+            research_topic=get_research_topic(state["messages"]),
+            knowledge_summary=state.get("knowledge_summary") or "(nothing yet)",
+            summaries="\n\n---\n\n".join(new_results),
+            max_summary_words=KNOWLEDGE_SUMMARY_WORDS,
+        )
+    else:
+        formatted_prompt = reflection_instructions.format(
+            current_date=current_date,
+            research_topic=get_research_topic(state["messages"]),
+            summaries="\n\n---\n\n".join(state["web_research_result"]),
+        )
     random_model = random.choice(GEMINI_MODELS)
-    llm = ChatGoogleGenerativeAI(
-        model=random_model, # reasoning_model,
-        temperature=1.0,
-        max_retries=2,
-        api_key=random.choice(GEMINI_API_KEYS),
+    structured_llm = get_structured_llm(
+        random_model, # reasoning_model,
+        random.choice(GEMINI_API_KEYS),
+        1.0,
+        Reflection,
     )
-    result = llm.with_structured_output(Reflection).invoke(formatted_prompt)
+    result = structured_llm.invoke(formatted_prompt)
 
     return {
         "is_sufficient": result.is_sufficient,
@@ -217,6 +225,13 @@ def reflection(state: OverallState, config: RunnableConfig) -> ReflectionState:
         "follow_up_queries": result.follow_up_queries,
         "research_loop_count": state["research_loop_count"],
         "number_of_ran_queries": len(state["search_query"]),
+        # Results only count as reflected once they are folded into a new summary
+        "knowledge_summary": result.knowledge_summary or state.get("knowledge_summary", ""),
+        "reflected_result_count": (
+            len(state["web_research_result"])
+            if result.knowledge_summary
+            else state.get("reflected_result_count", 0)
+        ),
     }
 
 def finalize_answer(state: OverallState, config: RunnableConfig):
@@ -224,28 +239,31 @@ def finalize_answer(state: OverallState, config: RunnableConfig):
     reasoning_model = state.get("reasoning_model") or configurable.reasoning_model
 
     current_date = get_current_date()
+    if configurable.incremental_reflection:
+        summaries = select_research_results(
+            state["web_research_result"], configurable.final_answer_token_budget
+        )
+        if state.get("knowledge_summary"):
+            summaries = [state["knowledge_summary"]] + summaries
+    else:
+        summaries = state["web_research_result"]
     formatted_prompt = answer_instructions.format(
         current_date=current_date,
         research_topic=get_research_topic(state["messages"]),
-        summaries="\n---\n\n".join(state["web_research_result"]),
+        summaries="\n---\n\n".join(summaries),
     )
 
     random_model = random.choice(GEMINI_MODELS)
-    llm = ChatGoogleGenerativeAI(
-        model= random_model, # reasoning_model
-        temperature=0,
-        max_retries=2,
-        api_key=random.choice(GEMINI_API_KEYS),
+    llm = get_llm(
+        random_model, # reasoning_model
+        random.choice(GEMINI_API_KEYS),
+        0,
     )
     result = llm.invoke(formatted_prompt)
 
-    unique_sources = []
-    for source in state["sources_gathered"]:
-        if source["short_url"] in result.content:
-            result.content = result.content.replace(
-                source["short_url"], source["value"]
-            )
-            unique_sources.append(source)
+    result.content, unique_sources = expand_short_urls(
+        result.content, state["sources_gathered"]
+    )
 
     return {
         "messages": [AIMessage(content=result.content)],
@@ -256,7 +274,8 @@ def finalize_answer(state: OverallState, config: RunnableConfig):
 builder = StateGraph(OverallState, config_schema=Configuration)
 
 builder.add_node("generate_query", generate_query)
-builder.add_node("web_research", web_research)
+# Async runs (ainvoke/astream, as the app uses) await the pool on their own loop
+builder.add_node("web_research", RunnableLambda(web_research, afunc=aweb_research, name="web_research"))
 builder.add_node("reflection", reflection)
 builder.add_node("finalize_answer", finalize_answer)
 
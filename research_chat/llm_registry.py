@@ -0,0 +1,31 @@
+from functools import lru_cache
+from typing import Type
+
+from langchain_google_genai import ChatGoogleGenerativeAI
+from pydantic import BaseModel
+
+
+@lru_cache(maxsize=None)
+def get_llm(model: str, api_key: str, temperature: float, max_retries: int = 2) -> ChatGoogleGenerativeAI:
+    """
+    Get the shared chat model for a (model, key, temperature) configuration, building it on first use.
+
+    Building a ChatGoogleGenerativeAI sets up a new Gemini client and its connection
+    pool, so nodes reuse one instance per configuration across steps and graph runs.
+    """
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        max_retries=max_retries,
+        api_key=api_key,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_structured_llm(
+    model: str, api_key: str, temperature: float, schema: Type[BaseModel]
+):
+    """
+    Get the shared structured-output binding of get_llm(model, api_key, temperature) for a schema.
+    """
+    return get_llm(model, api_key, temperature).with_structured_output(schema)
@@ -79,6 +79,44 @@ Summaries:
 {summaries}
 """
 
+incremental_reflection_instructions = """You are an expert research assistant analyzing summaries about "{research_topic}".
+
+Instructions:
+- Identify knowledge gaps or areas that need deeper exploration and generate a follow-up query. (1 or multiple).
+- If the knowledge so far together with the new summaries is sufficient to answer the user's question, don't generate a follow-up query.
+- If there is a knowledge gap, generate a follow-up query that would help expand your understanding.
+- Focus on technical details, implementation specifics, or emerging trends that weren't fully covered.
+- Update the knowledge so far with the new summaries into one condensed summary of everything learned, in at most {max_summary_words} words, keeping the markdown citation links of key facts exactly as they appear.
+
+Requirements:
+- Ensure the follow-up query is self-contained and includes necessary context for web search.
+
+Output Format:
+- Format your response as a JSON object with these exact keys:
+   - "is_sufficient": true or false
+   - "knowledge_gap": Describe what information is missing or needs clarification
+   - "follow_up_queries": Write a specific question to address this gap
+   - "knowledge_summary": The updated condensed summary
+
+Example:
+```json
+{{
+    "is_sufficient": true, // or false
+    "knowledge_gap": "The summary lacks information about performance metrics and benchmarks", // "" if is_sufficient is true
+    "follow_up_queries": ["What are typical performance benchmarks and metrics used to evaluate [specific technology]?"], // [] if is_sufficient is true
+    "knowledge_summary": "[Specific technology] was released in 2024 [example](https://vertexaisearch.cloud.google.com/id/0-0) and ..."
+}}
+```
+
+Reflect carefully on the knowledge so far and the new Summaries to identify knowledge gaps and produce a follow-up query. Then, produce your output following this JSON format:
+
+Knowledge so far:
+{knowledge_summary}
+
+New Summaries:
+{summaries}
+"""
+
 answer_instructions = """Generate a high-quality answer to the user's question based on the provided summaries.
 
 Instructions:
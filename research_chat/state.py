@@ -21,6 +21,8 @@ class OverallState(TypedDict):
     max_research_loops: int
     research_loop_count: int
     reasoning_model: str
+    knowledge_summary: str
+    reflected_result_count: int
 
 
 class ReflectionState(TypedDict):
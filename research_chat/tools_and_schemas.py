@@ -21,3 +21,7 @@ class Reflection(BaseModel):
     follow_up_queries: List[str] = Field(
         description="A list of follow-up queries to address the knowledge gap."
     )
+    knowledge_summary: str = Field(
+        default="",
+        description="A condensed summary of everything learned so far, keeping the citation links of key facts.",
+    )
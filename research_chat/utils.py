@@ -1,7 +1,16 @@
+import os
+import re
 from typing import Any, Dict, List
 from langchain_core.messages import AnyMessage, AIMessage, HumanMessage
 
 
+# Rough characters per token, for budgeting prompt text without a tokenizer
+CHARS_PER_TOKEN = 4
+
+# Markdown citation links inserted by insert_citation_markers
+CITATION_LINK = re.compile(r"\]\((https?://[^)\s]+)\)")
+
+
 def get_research_topic(messages: List[AnyMessage]) -> str:
     """
     Get the research topic from the messages.
@@ -50,29 +59,68 @@ def insert_citation_markers(text, citations_list):
     Returns:
         str: The text with citation markers inserted.
     """
-    # Sort citations by end_index in descending order.
-    # If end_index is the same, secondary sort by start_index descending.
-    # This ensures that insertions at the end of the string don't affect
-    # the indices of earlier parts of the string that still need to be processed.
+    # Sort citations by end_index, then start_index. Citations with the same
+    # indices keep the order the previous back-to-front insertion gave them,
+    # i.e. the last one in citations_list comes first.
     sorted_citations = sorted(
-        citations_list, key=lambda c: (c["end_index"], c["start_index"]), reverse=True
+        reversed(citations_list), key=lambda c: (c["end_index"], c["start_index"])
     )
 
-    modified_text = text
+    # Build the result from pieces in one pass instead of re-slicing the whole
+    # text for every citation. Indices refer to positions in the original text;
+    # out-of-range indices are clamped to it.
+    pieces = []
+    prev_idx = 0
     for citation_info in sorted_citations:
-        # These indices refer to positions in the *original* text,
-        # but since we iterate from the end, they remain valid for insertion
-        # relative to the parts of the string already processed.
-        end_idx = citation_info["end_index"]
-        marker_to_insert = ""
+        end_idx = min(max(citation_info["end_index"], prev_idx), len(text))
+        pieces.append(text[prev_idx:end_idx])
         for segment in citation_info["segments"]:
-            marker_to_insert += f" [{segment['label']}]({segment['short_url']})"
-        # Insert the citation marker at the original end_idx position
-        modified_text = (
-            modified_text[:end_idx] + marker_to_insert + modified_text[end_idx:]
-        )
+            pieces.append(f" [{segment['label']}]({segment['short_url']})")
+        prev_idx = end_idx
+    pieces.append(text[prev_idx:])
+
+    return "".join(pieces)
+
 
-    return modified_text
+def expand_short_urls(text: str, sources: List[Dict[str, Any]]):
+    """
+    Replace the short urls of cited sources in a text with their original urls, in one pass.
+
+    Args:
+        text (str): Text with short urls, e.g. the final answer.
+        sources (list): Sources with 'short_url' and 'value' (the original url)
+                        keys, as gathered by web research. May contain duplicates.
+
+    Returns:
+        tuple: The text with short urls expanded, and the sources whose short url
+               appears in the text, first occurrence of each, in their original order.
+    """
+    expansions = {}
+    for source in sources:
+        if source["short_url"]:
+            expansions.setdefault(source["short_url"], source["value"])
+    if not expansions:
+        return text, []
+
+    # Short urls share a long prefix; match it once, then the longest suffix, so
+    # ".../id/1-10" is never read as ".../id/1-1" followed by "0"
+    prefix = os.path.commonprefix(list(expansions))
+    suffixes = sorted((url[len(prefix):] for url in expansions), key=len, reverse=True)
+    pattern = re.compile(re.escape(prefix) + "(?:" + "|".join(map(re.escape, suffixes)) + ")")
+
+    found = set()
+
+    def expand(match):
+        found.add(match.group(0))
+        return expansions[match.group(0)]
+
+    expanded = pattern.sub(expand, text)
+    used_sources = []
+    for source in sources:
+        if source["short_url"] in found:
+            found.discard(source["short_url"])
+            used_sources.append(source)
+    return expanded, used_sources
 
 
 def get_citations(response, resolved_urls_map):
@@ -164,3 +212,32 @@ def get_citations(response, resolved_urls_map):
                     pass
         citations.append(citation)
     return citations
+
+
+def select_research_results(results: List[str], token_budget: int) -> List[str]:
+    """
+    Select a bounded subset of web research results for the final answer.
+
+    Results are ranked by the number of distinct sources they cite, earlier results
+    first on ties, and taken in that order while they fit in the token budget. The
+    best-ranked result is always kept. The selection is returned in its original order.
+
+    Args:
+        results: Web research results, with citation markers inserted
+        token_budget: Approximate token budget for the selected results
+
+    Returns:
+        list: The selected results, in the order they were gathered.
+    """
+    ranked = sorted(
+        range(len(results)),
+        key=lambda idx: (-len(set(CITATION_LINK.findall(results[idx]))), idx),
+    )
+    budget = token_budget * CHARS_PER_TOKEN
+    selected = []
+    for idx in ranked:
+        if selected and len(results[idx]) > budget:
+            continue
+        selected.append(idx)
+        budget -= len(results[idx])
+    return [results[idx] for idx in sorted(selected)]